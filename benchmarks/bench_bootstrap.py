@@ -0,0 +1,167 @@
+"""
+Benchmark and checks: value_score.bootstrap_value_scores on the synthetic
+analysis-ready table (with draft_round joined from the players table).
+
+Checks, per position group:
+- the identity resample (every row drawn once) reproduces
+  compute_value_scores to float rounding;
+- random resamples match a plain pandas rescoring: the resampled rows'
+  Series.mean()/std() per stat, then the original rows z-scored against
+  them as compute_composite_score/compute_salary_zscore would;
+- results for a seed are identical across worker counts, and equal to
+  float rounding across chunk sizes.
+
+Then times the bootstrap at each scale, with peak traced memory.
+
+Usage (from repo root):
+    python benchmarks/bench_bootstrap.py --scales 1,4 --n-boot 1000 --workers 1,2
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src import value_score  # noqa: E402
+
+from bench_merge_all import build_inputs  # noqa: E402
+from bench_value_scores import analysis_table  # noqa: E402
+
+
+def bootstrap_table(scale: float, seed: int, perturb: bool = False) -> pd.DataFrame:
+    analysis = analysis_table(scale, seed, perturb)
+    players = build_inputs(scale, seed)["players"][["gsis_id", "draft_round"]]
+    players = players.drop_duplicates("gsis_id").rename(columns={"gsis_id": "player_id"})
+    return analysis.merge(players, on="player_id", how="left")
+
+
+def pandas_rescore(group: pd.DataFrame, pos_group: str, rows: np.ndarray) -> np.ndarray:
+    """Value scores of `group` against the stats of group.iloc[rows], one Series at a time."""
+    prepared = value_score._prepare_inverted_stats(group)
+    sample = prepared.iloc[rows]
+
+    def zscore(col):
+        drawn = sample[col].astype(float)
+        if drawn.count() < 3 or drawn.std() == 0:
+            return pd.Series(0.0, index=group.index)
+        return (prepared[col].astype(float) - drawn.mean()) / drawn.std()
+
+    composite, total = pd.Series(0.0, index=group.index), 0.0
+    for stat, weight in value_score.POSITION_WEIGHTS[pos_group].items():
+        if stat in prepared.columns:
+            composite += zscore(stat) * weight
+            total += weight
+    if total > 0:
+        composite /= total
+    return (composite - zscore("apy_cap_pct")).to_numpy()
+
+
+def check_replicates(df: pd.DataFrame, n_random: int, seed: int) -> float:
+    """Identity and random-resample parity per group; returns the largest abs difference."""
+    scores = value_score._grouped_scores(df)
+    value = value_score.compute_value_scores(df)["value_score"].to_numpy()
+    groups = value_score._bootstrap_groups(df, scores, value, [])
+    rng = np.random.default_rng(seed)
+    worst = 0.0
+    for g, group in enumerate(groups):
+        start, size = scores["starts"][g], len(group["features"])
+        scored = group["scored"]
+        got = value_score._replicate_values(group, np.ones((1, size)))[0]
+        np.testing.assert_allclose(got, value[start + scored], rtol=1e-9, atol=1e-9)
+        worst = max(worst, float(np.abs(got - value[start + scored]).max()))
+
+        frame = df.iloc[scores["order"][start:start + size]]
+        for _ in range(n_random):
+            rows = rng.integers(0, size, size)
+            got = value_score._replicate_values(group, np.bincount(rows, minlength=size)[None])[0]
+            expected = pandas_rescore(frame, group["pos_group"], rows)[scored]
+            np.testing.assert_allclose(got, expected, rtol=1e-9, atol=1e-9)
+            worst = max(worst, float(np.abs(got - expected).max()))
+    return worst
+
+
+def check_reproducible(df: pd.DataFrame, n_boot: int, workers: list) -> None:
+    """Same seed: bit-identical across worker counts, equal to float rounding across chunk sizes.
+
+    (The matrix products' summation order can depend on how many
+    replicates share a chunk.)
+    """
+    base = value_score.bootstrap_value_scores(df, n_boot=n_boot, seed=7, chunk_size=n_boot)
+    for chunk_size in [max(1, n_boot // 7), n_boot]:
+        first = None
+        for max_workers in workers:
+            run = value_score.bootstrap_value_scores(
+                df, n_boot=n_boot, seed=7, chunk_size=chunk_size, max_workers=max_workers)
+            for got, expected in zip(run, base):
+                pd.testing.assert_frame_equal(got, expected, check_exact=False, rtol=1e-9)
+            if first is not None:
+                for got, expected in zip(run, first):
+                    pd.testing.assert_frame_equal(got, expected, check_exact=True)
+            first = run
+
+
+def run_scale(scale: float, seed: int, n_boot: int, chunk_size: int, workers: list,
+              perturb: bool) -> list:
+    df = bootstrap_table(scale, seed, perturb)
+    worst = check_replicates(df, n_random=3, seed=seed)
+    check_reproducible(df, n_boot=min(n_boot, 50), workers=workers)
+
+    start = time.perf_counter()
+    value_score.compute_value_scores(df)
+    point_s = time.perf_counter() - start
+
+    rows = []
+    for max_workers in workers:
+        start = time.perf_counter()
+        players, aggregates = value_score.bootstrap_value_scores(
+            df, n_boot=n_boot, seed=seed, chunk_size=chunk_size, max_workers=max_workers)
+        seconds = time.perf_counter() - start
+
+        tracemalloc.start()
+        value_score.bootstrap_value_scores(df, n_boot=n_boot, seed=seed, chunk_size=chunk_size,
+                                           max_workers=max_workers)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        width = (players["value_score_hi"] - players["value_score_lo"]).median()
+        rows.append({
+            "scale": scale, "scored": len(players), "aggregates": len(aggregates),
+            "n_boot": n_boot, "workers": max_workers, "seconds": round(seconds, 3),
+            "ms_per_replicate": round(seconds / n_boot * 1000, 2),
+            "point_estimate_s": round(point_s, 4), "peak_mb": round(peak / 2**20, 1),
+            "median_ci_width": round(float(width), 3), "max_abs_diff": worst,
+            "checks": "ok",
+        })
+        print(rows[-1])
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bootstrap value-score CIs: checks + timing.")
+    parser.add_argument("--scales", default="1")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--n-boot", type=int, default=1000)
+    parser.add_argument("--chunk-size", type=int, default=100)
+    parser.add_argument("--workers", default="1,2", help="comma-separated max_workers to time")
+    parser.add_argument("--unscored-stats", action="store_true",
+                        help="drop a weighted stat and blank some values first")
+    args = parser.parse_args()
+
+    workers = [int(w) for w in args.workers.split(",")]
+    rows = []
+    for scale in [float(s) for s in args.scales.split(",")]:
+        rows += run_scale(scale, args.seed, args.n_boot, args.chunk_size, workers,
+                          args.unscored_stats)
+
+    print()
+    print(pd.DataFrame(rows).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Benchmark cache backends: fastparquet decode vs memory-mapped Arrow IPC.
+
+Starts several reader processes at once for each backend and reports load
+time, peak RSS and how much of each reader's memory is private vs shared
+(page-cache pages backed by the mapped .arrow file count as shared).
+
+Usage (from repo root):
+    python benchmarks/bench_cache_backends.py --dataset scored --readers 4
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src import data_loader  # noqa: E402
+
+
+def _memory_kb() -> dict:
+    """Current RSS split into private/shared pages (Linux), plus peak RSS."""
+    mem = {"peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss}
+    try:
+        with open("/proc/self/smaps_rollup") as f:
+            for line in f:
+                key, value = line.split(":", 1)
+                if key in ("Rss", "Private_Clean", "Private_Dirty", "Shared_Clean", "Shared_Dirty"):
+                    mem[key.lower() + "_kb"] = int(value.split()[0])
+    except OSError:
+        pass
+    return mem
+
+
+def _load(name: str):
+    if name in data_loader.FETCHERS:
+        return data_loader._load_or_fetch(name, data_loader.FETCHERS[name])
+    return data_loader.load_cached(name)
+
+
+def run_reader(name: str, backend: str, compression: str) -> None:
+    """Child process: load one dataset, wait until every reader has loaded,
+    then report memory so pages mapped by several readers show up as shared."""
+    if backend == "arrow":
+        data_loader.set_cache_backend(name, "arrow", compression)
+    start = time.perf_counter()
+    df = _load(name)
+    seconds = time.perf_counter() - start
+    print("LOADED", flush=True)
+    sys.stdin.readline()
+    result = {"seconds": seconds, "rows": len(df), **_memory_kb()}
+    print("RESULT " + json.dumps(result), flush=True)
+
+
+def run_backend(name: str, backend: str, readers: int, compression: str) -> list:
+    """Run `readers` concurrent child processes and collect their results."""
+    cmd = [sys.executable, __file__, "--dataset", name,
+           "--compression", compression, "--child", backend]
+    procs = [
+        subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+        for _ in range(readers)
+    ]
+    for proc in procs:
+        for line in proc.stdout:
+            if line.startswith("LOADED"):
+                break
+    results = []
+    for proc in procs:
+        out, _ = proc.communicate("go\n")
+        for line in out.splitlines():
+            if line.startswith("RESULT "):
+                results.append(json.loads(line[len("RESULT "):]))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--dataset", default="scored")
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--compression", default="uncompressed", choices=["uncompressed", "lz4"],
+                        help="used when the .arrow copy is (re)built")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_reader(args.dataset, args.child, args.compression)
+        return
+
+    # One throwaway arrow reader builds the .arrow copies so the timed readers
+    # only measure loading (done in a child to keep this process small)
+    run_backend(args.dataset, "arrow", 1, args.compression)
+
+    print(f"\n{args.dataset}: {args.readers} concurrent readers per backend")
+    print(f"{'backend':10s} {'load_s':>8s} {'peak_rss_mb':>12s} {'private_mb':>11s} {'shared_mb':>10s}")
+    for backend in ["parquet", "arrow"]:
+        results = run_backend(args.dataset, backend, args.readers, args.compression)
+        if not results:
+            print(f"{backend:10s} failed")
+            continue
+        n = len(results)
+        load_s = sum(r["seconds"] for r in results) / n
+        peak = sum(r["peak_rss_kb"] for r in results) / n / 1024
+        private = sum(r.get("private_clean_kb", 0) + r.get("private_dirty_kb", 0) for r in results) / n / 1024
+        shared = sum(r.get("shared_clean_kb", 0) + r.get("shared_dirty_kb", 0) for r in results) / n / 1024
+        print(f"{backend:10s} {load_s:8.3f} {peak:12.1f} {private:11.1f} {shared:10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Benchmark and parity check: season-chunked weekly aggregation
+(data_loader.iter_weekly_stats + cleaning.aggregate_weekly_by_season) vs
+loading the whole weekly table and running aggregate_weekly_to_seasonal.
+
+Each path is measured from the cache read through the aggregate, under
+tracemalloc, on a synthetic cache. The chunked peak should track the
+largest single season partition, not the whole table. Output must be
+identical.
+
+Usage (from repo root):
+    python benchmarks/bench_chunked_weekly.py --scales 1,8
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src import cleaning, data_loader  # noqa: E402
+
+from bench_pipeline import prepare_data  # noqa: E402
+
+
+def whole_table() -> pd.DataFrame:
+    data_loader.clear_registry()
+    return cleaning.aggregate_weekly_to_seasonal(data_loader.load_weekly_stats())
+
+
+def by_season() -> pd.DataFrame:
+    data_loader.clear_registry()
+    return cleaning.aggregate_weekly_by_season(data_loader.iter_weekly_stats())
+
+
+def _measure(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    out = fn()
+    seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return out, seconds, peak / 2**20
+
+
+def _largest_season_mb() -> float:
+    sizes = []
+    for _, part in data_loader.iter_weekly_stats():
+        sizes.append(part.memory_usage(index=True, deep=True).sum())
+        del part
+    return max(sizes) / 2**20
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Chunked weekly aggregation parity + memory.")
+    parser.add_argument("--scales", default="1,4")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--data-root", default=os.path.join(tempfile.gettempdir(), "nfl_bench"))
+    args = parser.parse_args()
+
+    rows = []
+    for scale in [float(s) for s in args.scales.split(",")]:
+        prepare_data(scale, args.seed, Path(args.data_root))
+        chunked, chunked_s, chunked_mb = _measure(by_season)
+        full, full_s, full_mb = _measure(whole_table)
+        pd.testing.assert_frame_equal(chunked, full, check_exact=True)
+        row = {"scale": scale, "player_seasons": len(full),
+               "largest_season_mb": round(float(_largest_season_mb()), 1),
+               "chunked_peak_mb": round(chunked_mb, 1), "full_peak_mb": round(full_mb, 1),
+               "chunked_s": round(chunked_s, 3), "full_s": round(full_s, 3), "parity": "ok"}
+        rows.append(row)
+        print(row)
+
+    print()
+    print(pd.DataFrame(rows).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Benchmark contract matching: explode-then-merge vs interval join.
+
+Explode-then-merge is prepare_contracts (one row per covered season) merged
+on (gsis_id, season); the interval join is prepare_contract_windows +
+match_contracts. Both match every contract player over the analysis seasons
+(data_loader.YEARS), and every contract column of the two results must
+agree. --ties restates some contracts with the same year_signed, where both
+must keep the contract listed first.
+
+Usage (from repo root):
+    python benchmarks/bench_contract_join.py --scales 1,10
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src import cleaning, data_loader, synthetic  # noqa: E402
+
+
+def _explode_and_merge(contracts, keys):
+    expanded = cleaning.prepare_contracts(contracts)
+    return keys.merge(expanded, left_on=["player_id", "season"],
+                      right_on=["gsis_id", "season"], how="left")
+
+
+def _with_ties(contracts: pd.DataFrame, n: int, seed: int) -> pd.DataFrame:
+    """Append a restated copy of n contracts: same player and year_signed, different terms."""
+    rng = np.random.default_rng(seed)
+    tied = contracts.iloc[rng.choice(len(contracts), size=min(n, len(contracts)), replace=False)]
+    tied = tied.assign(apy_cap_pct=tied["apy_cap_pct"] * 1.1, apy=tied["apy"] * 1.1)
+    return pd.concat([contracts, tied], ignore_index=True)
+
+
+def _interval_join(contracts, keys):
+    windows = cleaning.prepare_contract_windows(contracts)
+    return pd.concat([keys, cleaning.match_contracts(keys, windows)], axis=1)
+
+
+def _measure(fn, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    out = fn(*args)
+    seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return out, seconds, peak / 2**20
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Explode+merge vs interval join for contracts.")
+    parser.add_argument("--scales", default="1,4")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--ties", type=int, default=200,
+                        help="contracts restated with the same year_signed")
+    args = parser.parse_args()
+
+    rows = []
+    for scale in [float(s) for s in args.scales.split(",")]:
+        contracts = data_loader._apply_schema("contracts", synthetic.generate(scale, args.seed)["contracts"])
+        contracts = _with_ties(contracts, args.ties, args.seed)
+        ids = contracts["gsis_id"].dropna().unique()
+        seasons = np.arange(data_loader.YEARS[0], data_loader.YEARS[-1] + 1)
+        keys = pd.DataFrame({"player_id": np.repeat(ids, len(seasons)),
+                             "season": np.tile(seasons, len(ids))})
+
+        exploded, ex_s, ex_mb = _measure(_explode_and_merge, contracts, keys)
+        joined, ij_s, ij_mb = _measure(_interval_join, contracts, keys)
+        contract_cols = [c for c in joined.columns if c not in keys.columns]
+        pd.testing.assert_frame_equal(
+            exploded[contract_cols].astype(object), joined[contract_cols].astype(object),
+            check_index_type=False,
+        )
+        rows.append({"scale": scale, "contracts": len(contracts), "player_seasons": len(keys),
+                     "explode_s": round(ex_s, 3), "explode_peak_mb": round(ex_mb, 1),
+                     "interval_s": round(ij_s, 3), "interval_peak_mb": round(ij_mb, 1)})
+        print(rows[-1])
+
+    print()
+    print(pd.DataFrame(rows).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Benchmark and parity check: in-season incremental weekly updates
+(cleaning.SeasonalAggregates) vs recomputing aggregate_weekly_to_seasonal +
+compute_rate_stats over the full weekly history.
+
+The last --weeks weeks of the final synthetic season are held back, the
+aggregates are built from the rest, and the held-back weeks are applied one
+at a time. Each step is timed against a full recompute. Then one ingested
+week is corrected (stat changes, a dropped row, a new player, a team
+change) and another is retracted. After every step the result must match
+the full recompute: exact for counts and ids, to float rounding for the
+summed float columns.
+
+Usage (from repo root):
+    python benchmarks/bench_incremental_weekly.py --scales 1,4
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src import cleaning, data_loader, synthetic  # noqa: E402
+
+
+def _weekly(scale: float, seed: int) -> pd.DataFrame:
+    raw = synthetic.generate(scale, seed)["weekly_stats"]
+    return data_loader._apply_schema("weekly_stats", raw)
+
+
+def full_recompute(weekly: pd.DataFrame) -> pd.DataFrame:
+    return cleaning.compute_rate_stats(cleaning.aggregate_weekly_to_seasonal(weekly))
+
+
+def check_parity(new: pd.DataFrame, old: pd.DataFrame) -> None:
+    pd.testing.assert_frame_equal(new, old, check_exact=False, rtol=1e-9, atol=1e-9)
+
+
+def _correct(week: pd.DataFrame, rng: np.random.Generator, new_player: pd.Series,
+             later_players) -> pd.DataFrame:
+    """A restated week: some yardage changes, one row dropped, one player added, a trade.
+
+    The trade goes on a kept row (row 0 is the one dropped), preferably a
+    player with no later week, so the new team becomes their recent_team.
+    """
+    week = week.copy()
+    changed = rng.choice(len(week), size=max(1, len(week) // 20), replace=False)
+    week.iloc[changed, week.columns.get_loc("receiving_yards")] += 7.0
+    week.iloc[changed, week.columns.get_loc("receiving_epa")] += 0.37
+    last_week = np.flatnonzero(~week["player_id"].isin(later_players).to_numpy()[1:]) + 1
+    row = last_week[0] if len(last_week) else 1
+    team = week["recent_team"]
+    traded = next(t for t in team.cat.categories if t != team.iloc[row])
+    week.iloc[row, week.columns.get_loc("recent_team")] = traded
+    added = new_player.to_frame().T.astype(week.dtypes.to_dict())
+    for col in ["season", "week"]:
+        added[col] = week[col].iloc[0]
+    return pd.concat([week.iloc[1:], added], ignore_index=True)
+
+
+def _timed(fn, *args):
+    start = time.perf_counter()
+    out = fn(*args)
+    return out, time.perf_counter() - start
+
+
+def run_scale(scale: float, seed: int, n_weeks: int) -> dict:
+    weekly = _weekly(scale, seed)
+    last = weekly["season"].max()
+    held_weeks = sorted(weekly.loc[weekly["season"] == last, "week"].unique())[-n_weeks:]
+    held = (weekly["season"] == last) & weekly["week"].isin(held_weeks)
+
+    aggregates = cleaning.SeasonalAggregates(weekly[~held])
+    incremental_s, full_s = [], []
+    for week in held_weeks:
+        rows = weekly[(weekly["season"] == last) & (weekly["week"] == week)]
+        _, seconds = _timed(aggregates.update, rows)
+        incremental_s.append(seconds)
+        ingested = weekly[~held | ((weekly["season"] == last) & (weekly["week"] <= week))]
+        expected, seconds = _timed(full_recompute, ingested)
+        full_s.append(seconds)
+        check_parity(aggregates.seasonal, expected)
+
+    # Correct the first held-back week after later weeks are in
+    rng = np.random.default_rng(seed)
+    fix_mask = (weekly["season"] == last) & (weekly["week"] == held_weeks[0])
+    new_player = weekly[weekly["season"] < last].iloc[0].copy()
+    new_player["player_id"] = "00-9999999"
+    later = weekly.loc[(weekly["season"] == last) & (weekly["week"] > held_weeks[0]), "player_id"]
+    corrected = _correct(weekly[fix_mask], rng, new_player, later)
+    counts, correction_s = _timed(aggregates.update, corrected)
+    # Restated rows go back in their week's place: first/last follow week order
+    weekly = pd.concat([weekly[~fix_mask], corrected], ignore_index=True)
+    weekly = weekly.sort_values(["season", "week"], kind="stable", ignore_index=True)
+    check_parity(aggregates.seasonal, full_recompute(weekly))
+
+    # Retract the latest week
+    aggregates.retract(int(last), int(held_weeks[-1]))
+    weekly = weekly[~((weekly["season"] == last) & (weekly["week"] == held_weeks[-1]))]
+    check_parity(aggregates.seasonal, full_recompute(weekly))
+
+    return {
+        "scale": scale, "weekly_rows": len(weekly), "player_seasons": len(aggregates.seasonal),
+        "weeks_applied": len(held_weeks),
+        "incremental_s": round(float(np.median(incremental_s)), 4),
+        "full_s": round(float(np.median(full_s)), 4),
+        "speedup": round(float(np.median(full_s) / np.median(incremental_s)), 1),
+        "correction_s": round(correction_s, 4),
+        "correction_rows": counts["player_seasons"], "parity": "ok",
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Incremental weekly update parity + speedup.")
+    parser.add_argument("--scales", default="0.25,1")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--weeks", type=int, default=4, help="weeks held back and applied one by one")
+    args = parser.parse_args()
+
+    rows = []
+    for scale in [float(s) for s in args.scales.split(",")]:
+        row = run_scale(scale, args.seed, args.weeks)
+        rows.append(row)
+        print(row)
+
+    print()
+    print(pd.DataFrame(rows).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
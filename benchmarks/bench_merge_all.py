@@ -0,0 +1,128 @@
+"""
+Benchmark and parity check: cleaning.merge_all vs the original
+implementation (benchmarks/reference.py) on synthetic data.
+
+Both are given the same cleaned inputs (seasonal stats, per-season
+contracts, snap counts, PFR defense, crosswalk, players) and the merged
+frames must be identical, except that the current merge_all also fills
+PFR defensive stats on weekly-stats rows that have them, which the
+original left empty; those cells are taken from the new frame. The check
+also runs on degenerate inputs (empty or unmapped snap counts, unmapped
+PFR defense, repeated contract keys).
+
+Usage (from repo root):
+    python benchmarks/bench_merge_all.py --scales 1,4
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src import cleaning, data_loader, keys, synthetic  # noqa: E402
+
+import reference  # noqa: E402
+
+
+def build_inputs(scale: float, seed: int) -> dict:
+    raw = {name: data_loader._apply_schema(name, df)
+           for name, df in synthetic.generate(scale, seed).items()}
+    # The crosswalk load_crosswalk() would build from this data, kept in memory
+    pfr_to_gsis = keys.IdCrosswalk()
+    pfr_to_gsis.update(raw["players"], "players")
+    pfr_to_gsis.update(raw["ids"], "ids")
+    seasonal = cleaning.compute_rate_stats(cleaning.aggregate_weekly_to_seasonal(raw["weekly_stats"]))
+    return {
+        "seasonal_stats": seasonal,
+        "contracts": cleaning.prepare_contracts(raw["contracts"]),
+        "snap_counts": cleaning.aggregate_snap_counts(raw["snap_counts"], pfr_to_gsis),
+        "pfr_def": raw["pfr_def"],
+        "pfr_to_gsis": pfr_to_gsis,
+        "players": raw["players"],
+    }
+
+
+def check_parity(new: pd.DataFrame, old: pd.DataFrame, n_stats_rows: int) -> int:
+    """Assert parity; returns how many weekly-stats rows gained defensive stats."""
+    old = old.copy()
+    stats_rows = np.arange(len(old)) < n_stats_rows
+    filled = np.zeros(len(old), dtype=bool)
+    for col in [c for c in cleaning.PFR_DEF_COL_MAP.values() if c in old.columns]:
+        fill = stats_rows & old[col].isna().to_numpy() & new[col].notna().to_numpy()
+        old.loc[fill, col] = new.loc[fill, col]
+        filled |= fill
+    # With no defensive players appended, the original joins the def stats
+    # last and leaks PFR's gsis_id as gsis_id_def; compare without those
+    old = old.drop(columns=["gsis_id_def"], errors="ignore")
+    if set(old.columns) == set(new.columns):
+        old = old[new.columns]
+    # pos_group/position_group are categorical now; compare their labels
+    cats = [c for c in new.columns if isinstance(new[c].dtype, pd.CategoricalDtype)
+            and not isinstance(old[c].dtype, pd.CategoricalDtype)]
+    new = new.astype({c: object for c in cats + ["position_group"]})
+    old = old.astype({c: object for c in cats + ["position_group"]})
+    pd.testing.assert_frame_equal(new, old)
+    return int(filled.sum())
+
+
+def edge_cases(inputs: dict) -> dict:
+    """Degenerate variants of the inputs that merge_all must handle like the original."""
+    snaps, pfr_def, contracts = inputs["snap_counts"], inputs["pfr_def"], inputs["contracts"]
+    return {
+        "empty_snap_counts": dict(inputs, snap_counts=snaps.iloc[:0]),
+        "all_na_snap_gsis_id": dict(inputs, snap_counts=snaps.assign(
+            gsis_id=pd.Series(pd.NA, index=snaps.index, dtype=snaps["gsis_id"].dtype))),
+        "unmapped_pfr_def": dict(inputs, pfr_def=pfr_def.assign(
+            pfr_id="unmapped-" + pfr_def["pfr_id"].astype(str))),
+        "repeated_contract_keys": dict(inputs, contracts=pd.concat(
+            [contracts, contracts.iloc[:5]], ignore_index=True)),
+    }
+
+
+def reference_inputs(inputs: dict) -> dict:
+    """The original merge_all takes the crosswalk as a gsis_id/pfr_id frame."""
+    return dict(inputs, pfr_to_gsis=inputs["pfr_to_gsis"].pairs("pfr_id"))
+
+
+def _timed(fn, inputs, repeat):
+    best, out = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        out = fn(**inputs)
+        best = min(best, time.perf_counter() - start)
+    return out, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="merge_all parity + speedup.")
+    parser.add_argument("--scales", default="1,4")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rows = []
+    for scale in [float(s) for s in args.scales.split(",")]:
+        inputs = build_inputs(scale, args.seed)
+        for name, case in edge_cases(inputs).items():
+            new, old = cleaning.merge_all(**case), reference.merge_all(**reference_inputs(case))
+            check_parity(new, old, len(case["seasonal_stats"]))
+            print(f"  scale {scale:g} {name}: {len(new):,} rows, parity ok")
+        new, new_s = _timed(cleaning.merge_all, inputs, args.repeat)
+        old, old_s = _timed(reference.merge_all, reference_inputs(inputs), args.repeat)
+        gained_def = check_parity(new, old, len(inputs["seasonal_stats"]))
+        rows.append({"scale": scale, "merged_rows": len(new), "reference_s": round(old_s, 3),
+                     "current_s": round(new_s, 3), "speedup": round(old_s / new_s, 2),
+                     "parity": "ok", "rows_gaining_def_stats": gained_def})
+        print(rows[-1])
+
+    print()
+    print(pd.DataFrame(rows).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""
+End-to-end pipeline benchmark on synthetic data at several scales.
+
+Runs the notebook 01 -> 02 -> 03 pipeline stage by stage (cached load,
+weekly aggregation, rate stats, contracts, snap counts, merge, filter,
+value scoring) and records wall time and peak traced memory per stage.
+Results are written as JSON; with --baseline the run is compared stage by
+stage and exits non-zero when any stage is slower (or heavier) than the
+baseline by more than --threshold.
+
+Usage (from repo root):
+    python benchmarks/bench_pipeline.py --scales 0.5,1,2
+    python benchmarks/bench_pipeline.py --scales 1 --baseline benchmarks/results/pipeline-<stamp>.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src import cleaning, data_loader, keys, synthetic, value_score  # noqa: E402
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+# Timings below this are dominated by noise and never count as regressions
+MIN_SECONDS = 0.05
+MIN_PEAK_MB = 1.0
+
+
+def _load_inputs():
+    data_loader.clear_registry()
+    return {
+        "weekly": data_loader.load_weekly_stats(),
+        "contracts_raw": data_loader.load_contracts(),
+        "snaps_raw": data_loader.load_snap_counts(),
+        "players": data_loader.load_players(),
+        "pfr_def": data_loader.load_pfr_stats("def"),
+    }
+
+
+# (stage name, function of the state built so far, key its output is stored under)
+STAGES = [
+    ("load", lambda s: _load_inputs(), None),
+    ("aggregate_weekly_to_seasonal",
+     lambda s: cleaning.aggregate_weekly_to_seasonal(s["weekly"]), "seasonal_raw"),
+    ("compute_rate_stats", lambda s: cleaning.compute_rate_stats(s["seasonal_raw"]), "seasonal"),
+    ("prepare_contracts", lambda s: cleaning.prepare_contracts(s["contracts_raw"]), "contracts"),
+    ("load_crosswalk", lambda s: keys.load_crosswalk(), "pfr_to_gsis"),
+    ("aggregate_snap_counts",
+     lambda s: cleaning.aggregate_snap_counts(s["snaps_raw"], s["pfr_to_gsis"]), "snaps"),
+    ("merge_all", lambda s: cleaning.merge_all(
+        s["seasonal"], s["contracts"], s["snaps"], s["pfr_def"], s["pfr_to_gsis"], s["players"],
+    ), "merged"),
+    ("get_analysis_ready", lambda s: cleaning.get_analysis_ready(s["merged"]), "analysis"),
+    ("compute_value_scores", lambda s: value_score.compute_value_scores(s["analysis"]), "scored"),
+]
+
+
+def _rows(out) -> int:
+    if isinstance(out, dict):
+        return sum(len(v) for v in out.values())
+    return len(out)
+
+
+def prepare_data(scale: float, seed: int, data_root: Path) -> None:
+    """Point data_loader at a synthetic cache for `scale`, generating it once."""
+    data_dir = data_root / f"scale-{scale:g}-seed-{seed}"
+    if not (data_dir / "manifest.json").exists():
+        print(f"Generating synthetic data at scale {scale:g} in {data_dir}...")
+        synthetic.write_to_cache(synthetic.generate(scale, seed), data_dir)
+    data_loader.DATA_DIR = data_dir
+
+
+def run_scale(scale: float, seed: int, data_root: Path, repeat: int) -> dict:
+    """Time each stage (best of `repeat`), then rerun it under tracemalloc for peak memory."""
+    prepare_data(scale, seed, data_root)
+    state, results = {}, {}
+    for name, fn, key in STAGES:
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            out = fn(state)
+            best = min(best, time.perf_counter() - start)
+
+        tracemalloc.start()
+        fn(state)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        if key is None:
+            state.update(out)
+        else:
+            state[key] = out
+        results[name] = {"seconds": round(best, 4), "peak_mb": round(peak / 2**20, 2),
+                         "rows": _rows(out)}
+        print(f"  scale {scale:g} {name:30s} {best:8.3f}s  {peak / 2**20:9.1f} MB  "
+              f"{results[name]['rows']:>10,} rows")
+    return results
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+            cwd=os.path.dirname(__file__),
+        ).stdout.strip()
+    except OSError:
+        return ""
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> pd.DataFrame:
+    """Per-stage ratios vs baseline; `regressed` marks stages past the threshold."""
+    rows = []
+    for scale, stages in current["results"].items():
+        base_stages = baseline["results"].get(scale, {})
+        for stage, cur in stages.items():
+            base = base_stages.get(stage)
+            if base is None:
+                continue
+            time_ratio = cur["seconds"] / base["seconds"] if base["seconds"] else float("nan")
+            mem_ratio = cur["peak_mb"] / base["peak_mb"] if base["peak_mb"] else float("nan")
+            regressed = (
+                (cur["seconds"] > base["seconds"] * (1 + threshold)
+                 and cur["seconds"] - base["seconds"] > MIN_SECONDS)
+                or (cur["peak_mb"] > base["peak_mb"] * (1 + threshold)
+                    and cur["peak_mb"] - base["peak_mb"] > MIN_PEAK_MB)
+            )
+            rows.append({
+                "scale": scale, "stage": stage,
+                "seconds": cur["seconds"], "base_seconds": base["seconds"],
+                "time_ratio": round(time_ratio, 2),
+                "peak_mb": cur["peak_mb"], "base_peak_mb": base["peak_mb"],
+                "mem_ratio": round(mem_ratio, 2),
+                "regressed": regressed,
+            })
+    return pd.DataFrame(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the analysis pipeline per stage.")
+    parser.add_argument("--scales", default="0.25,1",
+                        help="comma-separated synthetic scale factors")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=1, help="timed runs per stage (best kept)")
+    parser.add_argument("--data-root", default=os.path.join(tempfile.gettempdir(), "nfl_bench"),
+                        help="where synthetic caches are generated and reused")
+    parser.add_argument("--output", help="results JSON (default benchmarks/results/pipeline-<time>.json)")
+    parser.add_argument("--baseline", help="results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed slowdown/memory growth vs baseline (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    scales = [float(s) for s in args.scales.split(",")]
+    started = datetime.now(timezone.utc)
+    run = {
+        "meta": {
+            "started_at": started.isoformat(),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "machine": platform.machine(),
+            "seed": args.seed,
+            "repeat": args.repeat,
+        },
+        "results": {},
+    }
+    for scale in scales:
+        run["results"][f"{scale:g}"] = run_scale(scale, args.seed, Path(args.data_root), args.repeat)
+
+    output = Path(args.output) if args.output else (
+        RESULTS_DIR / f"pipeline-{started.strftime('%Y%m%dT%H%M%SZ')}.json")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(run, indent=2))
+    print(f"\nWrote {output}")
+
+    if args.baseline:
+        report = compare(run, json.loads(Path(args.baseline).read_text()), args.threshold)
+        print()
+        print(report.to_string(index=False))
+        regressed = report[report["regressed"]] if len(report) else report
+        if len(regressed):
+            print(f"\n{len(regressed)} stage(s) regressed past {args.threshold:.0%}:")
+            for _, row in regressed.iterrows():
+                print(f"  scale {row['scale']} {row['stage']}: "
+                      f"{row['time_ratio']}x time, {row['mem_ratio']}x memory")
+            sys.exit(1)
+        print(f"\nNo stage regressed past {args.threshold:.0%}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Benchmark and parity check: vectorized prepare_contracts vs the original
+iterrows expansion (benchmarks/reference.py) on synthetic contract histories.
+
+Index and values must match exactly per (gsis_id, season). Row order is
+not compared: the original sorted by year_signed with an unstable
+quicksort, whose order among equal years is arbitrary, while
+prepare_contracts now sorts stably so that same-year_signed ties go to the
+first-listed contract, as in match_contracts. Dtypes are compared after
+casting to object: the original rebuilt the frame from row Series, which
+re-inferred every column, while the vectorized path keeps the cache schema
+(categoricals, nullable ints).
+
+Usage (from repo root):
+    python benchmarks/bench_prepare_contracts.py --scales 0.25,1,4
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src import cleaning, data_loader, synthetic  # noqa: E402
+
+import reference  # noqa: E402
+
+
+def _contracts(scale: float, seed: int) -> pd.DataFrame:
+    raw = synthetic.generate(scale, seed)["contracts"]
+    return data_loader._apply_schema("contracts", raw)
+
+
+def _timed(fn, *args):
+    start = time.perf_counter()
+    out = fn(*args)
+    return out, time.perf_counter() - start
+
+
+def check_parity(new: pd.DataFrame, old: pd.DataFrame) -> None:
+    """Same rows per (gsis_id, season); row order isn't compared (see module docstring)."""
+    new = new.sort_values(["gsis_id", "season"], kind="stable")
+    old = old.sort_values(["gsis_id", "season"], kind="stable")
+    pd.testing.assert_index_equal(new.index, old.index)
+    pd.testing.assert_frame_equal(new.astype(object), old.astype(object))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="prepare_contracts parity + speedup.")
+    parser.add_argument("--scales", default="0.25,1")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--skip-reference-above", type=float, default=4.0,
+                        help="only time the vectorized version past this scale")
+    args = parser.parse_args()
+
+    rows = []
+    for scale in [float(s) for s in args.scales.split(",")]:
+        contracts = _contracts(scale, args.seed)
+        new, new_s = _timed(cleaning.prepare_contracts, contracts)
+        row = {"scale": scale, "contracts": len(contracts), "contract_seasons": len(new),
+               "vectorized_s": round(new_s, 3)}
+        if scale <= args.skip_reference_above:
+            old, old_s = _timed(reference.prepare_contracts, contracts)
+            check_parity(new, old)
+            row.update(reference_s=round(old_s, 3), speedup=round(old_s / new_s, 1), parity="ok")
+        rows.append(row)
+        print(row)
+
+    print()
+    print(pd.DataFrame(rows).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark and parity check: fused compute_rate_stats vs the original
+per-column np.where version (benchmarks/reference.py) on the synthetic
+seasonal table.
+
+Peak memory is traced for each call (the seasonal table itself is built
+before tracing starts). The result must be identical, and the input
+frame must come back unmodified.
+
+Usage (from repo root):
+    python benchmarks/bench_rate_stats.py --scales 1,10
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src import cleaning, data_loader, synthetic  # noqa: E402
+
+import reference  # noqa: E402
+
+
+def _seasonal(scale: float, seed: int) -> pd.DataFrame:
+    weekly = data_loader._apply_schema("weekly_stats", synthetic.generate(scale, seed)["weekly_stats"])
+    return cleaning.aggregate_weekly_to_seasonal(weekly)
+
+
+def _measure(fn, seasonal: pd.DataFrame, repeat: int = 5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(seasonal)
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    out = fn(seasonal)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return out, best, peak / 2**20
+
+
+def main():
+    parser = argparse.ArgumentParser(description="compute_rate_stats parity + memory.")
+    parser.add_argument("--scales", default="1,10")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rows = []
+    for scale in [float(s) for s in args.scales.split(",")]:
+        seasonal = _seasonal(scale, args.seed)
+        before = seasonal.copy()
+        table_mb = seasonal.memory_usage(index=True, deep=True).sum() / 2**20
+        new, new_s, new_mb = _measure(cleaning.compute_rate_stats, seasonal)
+        old, old_s, old_mb = _measure(reference.compute_rate_stats, seasonal)
+        pd.testing.assert_frame_equal(new, old, check_exact=True)
+        pd.testing.assert_frame_equal(seasonal, before, check_exact=True)
+        row = {"scale": scale, "player_seasons": len(seasonal), "table_mb": round(table_mb, 1),
+               "fused_peak_mb": round(new_mb, 2), "original_peak_mb": round(old_mb, 2),
+               "fused_s": round(new_s, 4), "original_s": round(old_s, 4), "parity": "ok"}
+        rows.append(row)
+        print(row)
+
+    print()
+    print(pd.DataFrame(rows).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
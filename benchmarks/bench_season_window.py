@@ -0,0 +1,154 @@
+"""
+Benchmark and parity check: season-relative value scores
+(compute_value_scores(season_window=...) and value_scores_by_window) vs a
+pandas loop over every (pos_group, season) window.
+
+The reference z-scores each season's rows against Series.mean()/std() of
+the position's rows from that season and the window - 1 before it (a
+window with fewer than 3 values or no spread scores 0, as
+_zscore_within_group), then weights them as compute_composite_score. Every
+window must match it to float rounding, and window 1 exactly in ids,
+flags and row order against compute_composite_score/compute_salary_zscore
+applied per (pos_group, season). The whole grid of windows is then timed
+against the loop.
+
+Usage (from repo root):
+    python benchmarks/bench_season_window.py --scales 1,4 --windows all,1,2,3,5,10
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src import value_score  # noqa: E402
+
+from bench_value_scores import analysis_table  # noqa: E402
+
+
+def loop_window_scores(df: pd.DataFrame, window: int) -> pd.Series:
+    """Value score per df row (NaN where unscored), one (pos_group, season) window at a time."""
+    prepared = value_score._prepare_inverted_stats(df)
+    value = pd.Series(np.nan, index=df.index)
+    for pos_group, group in prepared.groupby("pos_group", observed=True):
+        if pos_group not in value_score.POSITION_WEIGHTS or len(group) < value_score.MIN_GROUP_SIZE:
+            continue
+        weights = value_score.POSITION_WEIGHTS[pos_group]
+        for season, rows in group.groupby("season"):
+            ref = group[group["season"].between(season - window + 1, season)]
+
+            def zscore(col):
+                drawn = ref[col].astype(float)
+                if drawn.count() < 3 or drawn.std() == 0:
+                    return pd.Series(0.0, index=rows.index)
+                return (rows[col].astype(float) - drawn.mean()) / drawn.std()
+
+            composite, total = pd.Series(0.0, index=rows.index), 0.0
+            for stat, weight in weights.items():
+                if stat in prepared.columns:
+                    composite += zscore(stat) * weight
+                    total += weight
+            if total > 0:
+                composite /= total
+            value[rows.index] = composite - zscore("apy_cap_pct")
+    return value
+
+
+def loop_season_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Window 1 the original way: the per-group helpers applied per (pos_group, season)."""
+    parts = []
+    for pos_group, group in df.groupby("pos_group", sort=False, observed=True):
+        if pos_group not in value_score.POSITION_WEIGHTS or len(group) < value_score.MIN_GROUP_SIZE:
+            continue
+        for _, season in group.groupby("season", sort=False):
+            parts.append(season.assign(
+                performance_zscore=value_score.compute_composite_score(season, pos_group),
+                salary_zscore=value_score.compute_salary_zscore(season)))
+    out = pd.concat(parts).sort_index(kind="stable")
+    out = out.iloc[np.argsort(pd.factorize(out["pos_group"])[0], kind="stable")]
+    out = out.reset_index(drop=True)
+    out["value_score"] = out["performance_zscore"] - out["salary_zscore"]
+    out["value_percentile"] = out.groupby(["pos_group", "season"], observed=True)[
+        "value_score"].rank(pct=True) * 100
+    out["is_bargain"] = out["value_score"] > 2.0
+    out["is_overpaid"] = out["value_score"] < -2.0
+    return out
+
+
+FLOAT_COLS = ["performance_zscore", "salary_zscore", "value_score"]
+
+
+def check_parity(df: pd.DataFrame, grid: pd.DataFrame, windows: list) -> float:
+    """Assert parity of every window; returns the largest absolute value-score difference."""
+    new = value_score.compute_value_scores(df, season_window=1)
+    old = loop_season_frame(df)
+    pd.testing.assert_frame_equal(new.drop(columns=FLOAT_COLS + ["value_percentile"]),
+                                  old.drop(columns=FLOAT_COLS + ["value_percentile"]),
+                                  check_exact=True)
+    pd.testing.assert_frame_equal(new[FLOAT_COLS + ["value_percentile"]],
+                                  old[FLOAT_COLS + ["value_percentile"]],
+                                  check_exact=False, rtol=1e-9, atol=1e-12)
+
+    order = value_score._grouped_scores(df)["order"]
+    worst = 0.0
+    for window in windows:
+        got = grid.loc[grid["window"].isna() if window is None else grid["window"] == window]
+        single = value_score.compute_value_scores(df, season_window=window)
+        pd.testing.assert_series_equal(got["value_score"].reset_index(drop=True),
+                                       single["value_score"], check_exact=True)
+        if window is None:
+            continue
+        expected = loop_window_scores(df, window).to_numpy()[order]
+        np.testing.assert_allclose(got["value_score"], expected, rtol=1e-9, atol=1e-9)
+        worst = max(worst, float(np.nanmax(np.abs(got["value_score"].to_numpy() - expected))))
+    return worst
+
+
+def _timed(fn, *args, repeat: int = 3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        out = fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return out, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Season-relative value scores: parity + timing.")
+    parser.add_argument("--scales", default="1")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--windows", default="all,1,2,3,5,10",
+                        help="comma-separated season windows; 'all' is the pooled default")
+    parser.add_argument("--unscored-stats", action="store_true",
+                        help="drop a weighted stat and blank some values first")
+    args = parser.parse_args()
+    windows = [None if w == "all" else int(w) for w in args.windows.split(",")]
+
+    rows = []
+    for scale in [float(s) for s in args.scales.split(",")]:
+        df = analysis_table(scale, args.seed, args.unscored_stats)
+        grid, grid_s = _timed(value_score.value_scores_by_window, df, windows)
+        _, pooled_s = _timed(value_score.compute_value_scores, df)
+        windowed = [w for w in windows if w is not None]
+        _, loop_s = _timed(lambda: [loop_window_scores(df, w) for w in windowed], repeat=1)
+        worst = check_parity(df, grid, windows)
+        row = {"scale": scale, "rows": len(df), "windows": len(windows),
+               "cells": int(df["season"].nunique() * df["pos_group"].nunique()),
+               "grid_s": round(grid_s, 4), "pooled_s": round(pooled_s, 4),
+               "loop_s": round(loop_s, 3),
+               "speedup": round(loop_s / grid_s, 1),
+               "max_abs_diff": worst, "parity": "ok"}
+        rows.append(row)
+        print(row)
+
+    print()
+    print(pd.DataFrame(rows).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Benchmark and parity check: grouped compute_value_scores vs the original
+per-position loop (benchmarks/reference.py) on the synthetic analysis-ready
+table.
+
+Row order, index, dtypes, flags and percentiles must match exactly; the
+z-score columns to float rounding (group means/stds come from one segmented
+reduction instead of per-Series calls). --unscored-stats drops a weighted
+stat column entirely and blanks some values to exercise missing stats.
+
+Usage (from repo root):
+    python benchmarks/bench_value_scores.py --scales 1,10
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src import cleaning, value_score  # noqa: E402
+
+import reference  # noqa: E402
+from bench_merge_all import build_inputs  # noqa: E402
+
+FLOAT_COLS = ["performance_zscore", "salary_zscore", "value_score"]
+
+
+def analysis_table(scale: float, seed: int, perturb: bool = False) -> pd.DataFrame:
+    inputs = build_inputs(scale, seed)
+    analysis = cleaning.get_analysis_ready(cleaning.merge_all(**inputs))
+    if perturb:
+        rng = np.random.default_rng(seed)
+        analysis = analysis.drop(columns=["catch_rate"])
+        for col in ["passing_yards", "def_sacks", "total_snaps", "int_rate"]:
+            analysis.loc[rng.random(len(analysis)) < 0.05, col] = np.nan
+    return analysis
+
+
+def check_parity(new: pd.DataFrame, old: pd.DataFrame) -> float:
+    """Assert parity; returns the largest absolute difference in the z-score columns."""
+    pd.testing.assert_frame_equal(new.drop(columns=FLOAT_COLS), old.drop(columns=FLOAT_COLS),
+                                  check_exact=True)
+    pd.testing.assert_frame_equal(new[FLOAT_COLS], old[FLOAT_COLS], check_exact=False,
+                                  rtol=1e-9, atol=1e-12)
+    return float(np.nanmax(np.abs(new[FLOAT_COLS].to_numpy() - old[FLOAT_COLS].to_numpy())))
+
+
+def _timed(fn, *args, repeat: int = 3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        out = fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return out, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="compute_value_scores parity + speedup.")
+    parser.add_argument("--scales", default="1,10")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--unscored-stats", action="store_true",
+                        help="drop a weighted stat and blank some values first")
+    args = parser.parse_args()
+
+    rows = []
+    for scale in [float(s) for s in args.scales.split(",")]:
+        analysis = analysis_table(scale, args.seed, args.unscored_stats)
+        new, new_s = _timed(value_score.compute_value_scores, analysis)
+        old, old_s = _timed(reference.compute_value_scores, analysis)
+        max_diff = check_parity(new, old)
+        row = {"scale": scale, "rows": len(analysis), "scored": len(new),
+               "grouped_s": round(new_s, 4), "loop_s": round(old_s, 4),
+               "speedup": round(old_s / new_s, 1), "max_abs_diff": max_diff, "parity": "ok"}
+        rows.append(row)
+        print(row)
+
+    print()
+    print(pd.DataFrame(rows).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark and parity check: segmented-reduction aggregate_weekly_to_seasonal
+vs the original named-aggregation groupby (benchmarks/reference.py).
+
+Output must be identical, values bit for bit (float sums included) and
+dtypes exactly. Pass --perturb to also shuffle row order and blank some
+attributes and stats, which exercises first/last-non-missing and NaN
+skipping.
+
+Usage (from repo root):
+    python benchmarks/bench_weekly_aggregation.py --scales 1,10
+    python benchmarks/bench_weekly_aggregation.py --scales 100   # needs ~16 GB of RAM
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src import cleaning, data_loader, synthetic  # noqa: E402
+
+import reference  # noqa: E402
+
+
+def _weekly(scale: float, seed: int, perturb: bool) -> pd.DataFrame:
+    weekly = data_loader._apply_schema("weekly_stats", synthetic.generate(scale, seed)["weekly_stats"])
+    if perturb:
+        rng = np.random.default_rng(seed)
+        weekly = weekly.sample(frac=1.0, random_state=seed).reset_index(drop=True)
+        for col in ["player_display_name", "position", "recent_team", "passing_yards",
+                    "receiving_epa", "week", "player_id"]:
+            weekly.loc[rng.random(len(weekly)) < 0.05, col] = None
+    return weekly
+
+
+def _measure(fn, *args):
+    start = time.perf_counter()
+    out = fn(*args)
+    seconds = time.perf_counter() - start
+    tracemalloc.start()
+    fn(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return out, seconds, peak / 2**20
+
+
+def main():
+    parser = argparse.ArgumentParser(description="aggregate_weekly_to_seasonal parity + speedup.")
+    parser.add_argument("--scales", default="1,10")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--perturb", action="store_true",
+                        help="shuffle rows and blank some values before aggregating")
+    args = parser.parse_args()
+
+    rows = []
+    for scale in [float(s) for s in args.scales.split(",")]:
+        weekly = _weekly(scale, args.seed, args.perturb)
+        new, new_s, new_mb = _measure(cleaning.aggregate_weekly_to_seasonal, weekly)
+        old, old_s, old_mb = _measure(reference.aggregate_weekly_to_seasonal, weekly)
+        pd.testing.assert_frame_equal(new, old, check_exact=True)
+        row = {"scale": scale, "weekly_rows": len(weekly), "player_seasons": len(new),
+               "segmented_s": round(new_s, 3), "groupby_s": round(old_s, 3),
+               "speedup": round(old_s / new_s, 1),
+               "segmented_peak_mb": round(new_mb, 1), "groupby_peak_mb": round(old_mb, 1),
+               "parity": "ok"}
+        rows.append(row)
+        print(row)
+        del weekly, new, old
+
+    print()
+    print(pd.DataFrame(rows).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Benchmark and parity check: value_score.weight_sweep over thousands of
+POSITION_WEIGHTS variants per position vs rerunning compute_value_scores
+once per variant.
+
+A sample of variants is rerun through compute_value_scores with
+POSITION_WEIGHTS patched, and the sweep's Spearman correlation, top-N
+overlap and flag counts/churn are recomputed from those full runs and
+compared. The full rerun time per variant is then extrapolated to the
+whole sweep.
+
+Usage (from repo root):
+    python benchmarks/bench_weight_sweep.py --scale 1 --variants 10000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+from scipy import stats as scipy_stats
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src import value_score  # noqa: E402
+
+from bench_value_scores import analysis_table  # noqa: E402
+
+
+def rerun_metrics(analysis, baseline, pos_group, weights: dict, top_n: int) -> dict:
+    """Sweep metrics for one variant from a full compute_value_scores rerun."""
+    original = value_score.POSITION_WEIGHTS[pos_group]
+    value_score.POSITION_WEIGHTS[pos_group] = weights
+    try:
+        scored = value_score.compute_value_scores(analysis)
+    finally:
+        value_score.POSITION_WEIGHTS[pos_group] = original
+    base = baseline.loc[baseline["pos_group"] == pos_group, "value_score"].dropna()
+    new = scored.loc[base.index, "value_score"]
+    n = min(top_n, len(base))
+    return {
+        "spearman": scipy_stats.spearmanr(base, new).statistic,
+        "top_n_overlap": len(set(base.nlargest(n).index) & set(new.nlargest(n).index)) / n,
+        "bargains": int((new > 2).sum()),
+        "bargain_churn": int(((new > 2) != (base > 2)).sum()),
+        "overpaid": int((new < -2).sum()),
+        "overpaid_churn": int(((new < -2) != (base < -2)).sum()),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Weight sweep parity + speed.")
+    parser.add_argument("--scale", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--variants", type=int, default=10_000, help="variants per position")
+    parser.add_argument("--check", type=int, default=5, help="variants per position rerun in full")
+    parser.add_argument("--top-n", type=int, default=15)
+    args = parser.parse_args()
+
+    analysis = analysis_table(args.scale, args.seed)
+    baseline = value_score.compute_value_scores(analysis)
+    positions = [g for g in value_score.POSITION_WEIGHTS if (baseline["pos_group"] == g).any()]
+    variants = {g: value_score.weight_variants(g, args.variants, seed=args.seed) for g in positions}
+
+    start = time.perf_counter()
+    sweep = value_score.weight_sweep(analysis, variants, top_n=args.top_n)
+    sweep_s = time.perf_counter() - start
+
+    rng = np.random.default_rng(args.seed)
+    rerun_s = []
+    for g in positions:
+        for i in rng.choice(args.variants, size=min(args.check, args.variants), replace=False):
+            row = sweep[(sweep["pos_group"] == g) & (sweep["variant"] == i)].iloc[0]
+            start = time.perf_counter()
+            expected = rerun_metrics(analysis, baseline, g, variants[g].loc[i].to_dict(), args.top_n)
+            rerun_s.append(time.perf_counter() - start)
+            for metric, value in expected.items():
+                assert np.isclose(row[metric], value, rtol=1e-9, atol=1e-9), (g, i, metric, row[metric], value)
+
+    total = len(sweep)
+    print(sweep.groupby("pos_group")[["spearman", "top_n_overlap", "bargain_churn",
+                                      "overpaid_churn"]].describe().round(3).T.to_string())
+    print()
+    print(f"{total:,} variants over {len(positions)} positions in {sweep_s:.2f}s "
+          f"({sweep_s / total * 1e6:.0f} us/variant)")
+    print(f"Full rerun: {np.median(rerun_s):.3f}s/variant -> ~{np.median(rerun_s) * total / 3600:.1f} h "
+          f"for the same sweep; {len(rerun_s)} sampled variants match")
+
+
+if __name__ == "__main__":
+    main()
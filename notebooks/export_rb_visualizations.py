@@ -3,26 +3,24 @@
 import sys
 sys.path.insert(0, '..')
 
-import pandas as pd
-import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 from pathlib import Path
 import warnings
 warnings.filterwarnings('ignore')
 
+from src.data_loader import load_cached, load_rosters
+
 # Set paths
-DATA_DIR = Path('../data')
 OUTPUT_DIR = Path('../article/images/rb_economics')
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
 print("Loading data...")
-scored = pd.read_parquet(DATA_DIR / 'scored.parquet', engine='fastparquet')
-rosters = pd.read_parquet(DATA_DIR / 'rosters.parquet', engine='fastparquet')
+scored = load_cached('scored')
+rosters = load_rosters(columns=['player_id', 'player_name', 'draft_number', 'draft_club', 'rookie_year'])
 
 # Get draft info
 draft_info = rosters[rosters['draft_number'].notna()][['player_id', 'player_name', 'draft_number', 'draft_club', 'rookie_year']].drop_duplicates('player_id').copy()
-draft_info['draft_number'] = pd.to_numeric(draft_info['draft_number'], errors='coerce')
 draft_info['draft_round'] = ((draft_info['draft_number'] - 1) // 32 + 1).astype('Int64')
 draft_info['draft_round'] = draft_info['draft_round'].clip(upper=7)
 
@@ -14,8 +14,9 @@ from pathlib import Path
 import warnings
 warnings.filterwarnings('ignore')
 
-# Set data directory
-DATA_DIR = Path('../data')
+from src.data_loader import load_cached, load_rosters, load_weekly_stats
+
+# Set output directory
 OUTPUT_DIR = Path('../article/images/te_market_inefficiency')
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -25,13 +26,15 @@ print("="*80)
 
 # 1. Load Data
 print("\n1. Loading data...")
-scored = pd.read_parquet(DATA_DIR / 'scored.parquet', engine='fastparquet')
-rosters = pd.read_parquet(DATA_DIR / 'rosters.parquet', engine='fastparquet')
-weekly = pd.read_parquet(DATA_DIR / 'weekly_stats.parquet', engine='fastparquet')
+scored = load_cached('scored')
+rosters = load_rosters(columns=['player_id', 'player_name', 'draft_number', 'draft_club', 'rookie_year'])
+weekly = load_weekly_stats(
+    columns=['player_id', 'season', 'week', 'receiving_tds', 'targets'],
+    filters={'position': 'TE'},
+)
 
 # Get draft info
 draft_info = rosters[rosters['draft_number'].notna()][['player_id', 'player_name', 'draft_number', 'draft_club', 'rookie_year']].drop_duplicates('player_id').copy()
-draft_info['draft_number'] = pd.to_numeric(draft_info['draft_number'], errors='coerce')
 draft_info['draft_round'] = ((draft_info['draft_number'] - 1) // 32 + 1).astype('Int64')
 draft_info['draft_round'] = draft_info['draft_round'].clip(upper=7)
 
@@ -186,7 +189,7 @@ else:
 
 # 7. Red Zone Efficiency vs. Salary
 print("\n7. Generating red zone efficiency visualization...")
-te_weekly = weekly[weekly['position'] == 'TE'].copy()
+te_weekly = weekly  # already filtered to TEs at load time
 te_td_stats = te_weekly.groupby(['player_id', 'season']).agg(
     total_tds=('receiving_tds', 'sum'),
     total_targets=('targets', 'sum')
@@ -3,6 +3,9 @@
 import pandas as pd
 import numpy as np
 
+from . import data_loader
+from .keys import MISSING, IdCrosswalk, KeyDictionary, season_key
+
 
 # Position group mapping — maps raw positions to analysis groups
 POSITION_GROUP_MAP = {
@@ -25,6 +28,10 @@ POSITION_GROUP_MAP = {
 MIN_SNAPS = 100
 
 
+# Categories of the pos_group categorical
+POSITION_GROUPS = sorted(set(POSITION_GROUP_MAP.values())) + ["UNK"]
+
+
 def classify_position(pos: str) -> str:
     """Map raw position string to analysis group."""
     if pd.isna(pos):
@@ -32,112 +39,537 @@ def classify_position(pos: str) -> str:
     return POSITION_GROUP_MAP.get(pos.strip().upper(), "UNK")
 
 
-def aggregate_weekly_to_seasonal(weekly: pd.DataFrame) -> pd.DataFrame:
-    """Aggregate weekly player stats to season totals."""
-    # Only regular season + postseason
-    weekly = weekly[weekly["season_type"].isin(["REG", "POST"])].copy()
-
-    # Numeric columns to sum
-    sum_cols = [
-        "completions", "attempts", "passing_yards", "passing_tds", "interceptions",
-        "sacks", "sack_fumbles", "sack_fumbles_lost",
-        "passing_first_downs", "passing_2pt_conversions",
-        "carries", "rushing_yards", "rushing_tds", "rushing_fumbles",
-        "rushing_fumbles_lost", "rushing_first_downs", "rushing_2pt_conversions",
-        "receptions", "targets", "receiving_yards", "receiving_tds",
-        "receiving_fumbles", "receiving_fumbles_lost", "receiving_first_downs",
-        "receiving_2pt_conversions",
-        "special_teams_tds", "fantasy_points", "fantasy_points_ppr",
-    ]
-    # Keep only columns that exist
-    sum_cols = [c for c in sum_cols if c in weekly.columns]
-
-    # EPA columns to sum (they're additive)
-    epa_cols = [c for c in weekly.columns if c.endswith("_epa")]
-    sum_cols.extend(epa_cols)
-
-    # Group by player + season
-    grouped = weekly.groupby(["player_id", "season"]).agg(
-        player_name=("player_display_name", "first"),
-        position=("position", "first"),
-        position_group=("position_group", "first"),
-        recent_team=("recent_team", "last"),
-        games_played=("week", "count"),
-        **{col: (col, "sum") for col in sum_cols},
-    ).reset_index()
-
-    return grouped
+def unknown_position_counts(positions: pd.Series) -> pd.Series:
+    """Row counts of raw positions that classify to UNK (missing shown as NaN)."""
+    codes, uniques = pd.factorize(positions, use_na_sentinel=False)
+    counts = pd.Series(np.bincount(codes, minlength=len(uniques)), index=pd.Index(uniques, dtype=object))
+    unknown = [classify_position(p) == "UNK" for p in uniques]
+    return counts[unknown].sort_values(ascending=False)
 
 
-def compute_rate_stats(seasonal: pd.DataFrame) -> pd.DataFrame:
-    """Add computed rate stats to seasonal aggregates."""
-    df = seasonal.copy()
+def classify_positions(positions: pd.Series, report_unknown: bool = False) -> pd.Series:
+    """Vectorized classify_position returning a pos_group categorical.
 
-    # Passing
-    df["completion_pct"] = np.where(
-        df["attempts"] > 0, df["completions"] / df["attempts"] * 100, np.nan
-    )
-    df["yards_per_attempt"] = np.where(
-        df["attempts"] > 0, df["passing_yards"] / df["attempts"], np.nan
+    Each distinct raw position is classified once and the result broadcast
+    back by code. With report_unknown, positions that map to UNK are printed
+    with their row counts.
+    """
+    codes, uniques = pd.factorize(positions)
+    unk = POSITION_GROUPS.index("UNK")
+    group_codes = np.array(
+        [POSITION_GROUPS.index(classify_position(p)) for p in uniques] + [unk], dtype=np.int8
     )
-    df["td_rate"] = np.where(
-        df["attempts"] > 0, df["passing_tds"] / df["attempts"] * 100, np.nan
+    # Missing positions (code -1) pick up the trailing UNK entry
+    result = pd.Series(
+        pd.Categorical.from_codes(group_codes[codes], categories=POSITION_GROUPS),
+        index=positions.index,
+        name="pos_group",
     )
-    df["int_rate"] = np.where(
-        df["attempts"] > 0, df["interceptions"] / df["attempts"] * 100, np.nan
-    )
-    # Simplified passer rating (NFL formula)
-    df["passer_rating"] = _passer_rating(df)
-
-    # Rushing
-    df["yards_per_carry"] = np.where(
-        df["carries"] > 0, df["rushing_yards"] / df["carries"], np.nan
-    )
-
-    # Receiving
-    df["catch_rate"] = np.where(
-        df["targets"] > 0, df["receptions"] / df["targets"] * 100, np.nan
-    )
-    df["yards_per_reception"] = np.where(
-        df["receptions"] > 0, df["receiving_yards"] / df["receptions"], np.nan
-    )
-
-    return df
-
-
-def _passer_rating(df: pd.DataFrame) -> pd.Series:
-    """Calculate NFL passer rating."""
-    att = df["attempts"].replace(0, np.nan)
-    a = ((df["completions"] / att * 100) - 30) / 20
-    b = ((df["passing_tds"] / att * 100) - 0) / 5  # fixed: no subtract
-    c = (2.375 - (df["interceptions"] / att * 100 * 0.25))  # inverted
-    d = ((df["passing_yards"] / att) - 3) / 4
+    if report_unknown:
+        unknown = unknown_position_counts(positions)
+        if len(unknown):
+            detail = ", ".join(f"{pos}: {n:,}" for pos, n in unknown.items())
+            print(f"Unmapped positions (UNK): {unknown.sum():,} rows ({detail})")
+    return result
+
+
+# Weekly counting stats summed to season totals (plus every *_epa column)
+WEEKLY_SUM_COLS = [
+    "completions", "attempts", "passing_yards", "passing_tds", "interceptions",
+    "sacks", "sack_fumbles", "sack_fumbles_lost",
+    "passing_first_downs", "passing_2pt_conversions",
+    "carries", "rushing_yards", "rushing_tds", "rushing_fumbles",
+    "rushing_fumbles_lost", "rushing_first_downs", "rushing_2pt_conversions",
+    "receptions", "targets", "receiving_yards", "receiving_tds",
+    "receiving_fumbles", "receiving_fumbles_lost", "receiving_first_downs",
+    "receiving_2pt_conversions",
+    "special_teams_tds", "fantasy_points", "fantasy_points_ppr",
+]
+
+# Seasonal attributes taken from the first (or last) week that has them
+SEASONAL_ATTRS = {
+    "player_name": ("player_display_name", "first"),
+    "position": ("position", "first"),
+    "position_group": ("position_group", "first"),
+    "recent_team": ("recent_team", "last"),
+}
 
-    # Clip each component 0-2.375
-    a = a.clip(0, 2.375)
-    b = b.clip(0, 2.375)
-    c = c.clip(0, 2.375)
-    d = d.clip(0, 2.375)
 
-    rating = ((a + b + c + d) / 6) * 100
-    return rating
+def _weekly_sum_cols(weekly: pd.DataFrame) -> list:
+    """WEEKLY_SUM_COLS present in `weekly`, then its EPA columns (they're additive)."""
+    sum_cols = [c for c in WEEKLY_SUM_COLS if c in weekly.columns]
+    sum_cols.extend(c for c in weekly.columns if c.endswith("_epa"))
+    return sum_cols
+
+
+def _segments(keys: list, rows: np.ndarray) -> tuple:
+    """Stable order of `rows` by the key columns, plus start and length of each group.
+
+    Rows with a missing key are left out, as groupby drops them; groups
+    come out in groupby's sorted key order.
+    """
+    group = np.zeros(len(rows), dtype=np.int64)
+    valid = np.ones(len(rows), dtype=bool)
+    for key in keys:
+        codes, uniques = pd.factorize(key.iloc[rows], sort=True)
+        group = group * (len(uniques) + 1) + codes
+        valid &= codes >= 0
+    rows, group = rows[valid], group[valid]
+    by_group = np.argsort(group, kind="stable")
+    order, group = rows[by_group], group[by_group]
+    starts = np.flatnonzero(np.r_[True, group[1:] != group[:-1]]) if len(order) else \
+        np.array([], dtype=np.int64)
+    return order, starts, np.diff(np.r_[starts, len(order)])
+
+
+def _segment_take(values: pd.Series, order: np.ndarray, starts: np.ndarray,
+                  lengths: np.ndarray, how: str) -> pd.api.extensions.ExtensionArray:
+    """First or last non-missing value of each group, taken by row index."""
+    present = np.flatnonzero(values.notna().to_numpy()[order])
+    if how == "first":
+        j = np.searchsorted(present, starts)
+        found = j < len(present)
+        found[found] &= present[j[found]] < (starts + lengths)[found]
+    else:
+        j = np.searchsorted(present, starts + lengths) - 1
+        found = j >= 0
+        found[found] &= present[j[found]] >= starts[found]
+    rows = np.where(found, order[present[np.where(found, j, 0)]] if len(present) else 0, -1)
+    return values.array.take(rows, allow_fill=True)
 
 
-def build_pfr_id_map(players: pd.DataFrame) -> pd.DataFrame:
-    """Create a gsis_id <-> pfr_id crosswalk from players table."""
-    crosswalk = players[["gsis_id", "pfr_id"]].dropna(subset=["gsis_id", "pfr_id"])
-    crosswalk = crosswalk.drop_duplicates(subset=["pfr_id"])
-    return crosswalk
+def aggregate_weekly_to_seasonal(weekly: pd.DataFrame) -> pd.DataFrame:
+    """Aggregate weekly player stats to season totals.
+
+    Same output as a groupby(["player_id", "season"]) named aggregation,
+    computed as segmented reductions: rows are ordered by player and season
+    once (stably, so first/last follow row order), first/last attributes
+    are taken by row index, and the sum columns reduce together as one
+    block against the resulting group labels.
+    """
+    # Only regular season + postseason
+    rows = np.flatnonzero(weekly["season_type"].isin(["REG", "POST"]).to_numpy())
+    sum_cols = _weekly_sum_cols(weekly)
+
+    order, starts, lengths = _segments([weekly["player_id"], weekly["season"]], rows)
+    firsts = order[starts]
+    grouped = {
+        "player_id": weekly["player_id"].array.take(firsts),
+        "season": weekly["season"].array.take(firsts),
+    }
+    for name, (col, how) in SEASONAL_ATTRS.items():
+        grouped[name] = _segment_take(weekly[col], order, starts, lengths, how)
+
+    week = weekly["week"]
+    played = np.add.reduceat(week.notna().to_numpy()[order].astype(np.int64), starts) \
+        if len(starts) else np.array([], dtype=np.int64)
+    grouped["games_played"] = pd.array(played, dtype="Int64") \
+        if isinstance(week.dtype, pd.api.extensions.ExtensionDtype) else played
+
+    # All sum columns in one grouped reduction on precomputed group labels:
+    # pandas sums each dtype's 2-D block in a single pass in row order, so
+    # float totals are bit-identical to the per-column aggregation. Rows
+    # left out above fall in group -1, which the reindex drops.
+    labels = np.full(len(weekly), -1)
+    labels[order] = np.repeat(np.arange(len(starts)), lengths)
+    sums = weekly.groupby(labels, sort=False)[sum_cols].sum().reindex(np.arange(len(starts)))
+    for col in sum_cols:
+        grouped[col] = sums[col].array
+
+    columns = ["player_id", "season", *SEASONAL_ATTRS, "games_played", *sum_cols]
+    return pd.DataFrame({col: grouped[col] for col in columns})
+
+
+def aggregate_weekly_by_season(chunks) -> pd.DataFrame:
+    """Aggregate weekly stats to season totals one season chunk at a time.
+
+    `chunks` yields (season, weekly frame) pairs, e.g.
+    data_loader.iter_weekly_stats(). Player-season groups never cross seasons, so each chunk is aggregated
+    on its own and dropped before the next one is read: peak memory is the
+    largest season rather than the whole weekly table. The combined result
+    equals aggregate_weekly_to_seasonal on the concatenated weekly frame.
+    Every chunk must hold whole seasons.
+    """
+    parts = []
+    for _, weekly in chunks:
+        parts.append(aggregate_weekly_to_seasonal(weekly))
+        del weekly
+    if not parts:
+        return pd.DataFrame(columns=["player_id", "season", *SEASONAL_ATTRS, "games_played"])
+    seasonal = data_loader.concat_partitions(parts)
+    return seasonal.sort_values(["player_id", "season"], kind="stable", ignore_index=True)
+
+
+# Columns compute_rate_stats adds
+RATE_STAT_COLS = [
+    "completion_pct", "yards_per_attempt", "td_rate", "int_rate", "passer_rating",
+    "yards_per_carry", "catch_rate", "yards_per_reception",
+]
+
+
+def _rate_stats(seasonal: pd.DataFrame) -> dict:
+    """RATE_STAT_COLS as float arrays, computed in one pass over the count columns.
+
+    Each ratio is divided straight into its output buffer (NaN where the
+    denominator is 0), the passer rating is accumulated in one buffer from
+    the same passing ratios, and the only scratch array is one component
+    buffer. Operations run in the formula's order, so the values are
+    identical to computing each column separately.
+    """
+    n = len(seasonal)
+
+    def column(name):
+        return seasonal[name].to_numpy(dtype=np.float64, na_value=np.nan)
+
+    def ratio(num, den, where, scale=None):
+        out = np.full(n, np.nan)
+        np.divide(num, den, out=out, where=where)
+        if scale is not None:
+            np.multiply(out, scale, out=out)
+        return out
+
+    # Passing; the rating treats any non-zero attempts as valid, the
+    # published rates only positive ones
+    att = column("attempts")
+    has_att = (att != 0) & ~np.isnan(att)
+    completion_pct = ratio(column("completions"), att, has_att, 100)
+    td_rate = ratio(column("passing_tds"), att, has_att, 100)
+    int_rate = ratio(column("interceptions"), att, has_att, 100)
+    yards_per_attempt = ratio(column("passing_yards"), att, has_att)
+
+    # Simplified passer rating (NFL formula), each component clipped 0-2.375
+    rating = np.subtract(completion_pct, 30)
+    rating /= 20
+    np.clip(rating, 0, 2.375, out=rating)
+    part = np.divide(td_rate, 5)
+    np.clip(part, 0, 2.375, out=part)
+    rating += part
+    np.multiply(int_rate, 0.25, out=part)
+    np.subtract(2.375, part, out=part)
+    np.clip(part, 0, 2.375, out=part)
+    rating += part
+    np.subtract(yards_per_attempt, 3, out=part)
+    part /= 4
+    np.clip(part, 0, 2.375, out=part)
+    rating += part
+    rating /= 6
+    rating *= 100
+
+    negative = att < 0
+    if negative.any():
+        for values in (completion_pct, td_rate, int_rate, yards_per_attempt):
+            values[negative] = np.nan
+
+    # Rushing and receiving
+    carries, targets, receptions = column("carries"), column("targets"), column("receptions")
+    return {
+        "completion_pct": completion_pct,
+        "yards_per_attempt": yards_per_attempt,
+        "td_rate": td_rate,
+        "int_rate": int_rate,
+        "passer_rating": rating,
+        "yards_per_carry": ratio(column("rushing_yards"), carries, carries > 0),
+        "catch_rate": ratio(receptions, targets, targets > 0, 100),
+        "yards_per_reception": ratio(column("receiving_yards"), receptions, receptions > 0),
+    }
 
 
-def aggregate_snap_counts(snaps: pd.DataFrame, pfr_to_gsis: pd.DataFrame) -> pd.DataFrame:
-    """Aggregate snap counts to seasonal totals and map to gsis_id."""
-    seasonal_snaps = snaps.groupby(["pfr_player_id", "season"]).agg(
+def compute_rate_stats(seasonal: pd.DataFrame) -> pd.DataFrame:
+    """Add computed rate stats to seasonal aggregates.
+
+    The input is not modified; the rate columns are added through a single
+    assign, which shares the existing columns rather than copying them.
+    """
+    return seasonal.assign(**_rate_stats(seasonal))
+
+
+class SeasonalAggregates:
+    """Season totals and rate stats kept current one week at a time.
+
+    Built once from the weekly history, then update() applies new weekly
+    rows as a delta: each (season, week) in them is scatter-added into the
+    running sums of the player-seasons it touches, and only those
+    player-seasons get their rate stats recomputed. First/last attributes
+    are held with the week they came from, so a new week's rows are only
+    compared against them. A week that was already ingested is a
+    correction: its previous rows are subtracted first and the new rows
+    applied in their place. Ingested rows are kept per week so a correction
+    (or retract()) knows what to take back; only a player-season whose
+    first/last attribute came from a removed week, and that the new rows
+    don't restate, is re-read from its stored rows.
+
+    `seasonal` equals compute_rate_stats(aggregate_weekly_to_seasonal(...))
+    over every ingested row, up to float rounding in the summed EPA and
+    fantasy point columns, as long as the history is in week order.
+    """
+
+    KEY = ["player_id", "season"]
+
+    def __init__(self, weekly: pd.DataFrame):
+        weekly = weekly[weekly["season_type"].isin(["REG", "POST"])]
+        self.sum_cols = _weekly_sum_cols(weekly)
+        self._row_cols = (self.KEY + ["week"]
+                          + [src for src, _ in SEASONAL_ATTRS.values()] + self.sum_cols)
+
+        # Totals, rates and attribute weeks are one numpy array per column,
+        # positionally aligned with the sorted player-season index
+        seasonal = aggregate_weekly_to_seasonal(weekly).set_index(self.KEY)
+        self._index = seasonal.index
+        self._attrs = seasonal[list(SEASONAL_ATTRS)].copy()
+        self._dtypes = seasonal[["games_played"] + self.sum_cols].dtypes
+        self._sums = {}
+        for col, dtype in self._dtypes.items():
+            dtype = getattr(dtype, "numpy_dtype", dtype)
+            self._sums[col] = seasonal[col].to_numpy(dtype=dtype, na_value=0).copy()
+        self._rates = _rate_stats(seasonal)
+        self._attr_weeks = {name: np.full(len(self._index), np.nan) for name in SEASONAL_ATTRS}
+        self._merge_attributes(weekly, self._positions(weekly))
+        self._weeks = {}
+        for (season, week), rows in weekly[self._row_cols].groupby(["season", "week"]):
+            self._weeks[(int(season), int(week))] = rows
+
+    @property
+    def weeks(self) -> list:
+        """Ingested (season, week) pairs, in order."""
+        return sorted(self._weeks)
+
+    @property
+    def seasonal(self) -> pd.DataFrame:
+        """Seasonal aggregates with rate stats, one row per player_id + season."""
+        sums = {col: pd.array(values, dtype=self._dtypes[col])
+                for col, values in self._sums.items()}
+        totals = pd.DataFrame({**sums, **self._rates}, index=self._index)
+        return pd.concat([self._attrs, totals], axis=1).reset_index()
+
+    def update(self, weekly: pd.DataFrame) -> dict:
+        """Apply weekly rows; weeks already ingested are replaced. Returns change counts."""
+        weekly = weekly[weekly["season_type"].isin(["REG", "POST"])]
+        weekly = weekly.reindex(columns=self._row_cols)
+        changed, weeks, corrected = [], 0, 0
+        for (season, week), rows in weekly.groupby(["season", "week"]):
+            key = (int(season), int(week))
+            stale = None
+            if key in self._weeks:
+                old = self._weeks.pop(key)
+                pos = self._positions(old)
+                self._apply(old, pos, -1)
+                stale = self._clear_attributes(pos, key[1])
+                changed.append(self._index[pos])
+                corrected += 1
+            self._weeks[key] = rows
+            pos = self._positions(rows)
+            self._apply(rows, pos, 1)
+            self._merge_attributes(rows, pos)
+            if stale is not None:
+                self._reread_attributes(stale)
+            changed.append(self._index[pos])
+            weeks += 1
+        counts = self._refresh(changed)
+        return {"weeks": weeks, "corrected": corrected, **counts}
+
+    def retract(self, season: int, week: int) -> dict:
+        """Take an ingested week back out of the totals. Returns change counts."""
+        rows = self._weeks.pop((season, week), None)
+        if rows is None:
+            raise KeyError(f"Week {week} of {season} has not been ingested")
+        pos = self._positions(rows)
+        self._apply(rows, pos, -1)
+        self._reread_attributes(self._clear_attributes(pos, week))
+        return self._refresh([self._index[pos]])
+
+    def _positions(self, rows: pd.DataFrame) -> np.ndarray:
+        """Index position of each row's player-season, adding the ones not held yet."""
+        keys = pd.MultiIndex.from_frame(rows[self.KEY])
+        pos = self._index.get_indexer(keys)
+        if (pos < 0).any():
+            self._insert(keys[pos < 0].unique())
+            pos = self._index.get_indexer(keys)
+        return pos
+
+    def _insert(self, keys: pd.MultiIndex) -> None:
+        """Add empty player-seasons for `keys`, keeping the index sorted."""
+        index = self._index.append(keys).sort_values()
+        old = index.get_indexer(self._index)
+        self._attrs = self._attrs.reindex(index)
+        for store, fill in ((self._sums, 0), (self._rates, np.nan), (self._attr_weeks, np.nan)):
+            for col, values in store.items():
+                grown = np.full(len(index), fill, dtype=values.dtype)
+                grown[old] = values
+                store[col] = grown
+        self._index = index
+
+    def _apply(self, rows: pd.DataFrame, pos: np.ndarray, sign: int) -> None:
+        """Add (sign=1) or subtract (sign=-1) one week's rows into the totals at `pos`."""
+        for col, values in self._sums.items():
+            if col == "games_played":
+                delta = rows["week"].notna().to_numpy().astype(values.dtype)
+            else:
+                delta = rows[col].to_numpy(dtype=values.dtype, na_value=0)
+            np.add.at(values, pos, sign * delta)
+
+    def _refresh(self, changed: list) -> dict:
+        """Drop emptied player-seasons; recompute rate stats of the rest."""
+        keys = changed[0].append(changed[1:]).unique() if changed else self._index[:0]
+        gone = self._sums["games_played"] == 0
+        if gone.any():
+            keep = ~gone
+            keys = keys.difference(self._index[gone])
+            self._index = self._index[keep]
+            self._attrs = self._attrs[keep]
+            for store in (self._sums, self._rates, self._attr_weeks):
+                for col, values in store.items():
+                    store[col] = values[keep]
+        if len(keys):
+            pos = self._index.get_indexer(keys)
+            rates = _rate_stats(pd.DataFrame({col: values[pos]
+                                              for col, values in self._sums.items()}))
+            for col, values in rates.items():
+                self._rates[col][pos] = values
+        return {"player_seasons": len(keys), "removed": int(gone.sum())}
+
+    def _merge_attributes(self, rows: pd.DataFrame, pos: np.ndarray) -> None:
+        """Fold rows' first/last non-missing attributes (in row order) into the held ones.
+
+        A row's value replaces the held one when its week comes before it
+        (first) or after it (last), or when nothing is held.
+        """
+        week = rows["week"].to_numpy(dtype=float, na_value=np.nan)
+        for name, (col, how) in SEASONAL_ATTRS.items():
+            present = np.flatnonzero(rows[col].notna().to_numpy())
+            if how == "last":
+                present = present[::-1]
+            _, first = np.unique(pos[present], return_index=True)
+            found = present[first]
+            target, found_week = pos[found], week[found]
+            held = self._attr_weeks[name][target]
+            later = found_week < held if how == "first" else found_week > held
+            take = np.isnan(held) | later
+            if take.any():
+                values = rows[col].array.take(found[take])
+                self._set_attribute(name, target[take], values, found_week[take])
+
+    def _clear_attributes(self, pos: np.ndarray, week: int) -> pd.MultiIndex:
+        """Blank the attributes at `pos` taken from `week`; returns the keys blanked."""
+        pos = np.unique(pos)
+        blanked = np.zeros(len(self._index), dtype=bool)
+        for name in SEASONAL_ATTRS:
+            held = pos[self._attr_weeks[name][pos] == week]
+            if len(held):
+                self._set_attribute(name, held, [None] * len(held), np.nan)
+                blanked[held] = True
+        return self._index[blanked]
+
+    def _reread_attributes(self, keys: pd.MultiIndex) -> None:
+        """Fill attributes of `keys` still blank after a removal from their stored rows."""
+        pos = self._index.get_indexer(keys)
+        blank = np.column_stack([np.isnan(self._attr_weeks[name][pos]) for name in SEASONAL_ATTRS])
+        keys = keys[blank.any(axis=1)]
+        seasons = set(keys.get_level_values("season"))
+        stored = [rows for (season, _), rows in sorted(self._weeks.items()) if season in seasons]
+        if not stored:
+            return
+        rows = pd.concat(stored)
+        pos = self._index.get_indexer(pd.MultiIndex.from_frame(rows[self.KEY]))
+        held = np.isin(pos, self._index.get_indexer(keys))
+        self._merge_attributes(rows[held], pos[held])
+
+    def _set_attribute(self, name: str, pos: np.ndarray, values, weeks) -> None:
+        """Write attribute values (and the weeks they came from) at row positions."""
+        column = self._attrs[name].copy()
+        values = np.asarray(values, dtype=object)
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            unseen = pd.unique(values[pd.notna(values)])
+            column = column.cat.add_categories(
+                [v for v in unseen if v not in column.cat.categories])
+        column.iloc[pos] = values
+        self._attrs[name] = column
+        self._attr_weeks[name][pos] = weeks
+
+
+def _as_crosswalk(pfr_to_gsis) -> IdCrosswalk:
+    """Accept an IdCrosswalk (keys.load_crosswalk) or a gsis_id/pfr_id frame."""
+    if isinstance(pfr_to_gsis, IdCrosswalk):
+        return pfr_to_gsis
+    return IdCrosswalk.from_pairs(pfr_to_gsis)
+
+
+def _map_pfr_ids(pfr_ids: pd.Series, pfr_to_gsis) -> pd.DataFrame:
+    """gsis_id and pfr_id for each pfr id (missing where unmapped).
+
+    The crosswalk is looked up directly. A gsis_id/pfr_id frame with unique
+    pfr ids is looked up through a KeyDictionary of its pfr ids; building a
+    full IdCrosswalk from it on every call costs more than the joins it
+    serves. Frames with repeated pfr ids go through one, where the first
+    claim wins.
+    """
+    if not isinstance(pfr_to_gsis, IdCrosswalk):
+        table = pfr_to_gsis[["gsis_id", "pfr_id"]].reset_index(drop=True)
+        pfr_keys = KeyDictionary(table["pfr_id"])
+        pos = _lookup_rows(pfr_keys.encode(pfr_ids).astype(np.int64),
+                           pfr_keys.encode(table["pfr_id"]).astype(np.int64))
+        if pos is not None:
+            return _take_rows(table, pos, pfr_ids.index)
+    crosswalk = _as_crosswalk(pfr_to_gsis)
+    ids = crosswalk.table[["gsis_id", "pfr_id"]].reindex(crosswalk.rows("pfr_id", pfr_ids))
+    ids.index = pfr_ids.index
+    return ids
+
+
+def _lookup_rows(left_keys: np.ndarray, right_keys: np.ndarray):
+    """Row of right_keys matching each left key (-1 if none); None if right keys repeat."""
+    valid = np.flatnonzero(right_keys != MISSING)
+    if len(valid) == 0:
+        return np.full(len(left_keys), -1)
+    index = pd.Index(right_keys[valid])
+    if not index.is_unique:
+        return None
+    pos = index.get_indexer(left_keys)
+    return np.where((pos >= 0) & (left_keys != MISSING), valid[np.maximum(pos, 0)], -1)
+
+
+def _take_rows(right: pd.DataFrame, pos: np.ndarray, index: pd.Index) -> pd.DataFrame:
+    """Rows of right at pos (all-missing where pos is -1), aligned to index."""
+    out = right.reset_index(drop=True).reindex(pos)
+    out.index = index
+    return out
+
+
+def _join_on_keys(df, row_keys, right, right_keys, suffix: str = None):
+    """Left-join right's columns onto df by precomputed integer keys.
+
+    Overlapping column names get `suffix`. Returns None when that isn't
+    possible (right keys repeat, or overlap without a suffix) so the caller
+    can fall back to DataFrame.merge.
+    """
+    pos = _lookup_rows(row_keys, right_keys)
+    overlap = [c for c in right.columns if c in df.columns]
+    if pos is None or (overlap and not suffix):
+        return None
+    taken = _take_rows(right, pos, df.index).rename(columns={c: c + suffix for c in overlap})
+    return pd.concat([df, taken], axis=1)
+
+
+def aggregate_snap_counts(snaps: pd.DataFrame, pfr_to_gsis: IdCrosswalk) -> pd.DataFrame:
+    """Aggregate snap counts to seasonal totals and map to gsis_id.
+
+    `pfr_to_gsis` is the id crosswalk from keys.load_crosswalk() (a
+    gsis_id/pfr_id frame also works).
+    """
+    # Group on one integer key per (pfr_player_id, season); pfr codes follow
+    # sorted id order so rows come out in the same order as a string groupby
+    codes, pfr_ids = pd.factorize(snaps["pfr_player_id"], sort=True)
+    keys = season_key(codes, snaps["season"])
+    valid = (keys != MISSING) & snaps["season"].notna().to_numpy()
+    seasonal_snaps = snaps[valid].groupby(keys[valid]).agg(
         total_offense_snaps=("offense_snaps", "sum"),
         total_defense_snaps=("defense_snaps", "sum"),
         total_st_snaps=("st_snaps", "sum"),
         snap_games=("game_id", "count"),
-    ).reset_index()
+    )
+    group_keys = seasonal_snaps.index.to_numpy()
+    seasonal_snaps = seasonal_snaps.reset_index(drop=True)
+    seasonal_snaps.insert(0, "pfr_player_id", pfr_ids.take(group_keys // 10_000))
+    seasonal_snaps.insert(1, "season", pd.array(group_keys % 10_000).astype(snaps["season"].dtype))
 
     seasonal_snaps["total_snaps"] = (
         seasonal_snaps["total_offense_snaps"]
@@ -146,14 +578,25 @@ def aggregate_snap_counts(snaps: pd.DataFrame, pfr_to_gsis: pd.DataFrame) -> pd.
     )
 
     # Map pfr_id to gsis_id
-    seasonal_snaps = seasonal_snaps.merge(
-        pfr_to_gsis, left_on="pfr_player_id", right_on="pfr_id", how="left"
-    )
-    return seasonal_snaps
+    return pd.concat([seasonal_snaps, _map_pfr_ids(seasonal_snaps["pfr_player_id"], pfr_to_gsis)],
+                     axis=1)
+
+
+# Contract columns carried into the merged dataset, and their merged names
+CONTRACT_COLS = [
+    "gsis_id", "season", "player", "position", "team",
+    "apy_cap_pct", "apy", "value", "guaranteed", "years",
+    "year_signed", "contract_type",
+]
+CONTRACT_RENAME = {
+    "player": "contract_player_name",
+    "position": "contract_position",
+    "team": "contract_team",
+}
 
 
-def prepare_contracts(contracts: pd.DataFrame) -> pd.DataFrame:
-    """Clean contracts data and extract per-season salary info."""
+def _clean_contracts(contracts: pd.DataFrame) -> pd.DataFrame:
+    """Drop unusable contracts and add each one's contract_end_year."""
     df = contracts.copy()
 
     # Keep rows with valid gsis_id and salary info
@@ -164,74 +607,170 @@ def prepare_contracts(contracts: pd.DataFrame) -> pd.DataFrame:
     # We'll match contracts to seasons by checking if the season falls within the contract window
     df["year_signed"] = df["year_signed"].astype(int)
     df["contract_end_year"] = df["year_signed"] + df["years"].fillna(1).astype(int) - 1
+    return df
 
-    # Explode to one row per season the contract covers
-    rows = []
-    for _, row in df.iterrows():
-        for season in range(row["year_signed"], row["contract_end_year"] + 1):
-            new_row = row.copy()
-            new_row["season"] = season
-            rows.append(new_row)
 
-    if not rows:
-        return pd.DataFrame()
+def _contract_type(df: pd.DataFrame) -> np.ndarray:
+    """Flag rookie-scale vs veteran deals."""
+    return np.where(
+        df["years"].fillna(1) <= 4,
+        np.where(df["apy_cap_pct"] < 0.02, "rookie", "veteran"),
+        "veteran",
+    )
+
+
+def prepare_contracts(contracts: pd.DataFrame) -> pd.DataFrame:
+    """Clean contracts data and extract per-season salary info."""
+    df = _clean_contracts(contracts)
 
-    expanded = pd.DataFrame(rows)
+    # Expand to one row per season the contract covers: repeat each contract
+    # once per covered season and offset year_signed by its position in the run.
+    # Seasons outside our range are dropped before any rows are materialized.
+    n_seasons = (df["contract_end_year"] - df["year_signed"] + 1).clip(lower=0).to_numpy()
+    if n_seasons.sum() == 0:
+        return pd.DataFrame()
+    positions = np.repeat(np.arange(len(df)), n_seasons)
+    offsets = np.arange(len(positions)) - np.repeat(np.cumsum(n_seasons) - n_seasons, n_seasons)
+    seasons = df["year_signed"].to_numpy()[positions] + offsets
 
     # Keep only seasons in our range
-    expanded = expanded[expanded["season"].isin(range(2015, 2025))]
+    in_range = (seasons >= 2015) & (seasons <= 2024)
+    expanded = df.iloc[positions[in_range]].assign(season=seasons[in_range])
 
-    # If multiple contracts cover the same season, keep the one signed most recently
-    expanded = expanded.sort_values("year_signed", ascending=False)
+    # If multiple contracts cover the same season, keep the one signed most
+    # recently (ties go to the contract listed first, as in match_contracts)
+    expanded = expanded.sort_values("year_signed", ascending=False, kind="stable")
     expanded = expanded.drop_duplicates(subset=["gsis_id", "season"], keep="first")
 
     # Flag contract type
-    expanded["contract_type"] = np.where(
-        expanded["years"].fillna(1) <= 4,
-        np.where(expanded["apy_cap_pct"] < 0.02, "rookie", "veteran"),
-        "veteran",
-    )
+    expanded["contract_type"] = _contract_type(expanded)
 
-    keep_cols = [
-        "gsis_id", "season", "player", "position", "team",
-        "apy_cap_pct", "apy", "value", "guaranteed", "years",
-        "year_signed", "contract_type",
-    ]
-    keep_cols = [c for c in keep_cols if c in expanded.columns]
-    return expanded[keep_cols].rename(columns={
-        "player": "contract_player_name",
-        "position": "contract_position",
-        "team": "contract_team",
-    })
+    keep_cols = [c for c in CONTRACT_COLS if c in expanded.columns]
+    return expanded[keep_cols].rename(columns=CONTRACT_RENAME)
 
 
-def build_defensive_players(
-    pfr_def: pd.DataFrame,
-    pfr_to_gsis: pd.DataFrame,
-    players: pd.DataFrame,
+def prepare_contract_windows(contracts: pd.DataFrame) -> pd.DataFrame:
+    """Clean contracts into one row per contract with its covered season window.
+
+    The un-exploded counterpart of prepare_contracts: pass it to merge_all (or
+    match_contracts) to join each player-season to the contract covering it
+    without materializing a row per covered season.
+    """
+    df = _clean_contracts(contracts)
+    df["contract_type"] = _contract_type(df)
+    keep_cols = [c for c in CONTRACT_COLS if c in df.columns and c != "season"]
+    return df[keep_cols + ["contract_end_year"]].rename(columns=CONTRACT_RENAME).reset_index(drop=True)
+
+
+def match_contracts(
+    keys: pd.DataFrame,
+    windows: pd.DataFrame,
+    player_col: str = "player_id",
+    season_col: str = "season",
 ) -> pd.DataFrame:
-    """Build defensive player-season records from PFR data (not in weekly stats)."""
+    """Interval join: the most recently signed contract covering each player-season.
+
+    Contracts are sorted by (player, year_signed), so the candidates for a
+    query are the run of that player's contracts signed on or before the
+    season; a binary search finds the latest one and the search steps back
+    through earlier signings until one's window still covers the season.
+    That handles extensions and restructures that overlap an older deal.
+    Ties on year_signed go to the contract listed first in `windows`.
+
+    Returns the contract columns (no season) aligned to keys.index, with
+    missing values where no contract covers the player-season.
+    """
+    codes, _ = pd.factorize(pd.concat(
+        [windows["gsis_id"], keys[player_col]], ignore_index=True
+    ))
+    contract_player = codes[:len(windows)]
+    query_player = codes[len(windows):]
+
+    start = windows["year_signed"].to_numpy(dtype=np.int64)
+    end = windows["contract_end_year"].to_numpy(dtype=np.int64)
+    listed = np.arange(len(windows))
+    # Within a player and year_signed, the first-listed contract sorts last
+    order = np.lexsort((-listed, start, contract_player))
+    sorted_player = contract_player[order]
+    sorted_start = start[order]
+    sorted_end = end[order]
+
+    season = pd.to_numeric(keys[season_col], errors="coerce").fillna(-1).to_numpy(dtype=np.int64)
+    # One sortable key per (player, year): player-major, year-minor
+    span = max(int(sorted_start.max(initial=0)), int(season.max(initial=0))) + 1
+    pos = np.searchsorted(sorted_player * span + sorted_start,
+                          query_player * span + season, side="right") - 1
+
+    match = np.full(len(keys), -1, dtype=np.int64)
+    pending = np.flatnonzero((query_player >= 0) & (pos >= 0))
+    pos = pos[pending]
+    while len(pending):
+        # Candidates that ran into another player's contracts have no match
+        same_player = sorted_player[pos] == query_player[pending]
+        pending, pos = pending[same_player], pos[same_player]
+        covers = sorted_end[pos] >= season[pending]
+        match[pending[covers]] = order[pos[covers]]
+        pending, pos = pending[~covers], pos[~covers] - 1
+        in_bounds = pos >= 0
+        pending, pos = pending[in_bounds], pos[in_bounds]
+
+    matched = windows.drop(columns=["contract_end_year"]).reindex(match)
+    matched.index = keys.index
+    return matched
+
+
+# PFR defensive columns -> analysis column names
+PFR_DEF_COL_MAP = {
+    "sk": "def_sacks", "int": "def_ints", "comb": "def_tackles",
+    "prss": "def_pressures", "qbkd": "def_qb_hits",
+    "m_tkl": "def_missed_tackles", "bltz": "def_blitzes",
+}
+
+
+def build_defensive_stats(pfr_def: pd.DataFrame, pfr_to_gsis: IdCrosswalk) -> pd.DataFrame:
+    """Canonical defensive player-season table, one row per gsis_id + season.
+
+    PFR defense is mapped to gsis_id and its stat columns renamed via
+    PFR_DEF_COL_MAP exactly once; the PFR player/pos/g/tm columns are kept
+    for build_defensive_players. The first row wins if two pfr_ids map to
+    the same player-season.
+    """
     if pfr_def is None or pfr_to_gsis is None:
         return pd.DataFrame()
 
-    df = pfr_def.merge(pfr_to_gsis, on="pfr_id", how="left")
+    df = pfr_def.assign(gsis_id=_map_pfr_ids(pfr_def["pfr_id"], pfr_to_gsis)["gsis_id"])
     df = df.dropna(subset=["gsis_id"])
+    df = df.drop_duplicates(subset=["gsis_id", "season"])
+
+    stats = df[["gsis_id", "season"] + [c for c in ["player", "pos", "g", "tm"] if c in df.columns]]
+    stats = stats.assign(**{
+        dst: pd.to_numeric(df[src], errors="coerce")
+        for src, dst in PFR_DEF_COL_MAP.items() if src in df.columns
+    })
+    return stats.reset_index(drop=True)
 
-    # Map PFR def columns to friendly names
-    pfr_col_map = {
-        "sk": "def_sacks", "int": "def_ints", "comb": "def_tackles",
-        "prss": "def_pressures", "qbkd": "def_qb_hits",
-        "m_tkl": "def_missed_tackles", "bltz": "def_blitzes",
-    }
-    for src, dst in pfr_col_map.items():
-        if src in df.columns:
-            df[dst] = pd.to_numeric(df[src], errors="coerce")
+
+def build_defensive_players(
+    pfr_def: pd.DataFrame,
+    pfr_to_gsis: IdCrosswalk,
+    players: pd.DataFrame,
+    def_stats: pd.DataFrame = None,
+) -> pd.DataFrame:
+    """Build defensive player-season records from PFR data (not in weekly stats).
+
+    Pass `def_stats` (from build_defensive_stats) to reuse an already built
+    defensive table instead of re-mapping pfr_def.
+    """
+    if def_stats is None:
+        if pfr_def is None or pfr_to_gsis is None:
+            return pd.DataFrame()
+        def_stats = build_defensive_stats(pfr_def, pfr_to_gsis)
 
     # Get player names and positions from players table
     player_info = players[["gsis_id", "display_name", "position"]].dropna(subset=["gsis_id"])
     player_info = player_info.drop_duplicates(subset=["gsis_id"])
 
-    df = df.merge(player_info, on="gsis_id", how="left")
+    df = def_stats.merge(player_info, on="gsis_id", how="left")
 
     # Use PFR 'pos' if available, fallback to players table
     if "pos" in df.columns:
@@ -241,11 +780,11 @@ def build_defensive_players(
     # Build standardized records
     records = df[["gsis_id", "season", "player_name", "position"]].copy()
     records = records.rename(columns={"gsis_id": "player_id"})
-    records["position_group"] = records["position"].apply(classify_position)
+    records["position_group"] = classify_positions(records["position"])
     records["games_played"] = pd.to_numeric(df.get("g", 0), errors="coerce").fillna(0).astype(int)
 
     # Attach def stats
-    for dst in pfr_col_map.values():
+    for dst in PFR_DEF_COL_MAP.values():
         if dst in df.columns:
             records[dst] = df[dst].values
 
@@ -261,48 +800,89 @@ def merge_all(
     contracts: pd.DataFrame,
     snap_counts: pd.DataFrame,
     pfr_def: pd.DataFrame = None,
-    pfr_to_gsis: pd.DataFrame = None,
+    pfr_to_gsis: IdCrosswalk = None,
     players: pd.DataFrame = None,
+    player_keys: KeyDictionary = None,
 ) -> pd.DataFrame:
-    """Merge seasonal stats with contracts, snap counts, and defensive stats."""
-    df = seasonal_stats.copy()
+    """Merge seasonal stats with contracts, snap counts, and defensive stats.
+
+    `contracts` is either prepare_contracts output (one row per season) or
+    prepare_contract_windows output (one row per contract, interval-joined).
+    `pfr_to_gsis` is the keys.load_crosswalk() crosswalk. Joins run on
+    integer (player key, season) codes from `player_keys` (a fresh
+    dictionary if omitted). Ids it lacks are coded in a copy, so the
+    caller's dictionary is not extended.
+    """
+    df = seasonal_stats.copy().reset_index(drop=True)
+    player_keys = KeyDictionary() if player_keys is None else player_keys.copy()
+
+    def keys_for(frame, id_col):
+        return season_key(player_keys.encode(frame[id_col], add=True), frame["season"])
+
+    # pos_group is classified once, after the defensive append, and placed
+    # where the stats had it (or after the stats columns)
+    pos_group_at = df.columns.get_loc("pos_group") if "pos_group" in df.columns else len(df.columns)
+    df = df.drop(columns=["pos_group"], errors="ignore")
+
+    # Defensive player-season table, built once and shared by the append and the join
+    def_stats = None
+    if pfr_def is not None and pfr_to_gsis is not None:
+        def_stats = build_defensive_stats(pfr_def, pfr_to_gsis)
+    def_cols = [c for c in PFR_DEF_COL_MAP.values()
+                if def_stats is not None and c in def_stats.columns and c not in df.columns]
 
-    # Classify positions
-    df["pos_group"] = df["position"].apply(classify_position)
+    row_keys = keys_for(df, "player_id")
 
     # Build defensive player records and append them
-    if pfr_def is not None and pfr_to_gsis is not None and players is not None:
-        def_players = build_defensive_players(pfr_def, pfr_to_gsis, players)
+    if def_stats is not None and players is not None:
+        def_players = build_defensive_players(pfr_def, pfr_to_gsis, players, def_stats=def_stats)
         if len(def_players) > 0:
-            # Only add defensive players NOT already in the stats (by player_id + season)
-            existing_keys = set(zip(df["player_id"], df["season"]))
-            mask = [
-                (pid, s) not in existing_keys
-                for pid, s in zip(def_players["player_id"], def_players["season"])
-            ]
-            new_def = def_players[mask].copy()
-            # Ensure columns align (add missing cols as NaN)
-            for col in df.columns:
-                if col not in new_def.columns:
-                    new_def[col] = np.nan
-            new_def = new_def[df.columns.tolist() + [c for c in new_def.columns if c not in df.columns]]
+            # Only add defensive players NOT already in the stats (anti-join on player_id + season)
+            def_keys = keys_for(def_players, "player_id")
+            is_new = ~np.isin(def_keys, row_keys)
+            new_def = def_players[is_new]
+            # Ensure columns align (missing cols as NaN) in one reindex; def stats are joined below
+            new_def = new_def.reindex(
+                columns=df.columns.tolist()
+                + [c for c in new_def.columns if c not in df.columns and c not in def_cols]
+            )
             df = pd.concat([df, new_def], ignore_index=True, sort=False)
-            # Re-classify positions for new rows
-            df["pos_group"] = df["position"].apply(classify_position)
+            row_keys = np.concatenate([row_keys, def_keys[is_new]])
 
-    # Merge contracts
-    df = df.merge(
-        contracts,
-        left_on=["player_id", "season"],
-        right_on=["gsis_id", "season"],
-        how="left",
-    )
+    # Classify positions
+    df.insert(pos_group_at, "pos_group", classify_positions(df["position"], report_unknown=True))
+
+    # Join defensive stats once, for appended defensive players and for
+    # offensive player-seasons that also have PFR defensive stats
+    if def_cols:
+        df = _join_on_keys(df, row_keys, def_stats[def_cols], keys_for(def_stats, "gsis_id"))
+
+    # Merge contracts: per-contract windows are interval-joined directly,
+    # per-season rows from prepare_contracts are joined on the key
+    if "contract_end_year" in contracts.columns:
+        df = pd.concat([df, match_contracts(df, contracts)], axis=1)
+    else:
+        joined = _join_on_keys(df, row_keys, contracts.drop(columns=["season"]),
+                               keys_for(contracts, "gsis_id"))
+        if joined is not None:
+            df = joined
+        else:
+            df = df.merge(
+                contracts,
+                left_on=["player_id", "season"],
+                right_on=["gsis_id", "season"],
+                how="left",
+            )
+            # Repeated contract keys fan rows out; re-key the merged rows
+            row_keys = keys_for(df, "player_id")
 
     # Merge snap counts
     snap_cols = ["gsis_id", "season", "total_offense_snaps", "total_defense_snaps",
                  "total_st_snaps", "total_snaps", "snap_games"]
     snap_cols = [c for c in snap_cols if c in snap_counts.columns]
-    df = df.merge(
+    joined = _join_on_keys(df, row_keys, snap_counts[snap_cols].drop(columns=["season"]),
+                           keys_for(snap_counts, "gsis_id"), suffix="_snap")
+    df = joined if joined is not None else df.merge(
         snap_counts[snap_cols],
         left_on=["player_id", "season"],
         right_on=["gsis_id", "season"],
@@ -310,42 +890,6 @@ def merge_all(
         suffixes=("", "_snap"),
     )
 
-    # For offensive players, also merge PFR defensive stats (some LBs/DBs have offensive stats too)
-    if pfr_def is not None and pfr_to_gsis is not None:
-        pfr_def_with_gsis = pfr_def.merge(pfr_to_gsis, on="pfr_id", how="left")
-        def_merge_cols = ["gsis_id", "season"]
-        pfr_col_map = {
-            "sk": "def_sacks", "int": "def_ints", "comb": "def_tackles",
-            "prss": "def_pressures", "qbkd": "def_qb_hits",
-            "m_tkl": "def_missed_tackles", "bltz": "def_blitzes",
-        }
-        for src, dst in pfr_col_map.items():
-            if src in pfr_def_with_gsis.columns:
-                if dst not in df.columns:
-                    pfr_def_with_gsis[dst] = pd.to_numeric(pfr_def_with_gsis[src], errors="coerce")
-                    def_merge_cols.append(dst)
-
-        if len(def_merge_cols) > 2:
-            pfr_def_with_gsis = pfr_def_with_gsis[def_merge_cols].dropna(subset=["gsis_id"])
-            # Only merge for rows that don't already have def stats
-            needs_def = df["def_sacks"].isna() if "def_sacks" in df.columns else pd.Series(True, index=df.index)
-            df_needs = df[needs_def]
-            df_has = df[~needs_def]
-
-            if len(df_needs) > 0:
-                df_needs = df_needs.drop(
-                    columns=[c for c in def_merge_cols if c != "gsis_id" and c != "season" and c in df_needs.columns],
-                    errors="ignore",
-                )
-                df_needs = df_needs.merge(
-                    pfr_def_with_gsis,
-                    left_on=["player_id", "season"],
-                    right_on=["gsis_id", "season"],
-                    how="left",
-                    suffixes=("", "_def"),
-                )
-                df = pd.concat([df_has, df_needs], ignore_index=True, sort=False)
-
     # Apply minimum snap threshold
     df["has_salary"] = df["apy_cap_pct"].notna()
     df["meets_snap_threshold"] = df["total_snaps"].fillna(0) >= MIN_SNAPS
@@ -1,113 +1,1170 @@
-"""Fetch and cache NFL data from nfl_data_py to local parquet files."""
+"""Fetch NFL data (nfl_data_py or a local mirror) and cache it to local parquet files."""
 
+import argparse
+import hashlib
+import json
 import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
 from pathlib import Path
 
-import nfl_data_py as nfl
+import fastparquet
 import pandas as pd
+from fastparquet.api import filter_row_groups
+
+from .sources import LocalMirrorSource, NflDataPySource
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.feather as feather
+except ImportError:  # pyarrow is only needed for the Arrow IPC cache backend
+    pa = None
 
 DATA_DIR = Path(__file__).resolve().parent.parent / "data"
 
 YEARS = list(range(2015, 2025))
 PFR_YEARS = list(range(2018, 2025))  # PFR data only available 2018+
+PFR_STAT_TYPES = ["pass", "rush", "rec", "def"]
+
+CURRENT_SEASON = YEARS[-1]
+
+# Datasets cached as one parquet partition per season, with the seasons they cover
+SEASON_RANGES = {
+    "weekly_stats": YEARS,
+    "rosters": YEARS,
+    "snap_counts": YEARS,
+    "pfr_pass": PFR_YEARS,
+    "pfr_rush": PFR_YEARS,
+    "pfr_rec": PFR_YEARS,
+    "pfr_def": PFR_YEARS,
+}
+
+# Where raw data comes from. Defaults to nfl_data_py; set NFL_DATA_MIRROR (or
+# call set_source) to rebuild caches from a local mirror with no network.
+SOURCE = (
+    LocalMirrorSource(os.environ["NFL_DATA_MIRROR"])
+    if os.environ.get("NFL_DATA_MIRROR")
+    else NflDataPySource()
+)
+
+
+def set_source(source) -> None:
+    """Use `source` (anything with fetch(dataset, seasons=None)) for fetches."""
+    global SOURCE
+    SOURCE = source
+
+
+def _source_fetcher(name: str):
+    # Look SOURCE up at call time so set_source applies to existing fetchers
+    if name in SEASON_RANGES:
+        return lambda seasons: SOURCE.fetch(name, seasons)
+    return lambda: SOURCE.fetch(name)
+
+
+# Fetch function for every cached dataset, in load_all order. Season-partitioned
+# datasets take the list of seasons to fetch; the rest take no arguments.
+FETCHERS = {
+    name: _source_fetcher(name)
+    for name in ["weekly_stats", "rosters", "contracts", "snap_counts", "players", "ids",
+                 "pfr_pass", "pfr_rush", "pfr_rec", "pfr_def"]
+}
+
+
+# Bytes and rows touched by the most recent cached read of each dataset
+READ_STATS = {}
+
+# Cache backend per dataset: "parquet" (default) or "arrow". The arrow backend
+# keeps an Arrow IPC (Feather v2) copy next to each parquet file and reads it
+# memory-mapped, so concurrent readers share page-cache pages instead of each
+# decoding a private copy. Use "uncompressed" for zero-copy reads; "lz4" trades
+# that for smaller files.
+CACHE_BACKENDS = {}
+ARROW_COMPRESSION = {}
+
+
+# Process-wide memo of loaded frames keyed by (dataset, columns, filters,
+# backend, file mtimes/sizes), evicted least-recently-used past the budget
+REGISTRY_BUDGET_BYTES = 2 * 1024 ** 3
+_REGISTRY = OrderedDict()
+_REGISTRY_LOCK = threading.Lock()
+# Memo hits can be handed out as shallow copies only under copy-on-write,
+# which is always on from pandas 3; older pandas gets deep copies
+_SHALLOW_HITS = int(pd.__version__.split(".")[0]) >= 3
+
+
+def set_registry_budget(budget_bytes: int) -> None:
+    """Set the in-memory registry budget, evicting old entries to fit."""
+    global REGISTRY_BUDGET_BYTES
+    REGISTRY_BUDGET_BYTES = budget_bytes
+    with _REGISTRY_LOCK:
+        _evict_to_budget()
+
+
+def clear_registry() -> None:
+    """Drop every memoized frame."""
+    with _REGISTRY_LOCK:
+        _REGISTRY.clear()
+
+
+def registry_info() -> pd.DataFrame:
+    """One row per memoized frame, most recently used last."""
+    rows = [
+        {"dataset": key[0], "columns": key[1], "filters": key[2], "bytes": nbytes, "rows": len(df)}
+        for key, (df, nbytes) in _REGISTRY.items()
+    ]
+    return pd.DataFrame(rows, columns=["dataset", "columns", "filters", "bytes", "rows"])
+
+
+def _evict_to_budget() -> None:
+    total = sum(nbytes for _, nbytes in _REGISTRY.values())
+    while _REGISTRY and total > REGISTRY_BUDGET_BYTES:
+        _, (_, nbytes) = _REGISTRY.popitem(last=False)
+        total -= nbytes
+
+
+def _registry_key(name: str, files: list, columns: list, filters: dict) -> tuple:
+    stamps = []
+    for path in files:
+        stat = path.stat()
+        stamps.append((str(path), stat.st_mtime_ns, stat.st_size))
+    frozen_filters = tuple(sorted(
+        (col, tuple(values)) for col, _, values in _filter_conditions(filters)
+    ))
+    return (
+        name,
+        tuple(columns) if columns is not None else None,
+        frozen_filters,
+        CACHE_BACKENDS.get(name, "parquet"),
+        tuple(stamps),
+    )
+
+
+# Per-dataset staleness TTL in seconds. Expired files are refetched on the next
+# load; partitions for seasons before CURRENT_SEASON are final and never expire.
+CACHE_TTL = {}
+_MANIFEST_LOCK = threading.Lock()
+
+
+def set_cache_ttl(name: str, seconds: float) -> None:
+    """Refetch a dataset's cache files once they are older than `seconds`."""
+    CACHE_TTL[name] = seconds
+
+
+def _data_dir(data_dir: Path = None) -> Path:
+    """`data_dir` if given, else the current DATA_DIR.
+
+    The cache writers take an explicit directory so other caches (e.g.
+    synthetic data) can be written without repointing DATA_DIR.
+    """
+    return DATA_DIR if data_dir is None else Path(data_dir)
+
+
+def _manifest_path(data_dir: Path = None) -> Path:
+    return _data_dir(data_dir) / "manifest.json"
+
+
+def atomic_write(path: Path, write_fn) -> None:
+    """Write via a temp file in the same directory, then rename into place.
+
+    `write_fn(tmp_path)` writes the file's contents to the path it is given.
+    A crash mid-write leaves only the temp file behind, never a truncated
+    cache file under the real name. Used for every file under DATA_DIR,
+    including the id crosswalk in keys.py.
+    """
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        write_fn(tmp)
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+
+def _read_manifest(data_dir: Path = None) -> dict:
+    path = _manifest_path(data_dir)
+    if not path.exists():
+        return {"datasets": {}, "stages": {}}
+    with open(path) as f:
+        manifest = json.load(f)
+    manifest.setdefault("datasets", {})
+    manifest.setdefault("stages", {})
+    return manifest
+
+
+def _update_manifest(update_fn, data_dir: Path = None) -> None:
+    """Read-modify-write the manifest under a lock, written atomically."""
+    with _MANIFEST_LOCK:
+        manifest = _read_manifest(data_dir)
+        update_fn(manifest)
+        _data_dir(data_dir).mkdir(parents=True, exist_ok=True)
+
+        def write(tmp):
+            with open(tmp, "w") as f:
+                json.dump(manifest, f, indent=2, sort_keys=True)
+
+        atomic_write(_manifest_path(data_dir), write)
+
+
+def _file_hash(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _schema_hash(df: pd.DataFrame) -> str:
+    schema = [[str(col), str(dtype)] for col, dtype in df.dtypes.items()]
+    return hashlib.sha256(json.dumps(schema).encode()).hexdigest()
+
+
+def _record_write(name: str, df: pd.DataFrame, path: Path, data_dir: Path = None) -> None:
+    """Record a freshly written cache file in the manifest."""
+    stat = path.stat()
+    entry = {
+        "written_at": datetime.now(timezone.utc).isoformat(),
+        "rows": int(len(df)),
+        "cols": int(df.shape[1]),
+        "schema_hash": _schema_hash(df),
+        "content_hash": _file_hash(path),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+    }
+    key = path.relative_to(_data_dir(data_dir)).as_posix()
+    _update_manifest(
+        lambda m: m["datasets"].setdefault(name, {"files": {}})["files"].__setitem__(key, entry),
+        data_dir,
+    )
+
+
+def _file_entry(name: str, path: Path) -> dict:
+    """Manifest entry for a cache file, or None if missing or out of date."""
+    entry = _read_manifest()["datasets"].get(name, {}).get("files", {}).get(
+        path.relative_to(DATA_DIR).as_posix()
+    )
+    if entry is None:
+        return None
+    stat = path.stat()
+    if entry["size"] != stat.st_size or entry["mtime_ns"] != stat.st_mtime_ns:
+        return None  # file replaced outside data_loader
+    return entry
+
+
+def _is_expired(name: str, path: Path, season: int = None) -> bool:
+    """True if the dataset has a TTL and this cache file is older than it."""
+    ttl = CACHE_TTL.get(name)
+    if ttl is None or not path.exists():
+        return False
+    if season is not None and season < CURRENT_SEASON:
+        return False
+    entry = _file_entry(name, path)
+    if entry is not None:
+        written = datetime.fromisoformat(entry["written_at"]).timestamp()
+    else:
+        written = path.stat().st_mtime
+    return time.time() - written > ttl
+
+
+def dataset_fingerprint(name: str) -> str:
+    """Content hash over every cache file of a dataset (None if not cached).
+
+    Uses hashes stored in the manifest when they match the file on disk and
+    hashes the file otherwise (e.g. a parquet file written by a notebook).
+    """
+    if name in SEASON_RANGES:
+        files = [_partition_path(name, season) for season in _cached_seasons(name)]
+    else:
+        files = [_cache_path(name)] if _cache_path(name).exists() else []
+    if not files:
+        return None
+    digest = hashlib.sha256()
+    for path in files:
+        entry = _file_entry(name, path)
+        digest.update((entry["content_hash"] if entry else _file_hash(path)).encode())
+    return digest.hexdigest()
+
+
+def stage_is_current(stage: str, inputs: list) -> bool:
+    """True if `stage` last ran on exactly the current contents of `inputs`.
+
+    Lets a pipeline step (e.g. "analysis_ready" from weekly_stats, contracts,
+    ...) skip recomputation when none of its input datasets changed.
+    """
+    recorded = _read_manifest()["stages"].get(stage)
+    if recorded is None:
+        return False
+    current = {name: dataset_fingerprint(name) for name in inputs}
+    return None not in current.values() and recorded["inputs"] == current
+
+
+def record_stage(stage: str, inputs: list) -> None:
+    """Record the input fingerprints a stage just ran on."""
+    entry = {
+        "completed_at": datetime.now(timezone.utc).isoformat(),
+        "inputs": {name: dataset_fingerprint(name) for name in inputs},
+    }
+    _update_manifest(lambda m: m["stages"].__setitem__(stage, entry))
+
+
+def cache_status() -> pd.DataFrame:
+    """One row per manifest-tracked cache file with its age and TTL status."""
+    rows = []
+    now = time.time()
+    for name, dataset in _read_manifest()["datasets"].items():
+        for key, entry in dataset["files"].items():
+            age = now - datetime.fromisoformat(entry["written_at"]).timestamp()
+            path = DATA_DIR / key
+            season = int(path.parent.name.split("=", 1)[1]) if name in SEASON_RANGES else None
+            rows.append({
+                "dataset": name, "file": key, "rows": entry["rows"],
+                "age_hours": age / 3600, "content_hash": entry["content_hash"][:12],
+                "stale": _is_expired(name, path, season),
+            })
+    return pd.DataFrame(rows, columns=["dataset", "file", "rows", "age_hours", "content_hash", "stale"])
+
+
+def set_cache_backend(name: str, backend: str = "arrow", compression: str = "uncompressed") -> None:
+    """Select the cache backend ("parquet" or "arrow") for one dataset."""
+    if backend not in ("parquet", "arrow"):
+        raise ValueError(f"Unknown cache backend {backend!r}")
+    if backend == "arrow" and pa is None:
+        raise ImportError("The arrow cache backend requires pyarrow")
+    CACHE_BACKENDS[name] = backend
+    ARROW_COMPRESSION[name] = compression
+
+
+def _cache_path(name: str, data_dir: Path = None) -> Path:
+    return _data_dir(data_dir) / f"{name}.parquet"
+
+
+# Declared column types per dataset, applied in one pass when a cache file is
+# written. "category" columns are stored dictionary-encoded. Undeclared object
+# columns are parsed as numbers when every value is numeric and kept as
+# nullable strings otherwise; *_id columns are always strings.
+_TEAM_COLS = ["team", "recent_team", "opponent_team", "opponent", "tm", "draft_club", "draft_team"]
+_PFR_SCHEMA = {"int": ["season"], "category": ["tm", "team"]}
+
+SCHEMAS = {
+    "weekly_stats": {
+        "int": ["season", "week"],
+        "category": ["position", "position_group", "season_type"] + _TEAM_COLS,
+    },
+    "rosters": {
+        "int": ["season", "week", "years_exp", "entry_year", "rookie_year", "draft_number"],
+        "category": ["position", "depth_chart_position", "status", "game_type"] + _TEAM_COLS,
+    },
+    "contracts": {
+        "int": ["year_signed", "years", "draft_year", "draft_round", "draft_overall"],
+        "float": ["value", "apy", "guaranteed", "apy_cap_pct",
+                  "inflated_value", "inflated_apy", "inflated_guaranteed"],
+        "category": ["position"] + _TEAM_COLS,
+    },
+    "snap_counts": {
+        "int": ["season", "week", "offense_snaps", "defense_snaps", "st_snaps"],
+        "float": ["offense_pct", "defense_pct", "st_pct"],
+        "category": ["game_type", "position"] + _TEAM_COLS,
+    },
+    "players": {
+        "int": ["rookie_season", "draft_year", "draft_round", "draft_number", "entry_year"],
+        "category": ["position", "position_group", "status", "team_abbr"] + _TEAM_COLS,
+    },
+    "ids": {
+        "int": ["draft_year", "draft_round", "draft_pick", "draft_ovr", "db_season"],
+        "category": ["position"] + _TEAM_COLS,
+    },
+    "pfr_pass": _PFR_SCHEMA,
+    "pfr_rush": _PFR_SCHEMA,
+    "pfr_rec": _PFR_SCHEMA,
+    "pfr_def": {
+        "int": ["season"],
+        "float": ["age", "g", "gs", "int", "tgt", "cmp", "cmp_percent", "yds", "yds_cmp",
+                  "yds_tgt", "td", "rat", "dadot", "air", "yac", "bltz", "hrry", "qbkd",
+                  "sk", "prss", "comb", "m_tkl", "m_tkl_percent"],
+        "category": ["tm"],
+    },
+}
+
+
+def _coerce_column(col: str, series: pd.Series, kind: str) -> pd.Series:
+    """Convert one column to its declared (or inferred) storage type."""
+    if kind == "int":
+        return pd.to_numeric(series, errors="coerce").round().astype("Int32")
+    if kind == "float":
+        return pd.to_numeric(series, errors="coerce").astype("float64")
+    if kind == "category":
+        return series.astype("category")
+    if kind == "string":
+        return series.astype("string")
+    # Undeclared object column: numeric if every non-null value parses
+    if not col.endswith("_id"):
+        parsed = pd.to_numeric(series, errors="coerce")
+        if parsed.notna().sum() == series.notna().sum():
+            return parsed
+    return series.astype("string")
+
+
+def _apply_schema(name: str, df: pd.DataFrame) -> pd.DataFrame:
+    """Apply a dataset's declared schema in one pass before caching.
+
+    Numbers are parsed once here instead of in every downstream script,
+    low-cardinality columns are dictionary-encoded, and missing values stay
+    as real nulls rather than "nan"/"None" strings.
+    """
+    kinds = {}
+    for kind, cols in SCHEMAS.get(name, {}).items():
+        for col in cols:
+            kinds[col] = kind
+
+    columns = {}
+    for col in df.columns:
+        series = df[col]
+        kind = kinds.get(col)
+        is_text = series.dtype == object or pd.api.types.is_string_dtype(series.dtype)
+        if kind is None and not is_text:
+            columns[col] = series  # already numeric/bool/datetime, keep as-is
+        else:
+            columns[col] = _coerce_column(col, series, kind)
+    return pd.DataFrame(columns, index=df.index)
+
+
+def _partition_dir(name: str, data_dir: Path = None) -> Path:
+    return _data_dir(data_dir) / name
+
+
+def _partition_path(name: str, season: int, data_dir: Path = None) -> Path:
+    return _partition_dir(name, data_dir) / f"season={season}" / "part.parquet"
+
+
+def _cached_seasons(name: str) -> list:
+    """Seasons that have a cached partition for a season-partitioned dataset."""
+    root = _partition_dir(name)
+    if not root.is_dir():
+        return []
+    return sorted(
+        int(p.parent.name.split("=", 1)[1])
+        for p in root.glob("season=*/part.parquet")
+    )
+
+
+def _write_partitions(name: str, df: pd.DataFrame, data_dir: Path = None) -> list:
+    """Write one parquet file per season in df, replacing existing partitions."""
+    written = []
+    for season, part in df.groupby("season", sort=True):
+        path = _partition_path(name, int(season), data_dir)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _write_cache_file(name, part, path, data_dir)
+        written.append(int(season))
+    return written
+
 
+def _filter_conditions(filters: dict) -> list:
+    """Turn {"position": "TE", "season": [2023, 2024]} into fastparquet filters."""
+    conditions = []
+    for col, values in (filters or {}).items():
+        if isinstance(values, (str, int, float)):
+            values = [values]
+        conditions.append((col, "in", list(values)))
+    return conditions
 
-def _cache_path(name: str) -> Path:
-    return DATA_DIR / f"{name}.parquet"
 
+def _apply_filters(df: pd.DataFrame, filters: dict) -> pd.DataFrame:
+    """Keep rows matching every filter (column equals value or is in values)."""
+    if not filters:
+        return df
+    mask = pd.Series(True, index=df.index)
+    for col, _, values in _filter_conditions(filters):
+        mask &= df[col].isin(values)
+    return df[mask]
 
-def _sanitize_for_parquet(df: pd.DataFrame) -> pd.DataFrame:
-    """Fix mixed-type columns that fastparquet can't handle."""
-    out = df.copy()
-    for col in out.columns:
-        if out[col].dtype == object:
-            # Convert object columns to string, handling NaN
-            out[col] = out[col].astype(str).replace("nan", pd.NA).replace("None", pd.NA)
-    return out
 
+def _read_parquet(path: Path, columns: list = None, filters: dict = None) -> tuple:
+    """Read a cached parquet file with column projection and row filters.
+
+    Row groups whose statistics rule out the filters are skipped, only the
+    requested (plus filter) columns are decoded, and each row group is
+    filtered as it is read. Returns (df, stats) where stats counts the
+    compressed bytes and rows actually read.
+    """
+    pf = fastparquet.ParquetFile(str(path))
+    conditions = _filter_conditions(filters)
+    for col, _, _ in conditions:
+        if col not in pf.columns:
+            raise ValueError(f"{path.name} has no column {col!r} to filter on")
+
+    read_cols = None
+    if columns is not None:
+        read_cols = list(dict.fromkeys(list(columns) + [c for c, _, _ in conditions]))
+        read_cols = [c for c in read_cols if c in pf.columns]
+
+    row_groups = filter_row_groups(pf, conditions) if conditions else pf.row_groups
+    stats = {
+        "files": 1,
+        "bytes_read": sum(
+            chunk.meta_data.total_compressed_size
+            for rg in row_groups
+            for chunk in rg.columns
+            if read_cols is None or chunk.meta_data.path_in_schema[0] in read_cols
+        ),
+        "rows_read": sum(rg.num_rows for rg in row_groups),
+    }
+
+    if not conditions:
+        df = pf.to_pandas(columns=read_cols)
+    else:
+        chunks = [
+            _apply_filters(chunk, filters)
+            for chunk in pf.iter_row_groups(columns=read_cols, filters=conditions)
+        ]
+        if chunks:
+            df = pd.concat(chunks, ignore_index=True)
+        else:
+            df = pd.DataFrame(columns=read_cols or pf.columns)
+
+    if columns is not None:
+        df = df[[c for c in columns if c in df.columns]]
+    stats["rows_returned"] = len(df)
+    return df, stats
+
+
+def _arrow_path(path: Path) -> Path:
+    return path.with_suffix(".arrow")
+
+
+def _write_arrow(df: pd.DataFrame, path: Path, compression: str = "uncompressed") -> None:
+    # One record batch per file: multi-chunk columns must be concatenated
+    # (copied) on read, which defeats the memory map
+    atomic_write(path, lambda tmp: feather.write_feather(
+        df, str(tmp), compression=compression, chunksize=max(len(df), 1)
+    ))
+
+
+def _read_arrow(path: Path, columns: list = None, filters: dict = None) -> tuple:
+    """Read an Arrow IPC file through a memory map, with projection and filters.
+
+    Uncompressed buffers stay backed by the mapped file; split_blocks lets
+    pandas keep numeric columns as views over them instead of consolidating
+    into freshly allocated blocks.
+    """
+    table = feather.read_table(str(path), memory_map=True)
+    conditions = _filter_conditions(filters)
+    for col, _, _ in conditions:
+        if col not in table.column_names:
+            raise ValueError(f"{path.name} has no column {col!r} to filter on")
+
+    read_cols = table.column_names
+    if columns is not None:
+        read_cols = list(dict.fromkeys(list(columns) + [c for c, _, _ in conditions]))
+        read_cols = [c for c in read_cols if c in table.column_names]
+        table = table.select(read_cols)
+
+    stats = {"files": 1, "bytes_read": table.nbytes, "rows_read": table.num_rows}
+    if conditions:
+        mask = None
+        for col, _, values in conditions:
+            column = table.column(col)
+            if pa.types.is_dictionary(column.type):
+                column = column.cast(column.type.value_type)
+            cond = pc.is_in(column, value_set=pa.array(values, type=column.type))
+            mask = cond if mask is None else pc.and_(mask, cond)
+        table = table.filter(mask)
+
+    df = table.to_pandas(split_blocks=True)
+    if columns is not None:
+        df = df[[c for c in columns if c in df.columns]]
+    stats["rows_returned"] = len(df)
+    return df, stats
+
+
+def _write_cache_file(name: str, df: pd.DataFrame, path: Path, data_dir: Path = None) -> None:
+    """Write a cache file as parquet, plus an Arrow IPC copy for arrow datasets.
+
+    Writes are atomic and recorded in the manifest of `data_dir` (DATA_DIR
+    by default), which `path` must be under.
+    """
+    atomic_write(path, lambda tmp: df.to_parquet(tmp, engine="fastparquet", index=False))
+    _record_write(name, df, path, data_dir)
+    if CACHE_BACKENDS.get(name) == "arrow":
+        _write_arrow(df, _arrow_path(path), ARROW_COMPRESSION.get(name, "uncompressed"))
+
+
+def _read_cache_file(name: str, path: Path, columns: list = None, filters: dict = None) -> tuple:
+    """Read one cache file through the dataset's configured backend.
+
+    For arrow datasets a missing or out-of-date .arrow copy is rebuilt from the
+    parquet file first, so files written elsewhere (e.g. scored.parquet from
+    the notebooks) pick up the faster path on their next read.
+    """
+    if CACHE_BACKENDS.get(name) != "arrow":
+        return _read_parquet(path, columns, filters)
+
+    arrow_path = _arrow_path(path)
+    if not arrow_path.exists() or arrow_path.stat().st_mtime < path.stat().st_mtime:
+        full = pd.read_parquet(path, engine="fastparquet")
+        _write_arrow(full, arrow_path, ARROW_COMPRESSION.get(name, "uncompressed"))
+    return _read_arrow(arrow_path, columns, filters)
+
+
+def _record_read(name: str, stats: dict, source: Path) -> None:
+    """Remember and report how much a cached read touched."""
+    READ_STATS[name] = stats
+    print(f"Loading cached {name} from {source} "
+          f"({stats['files']} file(s), {stats['bytes_read'] / 1e6:.1f} MB read, "
+          f"{stats['rows_read']:,} rows read, {stats['rows_returned']:,} kept)")
+
+
+def concat_partitions(frames: list) -> pd.DataFrame:
+    """Concatenate partition frames, unifying categories so categoricals survive.
+
+    pd.concat turns a categorical column into object when the frames'
+    categories differ; here each such column is first given the union of
+    the categories. The frames are modified in place. Use it for any
+    per-season pieces of one dataset (cached partitions, or per-season
+    results such as cleaning's streaming weekly aggregation).
+    """
+    for col in frames[0].columns:
+        dtypes = [f[col].dtype for f in frames if col in f.columns]
+        if all(isinstance(d, pd.CategoricalDtype) for d in dtypes) and len(set(dtypes)) > 1:
+            categories = pd.api.types.union_categoricals(
+                [f[col] for f in frames if col in f.columns]
+            ).categories
+            for f in frames:
+                if col in f.columns:
+                    f[col] = f[col].cat.set_categories(categories)
+    return pd.concat(frames, ignore_index=True)
+
+
+def _read_dataset(
+    name: str,
+    files: list,
+    source: Path,
+    columns: list = None,
+    filters: dict = None,
+) -> pd.DataFrame:
+    """Read a dataset's cache files into one frame, memoized in the registry.
+
+    Repeat reads of unchanged files with the same columns/filters skip the
+    files. Every read, the first one included, returns a copy of the
+    memoized frame. On pandas >= 3 it is a shallow copy that shares data
+    with the memo: copy-on-write keeps writes to it from reaching the memo,
+    and arrow-backed columns are read-only outright. Older pandas has no
+    such guarantee, so there the copy is deep.
+    """
+    key = _registry_key(name, files, columns, filters)
+    with _REGISTRY_LOCK:
+        hit = _REGISTRY.get(key)
+        if hit is not None:
+            _REGISTRY.move_to_end(key)
+    if hit is not None:
+        df = hit[0]
+        READ_STATS[name] = {"files": 0, "bytes_read": 0, "rows_read": 0, "rows_returned": len(df)}
+        print(f"Using in-memory {name} ({len(df):,} rows)")
+        return df.copy(deep=not _SHALLOW_HITS)
+
+    frames = []
+    totals = {"files": 0, "bytes_read": 0, "rows_read": 0, "rows_returned": 0}
+    for path in files:
+        df, stats = _read_cache_file(name, path, columns, filters)
+        frames.append(df)
+        for stat in totals:
+            totals[stat] += stats[stat]
+    _record_read(name, totals, source)
+    if not frames:
+        return pd.DataFrame(columns=columns)
+    df = frames[0] if len(frames) == 1 else concat_partitions(frames)
+
+    nbytes = int(df.memory_usage(index=True, deep=True).sum())
+    if nbytes <= REGISTRY_BUDGET_BYTES:
+        with _REGISTRY_LOCK:
+            _REGISTRY[key] = (df, nbytes)
+            _evict_to_budget()
+    return df.copy(deep=not _SHALLOW_HITS)
+
+
+def _read_partitions(
+    name: str,
+    seasons: list,
+    columns: list = None,
+    filters: dict = None,
+) -> pd.DataFrame:
+    """Read cached season partitions back into one frame, in season order."""
+    files = [_partition_path(name, season) for season in sorted(seasons)]
+    return _read_dataset(name, files, _partition_dir(name), columns, filters)
+
+
+def _migrate_monolithic_cache(name: str) -> None:
+    """Split a pre-partitioning data/<name>.parquet into season partitions."""
+    legacy = _cache_path(name)
+    if not legacy.exists() or _cached_seasons(name):
+        return
+    print(f"Splitting cached {name} into season partitions")
+    _write_partitions(name, _apply_schema(name, pd.read_parquet(legacy, engine="fastparquet")))
+    legacy.unlink()
+
+
+def _ensure_partitions(
+    name: str,
+    fetch_fn,
+    force_refresh: bool = False,
+    refresh_seasons=None,
+    seasons: list = None,
+) -> list:
+    """Fetch a partitioned dataset's missing or stale seasons; returns the cached ones.
+
+    refresh_seasons lists seasons to refetch even if cached ("current" means
+    CURRENT_SEASON); force_refresh refetches every season. `seasons` limits
+    what is fetched and returned.
+    """
+    if seasons is None:
+        seasons = SEASON_RANGES[name]
+    else:
+        seasons = [s for s in SEASON_RANGES[name] if s in set(seasons)]
+    if refresh_seasons == "current":
+        refresh_seasons = [CURRENT_SEASON]
+    refresh = set(seasons if force_refresh else (refresh_seasons or []))
+
+    _migrate_monolithic_cache(name)
+    cached = set(_cached_seasons(name))
+    to_fetch = [
+        s for s in seasons
+        if s not in cached or s in refresh or _is_expired(name, _partition_path(name, s), s)
+    ]
+
+    if to_fetch:
+        print(f"Fetching {name} for seasons {to_fetch}...")
+        df = fetch_fn(to_fetch)
+        written = _write_partitions(name, _apply_schema(name, df))
+        print(f"Saved {name} ({df.shape[0]:,} rows, {df.shape[1]} cols) "
+              f"to {len(written)} season partitions in {_partition_dir(name)}")
+        cached.update(written)
+
+    return [s for s in seasons if s in cached]
+
+
+def _load_or_fetch_partitioned(
+    name: str,
+    fetch_fn,
+    force_refresh: bool = False,
+    refresh_seasons=None,
+    columns: list = None,
+    seasons: list = None,
+    filters: dict = None,
+) -> pd.DataFrame:
+    """Load a season-partitioned dataset, fetching only missing or stale seasons."""
+    seasons = _ensure_partitions(name, fetch_fn, force_refresh, refresh_seasons, seasons)
+    return _read_partitions(name, seasons, columns, filters)
+
+
+def iter_partitions(
+    name: str,
+    force_refresh: bool = False,
+    refresh_seasons=None,
+    columns: list = None,
+    seasons: list = None,
+    filters: dict = None,
+):
+    """Yield (season, frame) for a season-partitioned dataset, one partition at a time.
+
+    For tables too large to load whole: each partition is read straight
+    from its cache file, bypassing the in-memory registry, and the
+    generator drops its reference before reading the next one. A caller
+    that also lets go of each frame holds one season at a time.
+    """
+    seasons = _ensure_partitions(name, FETCHERS[name], force_refresh, refresh_seasons, seasons)
+    totals = {"files": 0, "bytes_read": 0, "rows_read": 0, "rows_returned": 0}
+    for season in seasons:
+        df, stats = _read_cache_file(name, _partition_path(name, season), columns, filters)
+        for stat in totals:
+            totals[stat] += stats[stat]
+        yield season, df
+        del df
+    _record_read(name, totals, _partition_dir(name))
+
+
+def _load_or_fetch(
+    name: str,
+    fetch_fn,
+    force_refresh: bool = False,
+    refresh_seasons=None,
+    columns: list = None,
+    seasons: list = None,
+    filters: dict = None,
+) -> pd.DataFrame:
+    """Load from cache if exists, otherwise fetch and save.
+
+    columns, seasons and filters ({column: value or list of values}) are
+    pushed down into the cached read rather than applied to a full frame.
+    """
+    if name in SEASON_RANGES:
+        return _load_or_fetch_partitioned(
+            name, fetch_fn, force_refresh, refresh_seasons, columns, seasons, filters
+        )
+
+    if seasons is not None:
+        filters = {**(filters or {}), "season": list(seasons)}
 
-def _load_or_fetch(name: str, fetch_fn, force_refresh: bool = False) -> pd.DataFrame:
-    """Load from cache if exists, otherwise fetch and save."""
     path = _cache_path(name)
-    if path.exists() and not force_refresh:
-        print(f"Loading cached {name} from {path}")
-        return pd.read_parquet(path, engine="fastparquet")
+    if path.exists() and not force_refresh and not _is_expired(name, path):
+        return _read_dataset(name, [path], path, columns, filters)
 
     print(f"Fetching {name}...")
-    df = fetch_fn()
+    df = _apply_schema(name, fetch_fn())
     DATA_DIR.mkdir(parents=True, exist_ok=True)
-    sanitized = _sanitize_for_parquet(df)
-    sanitized.to_parquet(path, engine="fastparquet", index=False)
+    _write_cache_file(name, df, path)
     print(f"Saved {name} ({df.shape[0]:,} rows, {df.shape[1]} cols) to {path}")
+    if filters:
+        df = _apply_filters(df, filters).reset_index(drop=True)
+    if columns is not None:
+        df = df[[c for c in columns if c in df.columns]]
     return df
 
 
-def load_weekly_stats(force_refresh: bool = False) -> pd.DataFrame:
+def load_cached(
+    name: str,
+    columns: list = None,
+    seasons: list = None,
+    filters: dict = None,
+) -> pd.DataFrame:
+    """Read a derived dataset (e.g. 'scored', 'analysis_ready') from data/<name>.parquet."""
+    if seasons is not None:
+        filters = {**(filters or {}), "season": list(seasons)}
+    path = _cache_path(name)
+    return _read_dataset(name, [path], path, columns, filters)
+
+
+def save_cached(name: str, df: pd.DataFrame) -> Path:
+    """Write a derived dataset to data/<name>.parquet atomically and record it."""
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    path = _cache_path(name)
+    _write_cache_file(name, df, path)
+    print(f"Saved {name} ({df.shape[0]:,} rows, {df.shape[1]} cols) to {path}")
+    return path
+
+
+def load_weekly_stats(
+    force_refresh: bool = False,
+    refresh_seasons=None,
+    columns: list = None,
+    seasons: list = None,
+    filters: dict = None,
+) -> pd.DataFrame:
     return _load_or_fetch(
         "weekly_stats",
-        lambda: nfl.import_weekly_data(YEARS),
+        FETCHERS["weekly_stats"],
         force_refresh,
+        refresh_seasons,
+        columns=columns,
+        seasons=seasons,
+        filters=filters,
     )
 
 
-def load_rosters(force_refresh: bool = False) -> pd.DataFrame:
+def iter_weekly_stats(
+    force_refresh: bool = False,
+    refresh_seasons=None,
+    columns: list = None,
+    seasons: list = None,
+    filters: dict = None,
+):
+    """Weekly stats one season partition at a time; see iter_partitions."""
+    return iter_partitions("weekly_stats", force_refresh, refresh_seasons,
+                           columns=columns, seasons=seasons, filters=filters)
+
+
+def load_rosters(
+    force_refresh: bool = False,
+    refresh_seasons=None,
+    columns: list = None,
+    seasons: list = None,
+    filters: dict = None,
+) -> pd.DataFrame:
     return _load_or_fetch(
         "rosters",
-        lambda: nfl.import_seasonal_rosters(YEARS),
+        FETCHERS["rosters"],
         force_refresh,
+        refresh_seasons,
+        columns=columns,
+        seasons=seasons,
+        filters=filters,
     )
 
 
-def load_contracts(force_refresh: bool = False) -> pd.DataFrame:
+def load_contracts(
+    force_refresh: bool = False,
+    columns: list = None,
+    filters: dict = None,
+) -> pd.DataFrame:
     return _load_or_fetch(
         "contracts",
-        lambda: nfl.import_contracts(),
+        FETCHERS["contracts"],
         force_refresh,
+        columns=columns,
+        filters=filters,
     )
 
 
-def load_snap_counts(force_refresh: bool = False) -> pd.DataFrame:
+def load_snap_counts(
+    force_refresh: bool = False,
+    refresh_seasons=None,
+    columns: list = None,
+    seasons: list = None,
+    filters: dict = None,
+) -> pd.DataFrame:
     return _load_or_fetch(
         "snap_counts",
-        lambda: nfl.import_snap_counts(YEARS),
+        FETCHERS["snap_counts"],
         force_refresh,
+        refresh_seasons,
+        columns=columns,
+        seasons=seasons,
+        filters=filters,
     )
 
 
-def load_players(force_refresh: bool = False) -> pd.DataFrame:
+def load_players(
+    force_refresh: bool = False,
+    columns: list = None,
+    filters: dict = None,
+) -> pd.DataFrame:
     return _load_or_fetch(
         "players",
-        lambda: nfl.import_players(),
+        FETCHERS["players"],
         force_refresh,
+        columns=columns,
+        filters=filters,
     )
 
 
-def load_ids(force_refresh: bool = False) -> pd.DataFrame:
+def load_ids(
+    force_refresh: bool = False,
+    columns: list = None,
+    filters: dict = None,
+) -> pd.DataFrame:
     return _load_or_fetch(
         "ids",
-        lambda: nfl.import_ids(),
+        FETCHERS["ids"],
         force_refresh,
+        columns=columns,
+        filters=filters,
     )
 
 
-def load_pfr_stats(stat_type: str, force_refresh: bool = False) -> pd.DataFrame:
+def load_pfr_stats(
+    stat_type: str,
+    force_refresh: bool = False,
+    refresh_seasons=None,
+    columns: list = None,
+    seasons: list = None,
+    filters: dict = None,
+) -> pd.DataFrame:
     """Load PFR seasonal stats. stat_type: 'pass', 'rush', 'rec', 'def'."""
     return _load_or_fetch(
         f"pfr_{stat_type}",
-        lambda: nfl.import_seasonal_pfr(stat_type, PFR_YEARS),
+        FETCHERS[f"pfr_{stat_type}"],
         force_refresh,
+        refresh_seasons,
+        columns=columns,
+        seasons=seasons,
+        filters=filters,
     )
 
 
-def load_all(force_refresh: bool = False) -> dict:
-    """Load all datasets, returning a dict keyed by name."""
+class LazyDatasets(Mapping):
+    """Read-only mapping of dataset name -> DataFrame that loads on first access.
+
+    Iterating or calling .items() loads every dataset; indexing a single key
+    loads only that one, so a script that needs one table never pays for the
+    others.
+    """
+
+    def __init__(self, loaders: dict):
+        self._loaders = loaders
+        self._loaded = {}
+
+    def __getitem__(self, name: str) -> pd.DataFrame:
+        if name not in self._loaded:
+            self._loaded[name] = self._loaders[name]()
+        return self._loaded[name]
+
+    def __iter__(self):
+        return iter(self._loaders)
+
+    def __len__(self) -> int:
+        return len(self._loaders)
+
+    def __repr__(self) -> str:
+        loaded = [name for name in self._loaders if name in self._loaded]
+        return f"LazyDatasets({list(self._loaders)}, loaded={loaded})"
+
+
+def load_all(
+    force_refresh: bool = False,
+    max_workers: int = 1,
+    fetchers: dict = None,
+    refresh_seasons=None,
+) -> Mapping[str, pd.DataFrame]:
+    """Load all datasets, returning a read-only mapping keyed by name.
+
+    By default this returns a LazyDatasets mapping: each dataset is loaded
+    (and fetched if needed) the first time it is accessed. Callers that
+    need a mutable dict should wrap it in dict(), which loads everything.
+    refresh_seasons (e.g. "current" or [2024]) refetches just those seasons of
+    the season-partitioned datasets; everything else is served from cache.
+    With max_workers > 1 the datasets are fetched, typed and written
+    concurrently (see load_all_concurrent) and returned as a plain dict;
+    datasets that fail are reported and left out of the result instead of
+    aborting the whole load.
+    """
+    if max_workers > 1 or fetchers is not None:
+        datasets, report = load_all_concurrent(
+            force_refresh, max_workers, fetchers, refresh_seasons
+        )
+        failed = report[report["status"] == "error"]
+        for _, row in failed.iterrows():
+            print(f"Failed to load {row['dataset']}: {row['error']}")
+        return datasets
+
+    loaders = {
+        "weekly_stats": lambda: load_weekly_stats(force_refresh, refresh_seasons),
+        "rosters": lambda: load_rosters(force_refresh, refresh_seasons),
+        "contracts": lambda: load_contracts(force_refresh),
+        "snap_counts": lambda: load_snap_counts(force_refresh, refresh_seasons),
+        "players": lambda: load_players(force_refresh),
+        "ids": lambda: load_ids(force_refresh),
+    }
+    for stat_type in PFR_STAT_TYPES:
+        loaders[f"pfr_{stat_type}"] = (
+            lambda st=stat_type: load_pfr_stats(st, force_refresh, refresh_seasons)
+        )
+    return LazyDatasets(loaders)
+
+
+def _timed_load(name: str, fetch_fn, force_refresh: bool, refresh_seasons=None) -> dict:
+    """Load one dataset, capturing timing and any error instead of raising."""
+    start = time.perf_counter()
+    try:
+        df = _load_or_fetch(name, fetch_fn, force_refresh, refresh_seasons)
+    except Exception as exc:  # isolate failures so other datasets still load
+        return {
+            "dataset": name, "status": "error",
+            "seconds": time.perf_counter() - start,
+            "rows": 0, "cols": 0, "error": f"{type(exc).__name__}: {exc}",
+            "df": None,
+        }
+    return {
+        "dataset": name, "status": "ok",
+        "seconds": time.perf_counter() - start,
+        "rows": df.shape[0], "cols": df.shape[1], "error": None,
+        "df": df,
+    }
+
+
+def load_all_concurrent(
+    force_refresh: bool = False,
+    max_workers: int = 4,
+    fetchers: dict = None,
+    refresh_seasons=None,
+) -> tuple:
+    """Load all datasets in a bounded thread pool.
+
+    Each dataset's fetch, schema pass and parquet write runs as one task, so a
+    cold cache costs roughly the slowest fetch instead of the sum of all ten.
+    `fetchers` maps dataset name -> fetch function (same signatures as
+    FETCHERS) and replaces the nfl_data_py defaults (useful for stubbing);
+    its keys pick the datasets.
+
+    Returns (datasets, report): datasets holds the frames that loaded, in
+    fetcher order; report is a DataFrame with one row per dataset giving
+    status, seconds, rows, cols and error.
+    """
+    fetchers = dict(FETCHERS) if fetchers is None else dict(fetchers)
+    max_workers = max(1, min(max_workers, len(fetchers) or 1))
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {
+            pool.submit(_timed_load, name, fetch_fn, force_refresh, refresh_seasons): name
+            for name, fetch_fn in fetchers.items()
+        }
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+
     datasets = {}
-    datasets["weekly_stats"] = load_weekly_stats(force_refresh)
-    datasets["rosters"] = load_rosters(force_refresh)
-    datasets["contracts"] = load_contracts(force_refresh)
-    datasets["snap_counts"] = load_snap_counts(force_refresh)
-    datasets["players"] = load_players(force_refresh)
-    datasets["ids"] = load_ids(force_refresh)
-    for stat_type in ["pass", "rush", "rec", "def"]:
-        datasets[f"pfr_{stat_type}"] = load_pfr_stats(stat_type, force_refresh)
-    return datasets
+    rows = []
+    for name in fetchers:
+        result = results[name]
+        if result["df"] is not None:
+            datasets[name] = result["df"]
+        rows.append({k: v for k, v in result.items() if k != "df"})
+
+    report = pd.DataFrame(rows, columns=["dataset", "status", "seconds", "rows", "cols", "error"])
+    return datasets, report
+
+
+def sync_mirror(
+    root,
+    datasets: list = None,
+    source=None,
+    fmt: str = "parquet",
+    max_workers: int = 4,
+) -> pd.DataFrame:
+    """Fill a local mirror directory with every raw dataset, once.
+
+    Fetches each dataset from `source` (default: nfl_data_py) and writes it in
+    the LocalMirrorSource layout, one file per season for season-partitioned
+    datasets. Parquet mirrors get the declared schema applied so fastparquet
+    can write mixed-type columns; CSV mirrors are written raw. Returns a
+    per-dataset report like load_all_concurrent.
+    """
+    mirror = LocalMirrorSource(root)
+    source = source or NflDataPySource()
+    datasets = datasets or list(FETCHERS)
+
+    def sync_one(name):
+        start = time.perf_counter()
+        try:
+            if name in SEASON_RANGES:
+                df = source.fetch(name, SEASON_RANGES[name])
+                parts = df.groupby("season", sort=True) if len(df) else []
+            else:
+                df = source.fetch(name)
+                parts = [(None, df)]
+            for season, part in parts:
+                if fmt != "csv":
+                    part = _apply_schema(name, part)
+                mirror.write(part, name, None if season is None else int(season), fmt)
+        except Exception as exc:  # one failed dataset shouldn't stop the sync
+            return {"dataset": name, "status": "error", "seconds": time.perf_counter() - start,
+                    "rows": 0, "error": f"{type(exc).__name__}: {exc}"}
+        print(f"Mirrored {name} ({len(df):,} rows) to {mirror.root}")
+        return {"dataset": name, "status": "ok", "seconds": time.perf_counter() - start,
+                "rows": len(df), "error": None}
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        rows = list(pool.map(sync_one, datasets))
+    return pd.DataFrame(rows, columns=["dataset", "status", "seconds", "rows", "error"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage the NFL data cache.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sync = sub.add_parser("sync-mirror", help="fill a local raw-data mirror from nfl_data_py")
+    sync.add_argument("root", help="mirror directory")
+    sync.add_argument("--datasets", nargs="*", help="datasets to sync (default: all)")
+    sync.add_argument("--format", default="parquet", choices=["parquet", "csv"])
+    sync.add_argument("--max-workers", type=int, default=4)
+    args = parser.parse_args()
+
+    if args.command == "sync-mirror":
+        report = sync_mirror(args.root, args.datasets, fmt=args.format, max_workers=args.max_workers)
+        print(report.to_string(index=False))
+        if (report["status"] == "error").any():
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
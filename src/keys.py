@@ -0,0 +1,278 @@
+"""Integer surrogate keys for joins, and the persisted player id crosswalk.
+
+A KeyDictionary assigns each distinct string id a compact int32 code.
+Codes are append-only: a label keeps its code for the life of the
+dictionary, so codes taken before new ids are added stay valid.
+merge_all matches rows on season_key() of these codes, and
+aggregate_snap_counts groups on season_key() of factorized pfr ids,
+instead of on the string ids; the frames themselves keep their string id
+columns.
+
+The id crosswalk is saved under data/keys/ and updated incrementally.
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from . import data_loader
+
+MISSING = -1
+
+
+class KeyDictionary:
+    """Append-only mapping from string labels to int32 codes."""
+
+    def __init__(self, labels=()):
+        self._labels = pd.array([], dtype="string")
+        self.add(labels)
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    @property
+    def labels(self) -> pd.Index:
+        return pd.Index(self._labels)
+
+    def copy(self) -> "KeyDictionary":
+        """Independent dictionary with the same codes."""
+        keys = KeyDictionary()
+        keys._labels = self._labels.copy()
+        return keys
+
+    def add(self, values) -> int:
+        """Assign codes to labels not seen before; returns how many were added."""
+        before = len(self._labels)
+        self.encode(values, add=True)
+        return len(self._labels) - before
+
+    def encode(self, values, add: bool = False) -> np.ndarray:
+        """Codes for `values`; missing or unknown labels get MISSING unless add=True.
+
+        The labels are factorized together with the values, labels first:
+        known labels keep codes 0..n-1 and unseen values get n, n+1, ... in
+        order of first appearance, which are exactly their appended codes.
+        """
+        values = pd.Series(values, copy=False)
+        if values.dtype != self._labels.dtype:
+            values = values.astype(object).astype(self._labels.dtype)
+        n = len(self._labels)
+        codes, uniques = pd.factorize(
+            pd.concat([pd.Series(self._labels), values], ignore_index=True)
+        )
+        codes = codes[n:].astype(np.int32)
+        if add:
+            self._labels = pd.array(uniques, dtype="string")
+        else:
+            codes[codes >= n] = MISSING
+        return codes
+
+    def decode(self, codes) -> np.ndarray:
+        """Labels for `codes` (None where the code is MISSING)."""
+        codes = np.asarray(codes)
+        labels = np.append(self._labels.to_numpy(dtype=object, na_value=None), None)
+        return labels[np.where(codes >= 0, codes, len(self._labels))]
+
+
+# Id systems tracked by the crosswalk (import_ids columns)
+ID_SYSTEMS = [
+    "gsis_id", "pfr_id", "espn_id", "sleeper_id", "yahoo_id", "sportradar_id",
+    "pff_id", "nfl_id", "mfl_id", "fantasypros_id",
+]
+
+CONFLICT_COLUMNS = ["system", "id", "gsis_id", "mapped_to", "source", "reason"]
+
+
+class IdCrosswalk:
+    """Player id crosswalk: one row per gsis_id, one column per id system.
+
+    Every non-missing id maps to exactly one player, so lookups go both ways
+    through a hash of each system's ids (KeyDictionary) plus a positional
+    row array. Sources are merged in with update(): new players are
+    appended, missing ids on known players are filled, and anything that
+    would break one-id-one-player is kept as-is and recorded in `conflicts`
+    (first claim wins).
+    """
+
+    def __init__(self, table: pd.DataFrame = None, conflicts: pd.DataFrame = None):
+        if table is None:
+            table = pd.DataFrame({system: pd.array([], dtype="string") for system in ID_SYSTEMS})
+        self._table = table.reset_index(drop=True)
+        self.conflicts = (conflicts if conflicts is not None
+                          else pd.DataFrame(columns=CONFLICT_COLUMNS))
+        self._lookups = {}
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    @property
+    def table(self) -> pd.DataFrame:
+        return self._table
+
+    def _lookup(self, system: str) -> tuple:
+        """(KeyDictionary of the system's ids, row of each code), built on first use."""
+        if system not in self._lookups:
+            values = self._table[system]
+            rows = np.flatnonzero(values.notna().to_numpy())
+            self._lookups[system] = (KeyDictionary(values.iloc[rows]), rows)
+        return self._lookups[system]
+
+    def rows(self, system: str, ids) -> np.ndarray:
+        """Crosswalk row of each id (MISSING where unknown)."""
+        keys, rows = self._lookup(system)
+        codes = keys.encode(ids)
+        return np.append(rows, MISSING)[codes]
+
+    def lookup(self, ids, from_system: str, to_system: str) -> pd.api.extensions.ExtensionArray:
+        """Map ids from one system to another (missing where unknown)."""
+        return self._table[to_system].reindex(self.rows(from_system, ids)).array
+
+    def to_gsis(self, system: str, ids):
+        return self.lookup(ids, system, "gsis_id")
+
+    def pairs(self, from_system: str, to_system: str = "gsis_id") -> pd.DataFrame:
+        """Rows where both ids are known, as a two-column frame."""
+        pairs = self._table[[to_system, from_system]].dropna()
+        return pairs.reset_index(drop=True)
+
+    def update(self, source: pd.DataFrame, name: str) -> dict:
+        """Merge a source's id columns in; returns counts of new players, filled ids, conflicts."""
+        systems = [c for c in ID_SYSTEMS if c in source.columns and c != "gsis_id"]
+        source = source[["gsis_id"] + systems].dropna(subset=["gsis_id"])
+        source = source.astype({c: "string" for c in ["gsis_id"] + systems})
+
+        # A player listed with two different ids in one system keeps the
+        # first; the others are conflicts like any other second id
+        conflicts = []
+        for system in systems:
+            listed = source[["gsis_id", system]].dropna().drop_duplicates()
+            first = listed.groupby("gsis_id", sort=False)[system].transform("first")
+            differs = (listed[system] != first).to_numpy()
+            conflicts.append(pd.DataFrame({
+                "system": system, "id": listed[system][differs].to_numpy(dtype=object),
+                "gsis_id": listed["gsis_id"][differs].to_numpy(dtype=object),
+                "mapped_to": first[differs].to_numpy(dtype=object),
+                "source": name, "reason": "player has another id",
+            }))
+        source = source.groupby("gsis_id", sort=False, as_index=False)[systems].first() \
+            if systems else source.drop_duplicates(subset=["gsis_id"])
+        source = source.reset_index(drop=True)
+
+        # Append players not seen before
+        rows = self.rows("gsis_id", source["gsis_id"])
+        new = rows == MISSING
+        if new.any():
+            added = source.loc[new, ["gsis_id"]].reindex(columns=self._table.columns)
+            self._table = pd.concat([self._table, added.astype("string")], ignore_index=True)
+            rows[new] = np.arange(len(self._table) - new.sum(), len(self._table))
+        self._lookups = {}
+
+        filled = 0
+        for system in systems:
+            values = source[system]
+            current = self._table[system].to_numpy(dtype=object, na_value=None)[rows]
+            has_value = values.notna().to_numpy()
+            gsis = source["gsis_id"].to_numpy(dtype=object)
+
+            # Player already has a different id in this system
+            differs = (has_value & pd.notna(current)
+                       & (current != values.to_numpy(dtype=object, na_value=None)))
+            conflicts.append(pd.DataFrame({
+                "system": system, "id": values[differs].to_numpy(dtype=object),
+                "gsis_id": gsis[differs], "mapped_to": current[differs],
+                "source": name, "reason": "player has another id",
+            }))
+
+            # Id already belongs to another player, or is claimed twice in this source
+            candidate = has_value & pd.isna(current)
+            owner = self.rows(system, values[candidate])
+            claimed = values[candidate].duplicated().to_numpy() | (owner != MISSING)
+            reject = np.flatnonzero(candidate)[claimed]
+            owner_gsis = self._table["gsis_id"].reindex(owner[claimed]).to_numpy(dtype=object)
+            # Claimed twice in this source: the first claimant in the batch owns it
+            first_claim = pd.Series(gsis[candidate]).groupby(
+                values[candidate].to_numpy(dtype=object), sort=False).transform("first")
+            owner_gsis = np.where(owner[claimed] == MISSING,
+                                  first_claim.to_numpy(dtype=object)[claimed], owner_gsis)
+            conflicts.append(pd.DataFrame({
+                "system": system, "id": values.iloc[reject].to_numpy(dtype=object),
+                "gsis_id": gsis[reject], "mapped_to": owner_gsis,
+                "source": name, "reason": "id belongs to another player",
+            }))
+
+            fill = np.flatnonzero(candidate)[~claimed]
+            if len(fill):
+                column = self._table[system].copy()
+                column.iloc[rows[fill]] = values.iloc[fill].to_numpy()
+                self._table[system] = column
+                filled += len(fill)
+            self._lookups.pop(system, None)
+
+        new_conflicts = pd.concat([c for c in conflicts if len(c)], ignore_index=True) \
+            if any(len(c) for c in conflicts) else pd.DataFrame(columns=CONFLICT_COLUMNS)
+        if len(new_conflicts):
+            # A conflict reported on an earlier update is not reported again
+            known = pd.MultiIndex.from_frame(self.conflicts[["system", "id", "gsis_id"]].astype(str))
+            fresh = ~pd.MultiIndex.from_frame(
+                new_conflicts[["system", "id", "gsis_id"]].astype(str)).isin(known)
+            new_conflicts = new_conflicts[fresh]
+            self.conflicts = pd.concat([self.conflicts, new_conflicts], ignore_index=True)
+        return {"new_players": int(new.sum()), "ids_filled": filled,
+                "conflicts": len(new_conflicts)}
+
+    @classmethod
+    def from_pairs(cls, pairs: pd.DataFrame) -> "IdCrosswalk":
+        """Crosswalk from a frame of id columns, e.g. gsis_id/pfr_id pairs."""
+        crosswalk = cls()
+        crosswalk.update(pairs, "pairs")
+        return crosswalk
+
+    def save(self, directory: Path) -> None:
+        directory.mkdir(parents=True, exist_ok=True)
+        for name, frame in [("crosswalk", self._table), ("crosswalk_conflicts", self.conflicts)]:
+            frame = frame.astype(object).where(frame.notna(), None)
+            data_loader.atomic_write(directory / f"{name}.parquet", lambda tmp, f=frame: f.to_parquet(
+                tmp, engine="fastparquet", index=False, object_encoding="utf8"))
+
+    @classmethod
+    def load(cls, directory: Path) -> "IdCrosswalk":
+        path = directory / "crosswalk.parquet"
+        if not path.exists():
+            return cls()
+        table = pd.read_parquet(path, engine="fastparquet")
+        table = table.reindex(columns=ID_SYSTEMS).astype("string")
+        conflicts_path = directory / "crosswalk_conflicts.parquet"
+        conflicts = (pd.read_parquet(conflicts_path, engine="fastparquet")
+                     if conflicts_path.exists() else None)
+        return cls(table, conflicts)
+
+
+def load_crosswalk(update: bool = True) -> IdCrosswalk:
+    """Persistent id crosswalk under data/keys/, updated from load_players then load_ids.
+
+    The players table goes first so its pfr_id mapping (the one snap counts
+    and PFR defense have always been mapped with) wins; import_ids then
+    adds new players, fills ids the players table lacks, and every other id
+    system. Cleaning steps that map ids take this crosswalk.
+    """
+    directory = data_loader.DATA_DIR / "keys"
+    crosswalk = IdCrosswalk.load(directory)
+    if update:
+        changes = [
+            crosswalk.update(data_loader.load_players(), "players"),
+            crosswalk.update(data_loader.load_ids(), "ids"),
+        ]
+        total = {k: sum(c[k] for c in changes) for k in changes[0]}
+        if any(total.values()) or not (directory / "crosswalk.parquet").exists():
+            crosswalk.save(directory)
+            print(f"Crosswalk: {total['new_players']:,} new players, {total['ids_filled']:,} ids "
+                  f"filled, {total['conflicts']:,} new conflicts ({len(crosswalk):,} players)")
+    return crosswalk
+
+
+def season_key(player_codes, seasons) -> np.ndarray:
+    """One int64 per (player code, season); MISSING where the player has no code."""
+    player_codes = np.asarray(player_codes, dtype=np.int64)
+    seasons = pd.to_numeric(pd.Series(seasons), errors="coerce").fillna(0).to_numpy(dtype=np.int64)
+    return np.where(player_codes >= 0, player_codes * 10_000 + seasons, MISSING)
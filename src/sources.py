@@ -0,0 +1,73 @@
+"""Raw-data sources for data_loader: nfl_data_py or a local mirror directory."""
+
+from pathlib import Path
+
+import pandas as pd
+
+
+class NflDataPySource:
+    """Fetch datasets from nfl_data_py (the default, needs network access)."""
+
+    name = "nfl_data_py"
+
+    def fetch(self, dataset: str, seasons: list = None) -> pd.DataFrame:
+        import nfl_data_py as nfl  # imported lazily so mirror-only nodes don't need it
+
+        if dataset == "weekly_stats":
+            return nfl.import_weekly_data(seasons)
+        if dataset == "rosters":
+            return nfl.import_seasonal_rosters(seasons)
+        if dataset == "contracts":
+            return nfl.import_contracts()
+        if dataset == "snap_counts":
+            return nfl.import_snap_counts(seasons)
+        if dataset == "players":
+            return nfl.import_players()
+        if dataset == "ids":
+            return nfl.import_ids()
+        if dataset.startswith("pfr_"):
+            return nfl.import_seasonal_pfr(dataset[len("pfr_"):], seasons)
+        raise KeyError(f"nfl_data_py has no dataset {dataset!r}")
+
+
+class LocalMirrorSource:
+    """Read raw datasets from a local directory tree instead of the network.
+
+    Layout (parquet preferred, CSV accepted):
+        <root>/<dataset>/season=<year>.parquet   season-partitioned datasets
+        <root>/<dataset>.parquet                 contracts, players, ids
+    """
+
+    name = "local_mirror"
+
+    def __init__(self, root):
+        self.root = Path(root)
+
+    def path(self, dataset: str, season: int = None, fmt: str = "parquet") -> Path:
+        if season is None:
+            return self.root / f"{dataset}.{fmt}"
+        return self.root / dataset / f"season={season}.{fmt}"
+
+    def _read(self, dataset: str, season: int = None) -> pd.DataFrame:
+        parquet = self.path(dataset, season, "parquet")
+        if parquet.exists():
+            return pd.read_parquet(parquet, engine="fastparquet")
+        csv = self.path(dataset, season, "csv")
+        if csv.exists():
+            return pd.read_csv(csv, low_memory=False)
+        raise FileNotFoundError(f"{dataset} (season {season}) not in mirror {self.root}")
+
+    def fetch(self, dataset: str, seasons: list = None) -> pd.DataFrame:
+        if seasons is None:
+            return self._read(dataset)
+        frames = [self._read(dataset, season) for season in seasons]
+        return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+    def write(self, df: pd.DataFrame, dataset: str, season: int = None, fmt: str = "parquet") -> Path:
+        path = self.path(dataset, season, fmt)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if fmt == "csv":
+            df.to_csv(path, index=False)
+        else:
+            df.to_parquet(path, engine="fastparquet", index=False)
+        return path
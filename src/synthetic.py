@@ -0,0 +1,569 @@
+"""Synthetic NFL datasets for scale testing the load -> clean -> score pipeline.
+
+Generates every dataset data_loader caches (weekly stats, rosters, contracts,
+snap counts, players, ids and the PFR tables) with the upstream column names,
+the gsis_id <-> pfr_id crosswalk, multi-year contract histories with
+overlapping extensions, and per-position stat distributions. `scale` multiplies
+the player pool: 1.0 is roughly the size of the real 2015-2024 data.
+
+Usage (from repo root):
+    python -m src.synthetic --scale 10 --data-dir /tmp/nfl_synth
+"""
+
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from . import data_loader
+
+TEAMS = [
+    "ARI", "ATL", "BAL", "BUF", "CAR", "CHI", "CIN", "CLE", "DAL", "DEN", "DET",
+    "GB", "HOU", "IND", "JAX", "KC", "LA", "LAC", "LV", "MIA", "MIN", "NE", "NO",
+    "NYG", "NYJ", "PHI", "PIT", "SEA", "SF", "TB", "TEN", "WAS",
+]
+
+# Raw position -> (share of player pool, position_group as in weekly data)
+POSITIONS = {
+    "QB": (0.06, "QB"), "RB": (0.08, "RB"), "FB": (0.01, "RB"), "WR": (0.13, "WR"),
+    "TE": (0.07, "TE"), "T": (0.08, "OL"), "G": (0.08, "OL"), "C": (0.04, "OL"),
+    "DE": (0.07, "DL"), "DT": (0.07, "DL"), "OLB": (0.05, "LB"), "ILB": (0.05, "LB"),
+    "CB": (0.11, "DB"), "SS": (0.04, "DB"), "FS": (0.04, "DB"), "K": (0.01, "SPEC"),
+    "P": (0.01, "SPEC"),
+}
+OFFENSE_SKILL = ["QB", "RB", "FB", "WR", "TE"]
+OFFENSE = OFFENSE_SKILL + ["T", "G", "C"]
+DEFENSE = ["DE", "DT", "OLB", "ILB", "CB", "SS", "FS"]
+
+# Mean salary (% of cap) for a veteran deal by position
+VET_CAP_PCT = {
+    "QB": 0.060, "RB": 0.015, "FB": 0.006, "WR": 0.025, "TE": 0.015, "T": 0.030,
+    "G": 0.020, "C": 0.018, "DE": 0.030, "DT": 0.022, "OLB": 0.025, "ILB": 0.015,
+    "CB": 0.022, "SS": 0.014, "FS": 0.014, "K": 0.012, "P": 0.010,
+}
+
+FIRST_NAMES = ["James", "John", "Michael", "Chris", "David", "Josh", "Justin", "Tyler",
+               "Brandon", "Derrick", "Patrick", "Travis", "Aaron", "Jalen", "Lamar", "Cooper"]
+LAST_NAMES = ["Smith", "Johnson", "Williams", "Brown", "Jones", "Davis", "Miller", "Wilson",
+              "Moore", "Taylor", "Anderson", "Thomas", "Jackson", "White", "Harris", "Martin"]
+
+BASE_PLAYERS = 9000  # player pool at scale 1.0 (rookie classes 2005-2024)
+
+
+def _cap(season):
+    """Approximate salary cap in dollars for a season."""
+    return 150e6 * 1.06 ** (np.asarray(season) - 2015)
+
+
+def _players(n: int, rng: np.random.Generator) -> pd.DataFrame:
+    """Player universe with ids, bio, draft info and career span."""
+    names = list(POSITIONS)
+    shares = np.array([POSITIONS[p][0] for p in names])
+    position = np.array(names)[rng.choice(len(names), n, p=shares / shares.sum())]
+
+    first = np.array(FIRST_NAMES)[rng.integers(0, len(FIRST_NAMES), n)]
+    last = np.array(LAST_NAMES)[rng.integers(0, len(LAST_NAMES), n)]
+    idx = np.arange(n)
+    rookie_year = rng.integers(2005, 2025, n)
+    drafted = rng.random(n) < 0.7
+    draft_number = np.where(drafted, rng.integers(1, 257, n), -1)
+    # Higher picks are better players on average and stay in the league longer
+    talent = rng.lognormal(0.0, 0.35, n) * np.where(drafted, 1.3 - draft_number / 400, 0.85)
+    career = np.maximum(1, rng.geometric(0.22, n) + (talent > 1.1))
+    birth_year = rookie_year - rng.integers(21, 24, n)
+
+    players = pd.DataFrame({
+        "gsis_id": pd.Series(idx).map(lambda i: f"00-{i + 20000:07d}").to_numpy(),
+        "pfr_id": [f"{l[:4]}{f[:2]}{i:05d}" for f, l, i in zip(first, last, idx)],
+        "first_name": first,
+        "last_name": last,
+        "display_name": np.char.add(np.char.add(first, " "), last),
+        "position": position,
+        "position_group": [POSITIONS[p][1] for p in position],
+        "rookie_year": rookie_year,
+        "last_season": rookie_year + career - 1,
+        "draft_number": np.where(drafted, draft_number, np.nan),
+        "draft_round": np.where(drafted, np.minimum((draft_number - 1) // 32 + 1, 7), np.nan),
+        "draft_club": np.where(drafted, np.array(TEAMS)[rng.integers(0, 32, n)], None),
+        "birth_year": birth_year,
+        "birth_date": [f"{y}-{m:02d}-{d:02d}" for y, m, d in
+                       zip(birth_year, rng.integers(1, 13, n), rng.integers(1, 29, n))],
+        "height": rng.normal(74, 2.5, n).round(),
+        "weight": rng.normal(240, 45, n).round(),
+        "talent": talent,
+        "base_team": rng.integers(0, 32, n),
+    })
+    return players
+
+
+def _player_seasons(players: pd.DataFrame, rng: np.random.Generator) -> pd.DataFrame:
+    """One row per player per active season within YEARS."""
+    first = np.maximum(players["rookie_year"].to_numpy(), data_loader.YEARS[0])
+    last = np.minimum(players["last_season"].to_numpy(), data_loader.YEARS[-1])
+    n_seasons = np.clip(last - first + 1, 0, None)
+    pidx = np.repeat(np.arange(len(players)), n_seasons)
+    offset = np.arange(len(pidx)) - np.repeat(np.cumsum(n_seasons) - n_seasons, n_seasons)
+    season = np.repeat(first, n_seasons) + offset
+
+    # Players mostly stay put; a move shifts them to a new team from then on
+    moved = rng.random(len(pidx)) < 0.18
+    moves = pd.Series(moved).groupby(pidx).cumsum().to_numpy()
+    team_idx = (players["base_team"].to_numpy()[pidx] + moves * 7) % 32
+
+    max_weeks = np.where(season >= 2021, 17, 16)
+    games = np.minimum(rng.binomial(max_weeks, 0.82), max_weeks)
+    games = np.maximum(games, 1)
+    return pd.DataFrame({
+        "pidx": pidx,
+        "season": season,
+        "team": np.array(TEAMS)[team_idx],
+        "games": games,
+        "post_games": np.where(rng.random(len(pidx)) < 0.35, rng.integers(1, 4, len(pidx)), 0),
+    })
+
+
+def _expand_weeks(ps: pd.DataFrame, rng: np.random.Generator) -> pd.DataFrame:
+    """Repeat player-seasons into player-weeks (REG weeks 1..games, POST 19..)."""
+    n_games = ps["games"].to_numpy() + ps["post_games"].to_numpy()
+    rows = np.repeat(np.arange(len(ps)), n_games)
+    k = np.arange(len(rows)) - np.repeat(np.cumsum(n_games) - n_games, n_games)
+    reg = k < ps["games"].to_numpy()[rows]
+    week = np.where(reg, k + 1, 19 + k - ps["games"].to_numpy()[rows])
+    weeks = ps.iloc[rows].reset_index(drop=True)
+    weeks["week"] = week
+    weeks["season_type"] = np.where(reg, "REG", "POST")
+    weeks["opponent_team"] = np.array(TEAMS)[rng.integers(0, 32, len(rows))]
+    return weeks
+
+
+def _weekly_stats(players, ps, rng) -> pd.DataFrame:
+    """Offensive player-week box scores in the import_weekly_data schema."""
+    pos = players["position"].to_numpy()
+    skill = ps[np.isin(pos[ps["pidx"].to_numpy()], OFFENSE_SKILL)]
+    wk = _expand_weeks(skill, rng)
+    p = players.iloc[wk["pidx"].to_numpy()]
+    position = p["position"].to_numpy()
+    n = len(wk)
+    t = p["talent"].to_numpy() * rng.lognormal(0, 0.25, n)  # weekly form
+
+    is_qb = position == "QB"
+    starter = is_qb & (p["talent"].to_numpy() > 1.0)
+    attempts = np.where(is_qb, rng.poisson(np.where(starter, 34, 6)), 0)
+    completions = rng.binomial(attempts, np.clip(0.62 + 0.04 * (t - 1), 0.4, 0.8))
+    passing_yards = (completions * rng.normal(11.0, 2.0, n) * np.sqrt(t)).round().clip(0)
+    passing_tds = rng.poisson(attempts * 0.045 * t)
+    interceptions = rng.poisson(attempts * 0.024 / t)
+    sacks = np.where(is_qb, rng.poisson(attempts * 0.065), 0)
+
+    rush_rate = {"QB": 3.5, "RB": 12.0, "FB": 2.0, "WR": 0.3, "TE": 0.1}
+    target_rate = {"QB": 0.0, "RB": 3.5, "FB": 1.0, "WR": 6.5, "TE": 4.5}
+    catch_rate = {"QB": 0.0, "RB": 0.77, "FB": 0.75, "WR": 0.63, "TE": 0.69}
+    ypr = {"QB": 0.0, "RB": 7.5, "FB": 6.0, "WR": 12.8, "TE": 10.8}
+    carries = rng.poisson(pd.Series(position).map(rush_rate).to_numpy() * t)
+    rushing_yards = (carries * rng.normal(4.3, 1.4, n)).round()
+    rushing_tds = rng.poisson(carries * 0.03 * t)
+    targets = rng.poisson(pd.Series(position).map(target_rate).to_numpy() * t)
+    receptions = rng.binomial(targets, pd.Series(position).map(catch_rate).to_numpy())
+    receiving_yards = (receptions * rng.normal(1.0, 0.3, n).clip(0.1)
+                       * pd.Series(position).map(ypr).to_numpy()).round()
+    receiving_tds = rng.poisson(receiving_yards * 0.0065 * np.sqrt(t))
+
+    rushing_fumbles = rng.poisson(carries * 0.008)
+    receiving_fumbles = rng.poisson(receptions * 0.006)
+    sack_fumbles = rng.poisson(sacks * 0.1)
+
+    df = pd.DataFrame({
+        "player_id": p["gsis_id"].to_numpy(),
+        "player_name": (p["first_name"].str[0] + "." + p["last_name"]).to_numpy(),
+        "player_display_name": p["display_name"].to_numpy(),
+        "position": position,
+        "position_group": p["position_group"].to_numpy(),
+        "headshot_url": None,
+        "recent_team": wk["team"].to_numpy(),
+        "season": wk["season"].to_numpy(),
+        "week": wk["week"].to_numpy(),
+        "season_type": wk["season_type"].to_numpy(),
+        "opponent_team": wk["opponent_team"].to_numpy(),
+        "completions": completions,
+        "attempts": attempts,
+        "passing_yards": passing_yards,
+        "passing_tds": passing_tds,
+        "interceptions": interceptions.astype(float),
+        "sacks": sacks.astype(float),
+        "sack_yards": (sacks * rng.normal(6.5, 1.5, n)).round(),
+        "sack_fumbles": sack_fumbles,
+        "sack_fumbles_lost": rng.binomial(sack_fumbles, 0.5),
+        "passing_air_yards": (passing_yards * rng.normal(1.1, 0.15, n)).round(),
+        "passing_yards_after_catch": (passing_yards * rng.normal(0.45, 0.08, n)).round(),
+        "passing_first_downs": rng.poisson(completions * 0.55).astype(float),
+        "passing_epa": np.where(attempts > 0, rng.normal(0.08 * (t - 1) * attempts, 4.0), np.nan),
+        "passing_2pt_conversions": rng.poisson(attempts * 0.002),
+        "carries": carries,
+        "rushing_yards": rushing_yards,
+        "rushing_tds": rushing_tds,
+        "rushing_fumbles": rushing_fumbles.astype(float),
+        "rushing_fumbles_lost": rng.binomial(rushing_fumbles, 0.5).astype(float),
+        "rushing_first_downs": rng.poisson(carries * 0.22).astype(float),
+        "rushing_epa": np.where(carries > 0, rng.normal(0.02 * (t - 1) * carries, 2.0), np.nan),
+        "rushing_2pt_conversions": rng.poisson(carries * 0.004),
+        "receptions": receptions,
+        "targets": targets,
+        "receiving_yards": receiving_yards,
+        "receiving_tds": receiving_tds,
+        "receiving_fumbles": receiving_fumbles.astype(float),
+        "receiving_fumbles_lost": rng.binomial(receiving_fumbles, 0.5).astype(float),
+        "receiving_air_yards": (receiving_yards * rng.normal(0.8, 0.2, n)).round(),
+        "receiving_yards_after_catch": (receiving_yards * rng.normal(0.45, 0.1, n)).round(),
+        "receiving_first_downs": rng.poisson(receptions * 0.6).astype(float),
+        "receiving_epa": np.where(targets > 0, rng.normal(0.1 * (t - 1) * targets, 2.5), np.nan),
+        "receiving_2pt_conversions": rng.poisson(targets * 0.003),
+        "special_teams_tds": rng.poisson(0.002, n).astype(float),
+    })
+    df["fantasy_points"] = (
+        df["passing_yards"] * 0.04 + df["passing_tds"] * 4 - df["interceptions"] * 2
+        + (df["rushing_yards"] + df["receiving_yards"]) * 0.1
+        + (df["rushing_tds"] + df["receiving_tds"]) * 6
+        - (df["rushing_fumbles_lost"] + df["receiving_fumbles_lost"]) * 2
+    )
+    df["fantasy_points_ppr"] = df["fantasy_points"] + df["receptions"]
+    return df.sort_values(["season", "week", "player_id"], kind="stable").reset_index(drop=True)
+
+
+def _rosters(players, ps, rng) -> pd.DataFrame:
+    """Seasonal rosters in the import_seasonal_rosters schema."""
+    p = players.iloc[ps["pidx"].to_numpy()]
+    season = ps["season"].to_numpy()
+    n = len(ps)
+    return pd.DataFrame({
+        "season": season,
+        "team": ps["team"].to_numpy(),
+        "position": p["position"].to_numpy(),
+        "depth_chart_position": p["position"].to_numpy(),
+        "jersey_number": rng.integers(1, 100, n),
+        "status": "ACT",
+        "player_name": p["display_name"].to_numpy(),
+        "first_name": p["first_name"].to_numpy(),
+        "last_name": p["last_name"].to_numpy(),
+        "birth_date": p["birth_date"].to_numpy(),
+        "height": p["height"].to_numpy(),
+        "weight": p["weight"].to_numpy(),
+        "college": None,
+        "player_id": p["gsis_id"].to_numpy(),
+        "pfr_id": p["pfr_id"].to_numpy(),
+        "years_exp": season - p["rookie_year"].to_numpy(),
+        "headshot_url": None,
+        "week": np.where(season >= 2021, 18, 17),
+        "game_type": "REG",
+        "entry_year": p["rookie_year"].to_numpy(),
+        "rookie_year": p["rookie_year"].to_numpy(),
+        "draft_club": p["draft_club"].to_numpy(),
+        "draft_number": p["draft_number"].to_numpy(),
+        "age": season - p["birth_year"].to_numpy(),
+    })
+
+
+def _contracts(players, rng) -> pd.DataFrame:
+    """Full contract history per player: rookie deal, then extensions/re-signs.
+
+    About a third of second-and-later deals are extensions signed a year
+    before the previous deal ends, so contract windows overlap as upstream.
+    """
+    n = len(players)
+    drafted = players["draft_number"].notna().to_numpy()
+    pick = players["draft_number"].fillna(300).to_numpy()
+    position = players["position"].to_numpy()
+    talent = players["talent"].to_numpy()
+    last_season = players["last_season"].to_numpy()
+
+    signed = players["rookie_year"].to_numpy().copy()
+    years = np.where(drafted, np.where(pick <= 32, 5, 4), rng.integers(1, 4, n))
+    cap_pct = np.where(
+        drafted,
+        np.clip(0.045 * np.exp(-pick / 30), 0.004, None),
+        rng.uniform(0.003, 0.006, n),
+    )
+    frames = []
+    active = np.ones(n, dtype=bool)
+    for k in range(8):
+        idx = np.flatnonzero(active)
+        frames.append(pd.DataFrame({
+            "pidx": idx,
+            "year_signed": signed[idx],
+            "years": years[idx],
+            "apy_cap_pct": cap_pct[idx],
+        }))
+        end = signed + years - 1
+        extension = rng.random(n) < 0.35
+        signed = np.where(extension & (years > 1), end, end + 1)
+        years = rng.integers(1, 6, n)
+        vet_mean = pd.Series(position).map(VET_CAP_PCT).to_numpy()
+        cap_pct = vet_mean * talent ** 2 * rng.lognormal(0, 0.45, n)
+        active = active & (signed <= last_season)
+
+    c = pd.concat(frames, ignore_index=True)
+    p = players.iloc[c["pidx"].to_numpy()].reset_index(drop=True)
+    m = len(c)
+    apy = c["apy_cap_pct"].to_numpy() * _cap(c["year_signed"].to_numpy())
+    value = apy * c["years"].to_numpy()
+    apy_cap_pct = np.where(rng.random(m) < 0.02, np.nan, c["apy_cap_pct"].round(4))
+    gsis_id = np.where(rng.random(m) < 0.08, None, p["gsis_id"].to_numpy())
+    return pd.DataFrame({
+        "player": p["display_name"].to_numpy(),
+        "position": p["position"].to_numpy(),
+        "team": np.array(TEAMS)[rng.integers(0, 32, m)],
+        "is_active": c["year_signed"].to_numpy() + c["years"].to_numpy() > data_loader.YEARS[-1],
+        "year_signed": c["year_signed"].to_numpy(),
+        "years": np.where(rng.random(m) < 0.01, np.nan, c["years"].to_numpy()),
+        "value": (value / 1e6).round(3),
+        "apy": (apy / 1e6).round(3),
+        "guaranteed": (value * rng.uniform(0.1, 0.7, m) / 1e6).round(3),
+        "apy_cap_pct": apy_cap_pct,
+        "inflated_value": (value / 1e6 * 1.2).round(3),
+        "inflated_apy": (apy / 1e6 * 1.2).round(3),
+        "inflated_guaranteed": (value * 0.4 / 1e6).round(3),
+        "player_page": None,
+        "otc_id": (c["pidx"] + 1000).astype(str).to_numpy(),
+        "gsis_id": gsis_id,
+        "date_of_birth": p["birth_date"].to_numpy(),
+        "height": p["height"].to_numpy(),
+        "weight": p["weight"].to_numpy(),
+        "college": None,
+        "draft_year": np.where(p["draft_number"].notna(), p["rookie_year"], np.nan),
+        "draft_round": p["draft_round"].to_numpy(),
+        "draft_overall": p["draft_number"].to_numpy(),
+        "draft_team": p["draft_club"].to_numpy(),
+    })
+
+
+def _snap_counts(players, ps, rng) -> pd.DataFrame:
+    """Player-game snap counts keyed by pfr_player_id (import_snap_counts schema)."""
+    wk = _expand_weeks(ps, rng)
+    p = players.iloc[wk["pidx"].to_numpy()]
+    position = p["position"].to_numpy()
+    t = p["talent"].to_numpy()
+    on_offense = np.isin(position, OFFENSE)
+    on_defense = np.isin(position, DEFENSE)
+    share = np.clip(rng.normal(0.55 * t, 0.2), 0, 1)
+    offense_snaps = np.where(on_offense, (share * 65).round(), 0)
+    defense_snaps = np.where(on_defense, (share * 65).round(), 0)
+    st_snaps = rng.poisson(np.where(np.isin(position, ["K", "P"]), 7, 6 * (1.2 - share).clip(0)))
+    season = wk["season"].to_numpy()
+    week = wk["week"].to_numpy()
+    team = wk["team"].to_numpy()
+    opp = wk["opponent_team"].to_numpy()
+    # Format each distinct game once; snap rows outnumber games ~40:1
+    games = pd.DataFrame({"season": season, "week": week, "away": opp, "home": team})
+    codes, uniques = pd.MultiIndex.from_frame(games).factorize()
+    labels = np.array([f"{s}_{w:02d}_{a}_{h}" for s, w, a, h in uniques])
+    game_id = labels[codes]
+    return pd.DataFrame({
+        "game_id": game_id,
+        "pfr_game_id": game_id,
+        "season": season,
+        "game_type": np.where(wk["season_type"].to_numpy() == "REG", "REG", "WC"),
+        "week": week,
+        "player": p["display_name"].to_numpy(),
+        "pfr_player_id": p["pfr_id"].to_numpy(),
+        "position": position,
+        "team": team,
+        "opponent": opp,
+        "offense_snaps": offense_snaps,
+        "offense_pct": (offense_snaps / 65).round(2),
+        "defense_snaps": defense_snaps,
+        "defense_pct": (defense_snaps / 65).round(2),
+        "st_snaps": st_snaps.astype(float),
+        "st_pct": (st_snaps / 28).round(2),
+    })
+
+
+def _pfr_def(players, ps, rng) -> pd.DataFrame:
+    """Seasonal PFR defensive stats (import_seasonal_pfr('def') schema)."""
+    pos = players["position"].to_numpy()
+    d = ps[np.isin(pos[ps["pidx"].to_numpy()], DEFENSE)
+           & ps["season"].isin(data_loader.PFR_YEARS).to_numpy()]
+    p = players.iloc[d["pidx"].to_numpy()]
+    position = p["position"].to_numpy()
+    g = d["games"].to_numpy()
+    t = p["talent"].to_numpy()
+    n = len(d)
+    rush = np.isin(position, ["DE", "DT", "OLB"])
+    cover = np.isin(position, ["CB", "SS", "FS"])
+    pressures = rng.poisson(g * t * np.where(rush, 2.2, 0.3))
+    sacks = rng.poisson(g * t * np.where(rush, 0.5, 0.05)) / 2
+    tackles = rng.poisson(g * t * np.where(position == "ILB", 6.5, np.where(cover, 3.8, 3.0)))
+    ints = rng.poisson(g * t * np.where(cover, 0.06, 0.01))
+    tgt = rng.poisson(g * np.where(cover, 5.0, 1.5))
+    cmp = rng.binomial(tgt, 0.63)
+    yds = (cmp * rng.normal(11, 2, n)).round()
+    return pd.DataFrame({
+        "player": p["display_name"].to_numpy(),
+        "tm": d["team"].to_numpy(),
+        "age": d["season"].to_numpy() - p["birth_year"].to_numpy(),
+        "pos": position,
+        "g": g,
+        "gs": np.minimum(g, rng.binomial(g, np.clip(0.5 * t, 0, 1))),
+        "int": ints,
+        "tgt": tgt,
+        "cmp": cmp,
+        "cmp_percent": np.where(tgt > 0, cmp / np.maximum(tgt, 1), np.nan).round(3),
+        "yds": yds,
+        "yds_cmp": np.where(cmp > 0, yds / np.maximum(cmp, 1), np.nan).round(1),
+        "yds_tgt": np.where(tgt > 0, yds / np.maximum(tgt, 1), np.nan).round(1),
+        "td": rng.poisson(tgt * 0.04),
+        "rat": rng.normal(92, 15, n).round(1),
+        "dadot": rng.normal(8, 3, n).round(1),
+        "air": (yds * 0.6).round(),
+        "yac": (yds * 0.4).round(),
+        "bltz": rng.poisson(g * np.where(rush | (position == "ILB"), 1.5, 0.4)),
+        "hrry": rng.poisson(pressures * 0.4),
+        "qbkd": rng.poisson(pressures * 0.3),
+        "sk": sacks,
+        "prss": pressures,
+        "comb": tackles,
+        "m_tkl": rng.poisson(tackles * 0.12),
+        "m_tkl_percent": rng.uniform(0.03, 0.2, n).round(3),
+        "season": d["season"].to_numpy(),
+        "pfr_id": p["pfr_id"].to_numpy(),
+    })
+
+
+def _pfr_offense(kind: str, weekly: pd.DataFrame, players: pd.DataFrame) -> pd.DataFrame:
+    """Seasonal PFR pass/rush/rec advanced tables derived from weekly totals."""
+    cols = {
+        "pass": ["attempts", "completions", "passing_yards", "sacks"],
+        "rush": ["carries", "rushing_yards", "rushing_first_downs"],
+        "rec": ["targets", "receptions", "receiving_yards", "receiving_first_downs"],
+    }[kind]
+    w = weekly[weekly["season"].isin(data_loader.PFR_YEARS) & (weekly["season_type"] == "REG")]
+    agg = w.groupby(["player_id", "season"], sort=False).agg(
+        player=("player_display_name", "first"),
+        team=("recent_team", "last"),
+        **{c: (c, "sum") for c in cols},
+    ).reset_index()
+    agg = agg[agg[cols[0]] > 0]
+    pfr = players.set_index("gsis_id")["pfr_id"]
+    agg["pfr_id"] = agg["player_id"].map(pfr).to_numpy()
+    return agg.drop(columns=["player_id"]).reset_index(drop=True)
+
+
+def _players_table(players, rng) -> pd.DataFrame:
+    """nfl_data_py import_players: one row per player with a pfr_id crosswalk.
+
+    A few players lack a pfr_id and a handful share one, as upstream.
+    """
+    n = len(players)
+    pfr_id = players["pfr_id"].to_numpy().copy()
+    pfr_id[rng.random(n) < 0.05] = None
+    dup = np.flatnonzero(rng.random(n) < 0.002)
+    pfr_id[dup] = pfr_id[rng.integers(0, n, len(dup))]
+    last = players["last_season"].to_numpy()
+    return pd.DataFrame({
+        "gsis_id": players["gsis_id"].to_numpy(),
+        "display_name": players["display_name"].to_numpy(),
+        "first_name": players["first_name"].to_numpy(),
+        "last_name": players["last_name"].to_numpy(),
+        "position": players["position"].to_numpy(),
+        "position_group": players["position_group"].to_numpy(),
+        "status": np.where(last >= data_loader.YEARS[-1], "ACT", "RET"),
+        "team_abbr": np.array(TEAMS)[players["base_team"].to_numpy()],
+        "height": players["height"].to_numpy(),
+        "weight": players["weight"].to_numpy(),
+        "rookie_season": players["rookie_year"].to_numpy(),
+        "draft_club": players["draft_club"].to_numpy(),
+        "draft_number": players["draft_number"].to_numpy(),
+        "draft_round": players["draft_round"].to_numpy(),
+        "entry_year": players["rookie_year"].to_numpy(),
+        "pfr_id": pfr_id,
+    })
+
+
+def _ids_table(players, rng) -> pd.DataFrame:
+    """nfl_data_py import_ids: multi-system id map for most players.
+
+    A small share disagree with the players table on pfr_id, so crosswalk
+    conflict handling has something to report.
+    """
+    keep = rng.random(len(players)) < 0.9
+    p = players[keep]
+    n = len(p)
+    pfr_id = p["pfr_id"].to_numpy().copy()
+    conflict = rng.random(n) < 0.005
+    pfr_id[conflict] = np.char.add(pfr_id[conflict].astype(str), "x")
+    base = p.index.to_numpy()
+    return pd.DataFrame({
+        "mfl_id": (base + 10000).astype(str),
+        "sportradar_id": [f"{i:08x}-0000-4000-8000-{i:012x}" for i in base],
+        "fantasypros_id": (base + 20000).astype(str),
+        "gsis_id": p["gsis_id"].to_numpy(),
+        "pff_id": (base + 30000).astype(str),
+        "sleeper_id": (base + 40000).astype(str),
+        "nfl_id": (base + 50000).astype(str),
+        "espn_id": (base + 2_000_000).astype(str),
+        "yahoo_id": (base + 25_000).astype(str),
+        "pfr_id": pfr_id,
+        "name": p["display_name"].to_numpy(),
+        "merge_name": p["display_name"].str.lower().to_numpy(),
+        "position": p["position"].to_numpy(),
+        "team": np.array(TEAMS)[p["base_team"].to_numpy()],
+        "birthdate": p["birth_date"].to_numpy(),
+        "age": data_loader.YEARS[-1] - p["birth_year"].to_numpy(),
+        "draft_year": np.where(p["draft_number"].notna(), p["rookie_year"], np.nan),
+        "draft_round": p["draft_round"].to_numpy(),
+        "draft_pick": p["draft_number"].to_numpy(),
+        "draft_ovr": p["draft_number"].to_numpy(),
+        "height": p["height"].to_numpy(),
+        "weight": p["weight"].to_numpy(),
+        "db_season": data_loader.YEARS[-1],
+    })
+
+
+def generate(scale: float = 1.0, seed: int = 0) -> dict:
+    """Generate every raw dataset, keyed like load_all, at `scale` x real size."""
+    rng = np.random.default_rng(seed)
+    players = _players(max(100, int(BASE_PLAYERS * scale)), rng)
+    ps = _player_seasons(players, rng)
+    weekly = _weekly_stats(players, ps, rng)
+    datasets = {
+        "weekly_stats": weekly,
+        "rosters": _rosters(players, ps, rng),
+        "contracts": _contracts(players, rng),
+        "snap_counts": _snap_counts(players, ps, rng),
+        "players": _players_table(players, rng),
+        "ids": _ids_table(players, rng),
+    }
+    for kind in ["pass", "rush", "rec"]:
+        datasets[f"pfr_{kind}"] = _pfr_offense(kind, weekly, players)
+    datasets["pfr_def"] = _pfr_def(players, ps, rng)
+    return datasets
+
+
+def write_to_cache(datasets: dict, data_dir) -> None:
+    """Write generated datasets into the data_loader cache layout under `data_dir`.
+
+    data_loader.DATA_DIR is left alone; point it at `data_dir` to run the
+    normal loaders (and the whole pipeline) on the synthetic data.
+    """
+    data_dir = Path(data_dir)
+    data_dir.mkdir(parents=True, exist_ok=True)
+    for name, df in datasets.items():
+        typed = data_loader._apply_schema(name, df)
+        if name in data_loader.SEASON_RANGES:
+            data_loader._write_partitions(name, typed, data_dir)
+        else:
+            data_loader._write_cache_file(name, typed, data_loader._cache_path(name, data_dir),
+                                          data_dir)
+        print(f"Wrote synthetic {name} ({len(df):,} rows) to {data_dir}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic NFL data into the cache.")
+    parser.add_argument("--scale", type=float, default=1.0, help="player pool multiplier")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--data-dir", required=True, help="cache directory to write")
+    args = parser.parse_args()
+    write_to_cache(generate(args.scale, args.seed), args.data_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,7 @@
 """Composite value score calculation by position group."""
 
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
 import pandas as pd
 import numpy as np
 from scipy import stats as scipy_stats
@@ -118,41 +120,259 @@ def compute_salary_zscore(df: pd.DataFrame) -> pd.Series:
     return _zscore_within_group(df["apy_cap_pct"].astype(float))
 
 
-def compute_value_scores(df: pd.DataFrame) -> pd.DataFrame:
-    """Compute value scores for all players. Operates within position groups."""
-    results = []
-
-    for pos_group in df["pos_group"].unique():
-        if pos_group not in POSITION_WEIGHTS:
-            continue
-
-        mask = df["pos_group"] == pos_group
-        group = df[mask].copy()
-
-        if len(group) < 5:
-            continue
-
-        # Performance composite
-        group["performance_zscore"] = compute_composite_score(group, pos_group)
-
-        # Salary z-score (within position)
-        group["salary_zscore"] = compute_salary_zscore(group)
-
-        # Value score = performance - salary
-        # Positive = outperforming salary (bargain)
-        # Negative = underperforming salary (overpaid)
-        group["value_score"] = group["performance_zscore"] - group["salary_zscore"]
+# Groups smaller than this are left out of the scored output
+MIN_GROUP_SIZE = 5
 
-        # Percentile rank within position group
-        group["value_percentile"] = group["value_score"].rank(pct=True) * 100
-
-        # Flag outliers (>2 std from 0)
-        group["is_bargain"] = group["value_score"] > 2.0
-        group["is_overpaid"] = group["value_score"] < -2.0
+# Stats derived by _prepare_inverted_stats, with the columns they need
+INVERTED_STATS = {
+    "int_rate_inv": ["int_rate"],
+    "fumbles_inv": ["rushing_fumbles", "receiving_fumbles"],
+}
 
-        results.append(group)
 
-    if not results:
+def _available_stats(columns) -> list:
+    """Every POSITION_WEIGHTS stat that `columns` has (or can derive), in first-use order."""
+    columns = set(columns)
+    stats = []
+    for weights in POSITION_WEIGHTS.values():
+        for stat in weights:
+            needs = INVERTED_STATS.get(stat, [stat])
+            if stat not in stats and any(c in columns for c in needs):
+                stats.append(stat)
+    return stats
+
+
+def _stat_matrix(df: pd.DataFrame, stats: list, rows: np.ndarray = None) -> np.ndarray:
+    """Stats of `rows` (default all) as a column-major float matrix.
+
+    Inverted stats are derived as in _prepare_inverted_stats.
+    """
+    rows = np.arange(len(df)) if rows is None else rows
+    matrix = np.empty((len(rows), len(stats)), order="F")
+    for j, stat in enumerate(stats):
+        if stat == "int_rate_inv":
+            values = -df["int_rate"].fillna(0)
+        elif stat == "fumbles_inv":
+            values = -sum(df[c].fillna(0) for c in INVERTED_STATS[stat] if c in df.columns)
+        else:
+            values = df[stat]
+        matrix[:, j] = values.to_numpy(dtype=np.float64, na_value=np.nan)[rows]
+    return matrix
+
+
+def weight_matrix(stats: list, positions: list = None) -> np.ndarray:
+    """Position x stat matrix of POSITION_WEIGHTS (0 where a position doesn't use a stat)."""
+    positions = list(POSITION_WEIGHTS) if positions is None else positions
+    weights = np.zeros((len(positions), len(stats)))
+    for i, pos_group in enumerate(positions):
+        for j, stat in enumerate(stats):
+            weights[i, j] = POSITION_WEIGHTS[pos_group].get(stat, 0.0)
+    return weights
+
+
+def _group_zscores(values: np.ndarray, starts: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """Z-score every column within contiguous row groups, as _zscore_within_group.
+
+    Counts, means and sample stds for all groups and columns come from one
+    segmented reduction each over the column-major block; NaN is ignored
+    and stays NaN. A group-column
+    with fewer than 3 values or no spread scores 0 throughout.
+    """
+    valid = ~np.isnan(values)
+    count = np.add.reduceat(valid.astype(np.int64, order="F"), starts, axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = np.add.reduceat(np.where(valid, values, 0.0), starts, axis=0) / count
+        centered = np.subtract(values, np.repeat(mean, lengths, axis=0), order="F")
+        spread = np.where(valid, centered, 0.0)
+        spread *= spread
+        std = np.sqrt(np.add.reduceat(spread, starts, axis=0) / (count - 1))
+        centered /= np.repeat(std, lengths, axis=0)
+    degenerate = (count < 3) | (std == 0)
+    for group, col in zip(*np.nonzero(degenerate)):
+        centered[starts[group]:starts[group] + lengths[group], col] = 0.0
+    return centered
+
+
+def _season_cells(values: np.ndarray, row_group: np.ndarray, seasons: np.ndarray) -> dict:
+    """Per (group, season) cell: count, sum, sum of squared deviations, min and max.
+
+    Cells are laid out densely as group x season (every season from the
+    first to the last, so a window spans calendar seasons even across a
+    gap); each row's cell is group * n_seasons + season offset, or -1
+    where the season is missing. The per-cell reductions are one segmented
+    pass each over the rows sorted by cell, two-pass for the squared
+    deviations as in _group_zscores.
+    """
+    known = ~np.isnan(seasons)
+    first = int(seasons[known].min()) if known.any() else 0
+    n_seasons = int(seasons[known].max()) - first + 1 if known.any() else 1
+    n_groups = int(row_group.max()) + 1 if len(row_group) else 0
+    offset = np.where(known, seasons - first, 0).astype(np.int64)
+    row_cell = np.where(known, row_group * n_seasons + offset, -1)
+
+    rows = np.flatnonzero(row_cell >= 0)
+    rows = rows[np.argsort(row_cell[rows], kind="stable")]
+    cell_ids, starts, lengths = np.unique(row_cell[rows], return_index=True, return_counts=True)
+    block = np.asarray(values[rows], order="F")
+    valid = ~np.isnan(block)
+
+    shape = (n_groups, n_seasons, values.shape[1])
+    stats = {k: np.zeros(shape) for k in ["count", "sum", "ssd"]}
+    stats.update({k: np.full(shape, np.nan) for k in ["min", "max"]})
+    if len(rows):
+        g, t = np.divmod(cell_ids, n_seasons)
+        count = np.add.reduceat(valid.astype(np.int64, order="F"), starts, axis=0)
+        total = np.add.reduceat(np.where(valid, block, 0.0), starts, axis=0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            centered = block - np.repeat(total / count, lengths, axis=0)
+        spread = np.where(valid, centered, 0.0)
+        spread *= spread
+        stats["count"][g, t] = count
+        stats["sum"][g, t] = total
+        stats["ssd"][g, t] = np.add.reduceat(spread, starts, axis=0)
+        stats["min"][g, t] = np.fmin.reduceat(block, starts, axis=0)
+        stats["max"][g, t] = np.fmax.reduceat(block, starts, axis=0)
+    stats["row_cell"] = row_cell
+    return stats
+
+
+def _window_zscores(values: np.ndarray, cells: dict, window: int) -> np.ndarray:
+    """Z-score each row against its group's rows from its own and the window - 1 prior seasons.
+
+    Window statistics combine the cells' counts, sums and squared
+    deviations (the pairwise update of Chan et al., so no one-pass
+    cancellation); with window=1 they are exactly the per-cell two-pass
+    mean and std. As in _group_zscores, a window with fewer than 3 values
+    or no spread scores 0. Rows without a season come out NaN.
+    """
+    if window < 1:
+        raise ValueError(f"season window must be >= 1, got {window}")
+    count, total = np.zeros_like(cells["count"]), np.zeros_like(cells["sum"])
+    low, high = np.full_like(cells["min"], np.nan), np.full_like(cells["max"], np.nan)
+    n_seasons = count.shape[1]
+    for lag in range(min(window, n_seasons)):
+        count[:, lag:] += cells["count"][:, :n_seasons - lag]
+        total[:, lag:] += cells["sum"][:, :n_seasons - lag]
+        low[:, lag:] = np.fmin(low[:, lag:], cells["min"][:, :n_seasons - lag])
+        high[:, lag:] = np.fmax(high[:, lag:], cells["max"][:, :n_seasons - lag])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = total / count
+        ssd = np.zeros_like(mean)
+        for lag in range(min(window, n_seasons)):
+            n = cells["count"][:, :n_seasons - lag]
+            shift = np.where(n > 0, cells["sum"][:, :n_seasons - lag] / n - mean[:, lag:], 0.0)
+            ssd[:, lag:] += cells["ssd"][:, :n_seasons - lag] + n * shift * shift
+        std = np.sqrt(ssd / (count - 1))
+    degenerate = (count < 3) | ~(std > 0) | (low == high)
+    mean = np.where(degenerate, 0.0, mean).reshape(-1, values.shape[1])
+    std = np.where(degenerate, np.inf, std).reshape(-1, values.shape[1])
+
+    # Row cell -1 (no season) picks the trailing NaN row
+    row_cell = cells["row_cell"]
+    mean = np.vstack([mean, np.full(values.shape[1], np.nan)])[row_cell]
+    std = np.vstack([std, np.ones(values.shape[1])])[row_cell]
+    z = (values - mean) / std
+    # Degenerate windows score 0 throughout, missing values included
+    return np.where(np.isinf(std), 0.0, z)
+
+
+def _grouped_scores(df: pd.DataFrame, season_window: int = None) -> dict:
+    """Per-row z-scores for every scored position group, rows ordered by group.
+
+    pos_group is sorted once (groups in order of first appearance, rows in
+    their original order within a group); groups without weights or with
+    fewer than MIN_GROUP_SIZE rows are left out. Returns the row order, the
+    groups and their starts/lengths, each row's group, the stat z-score
+    block, the weight matrix for those groups, the salary z-scores, and the
+    raw stat/salary block the z-scores came from.
+
+    With a season_window the z-scores are taken within (group, season)
+    windows instead (see _window_zscores), and the season cells are
+    returned as well so other windows can reuse them.
+    """
+    pos_group = df["pos_group"].to_numpy(dtype=object)
+    codes, uniques = pd.factorize(pos_group)
+    sizes = np.bincount(codes[codes >= 0], minlength=len(uniques))
+    keep = [i for i, g in enumerate(uniques) if g in POSITION_WEIGHTS and sizes[i] >= MIN_GROUP_SIZE]
+
+    rank = np.full(len(uniques) + 1, -1)
+    rank[keep] = np.arange(len(keep))
+    row_group = rank[codes]  # code -1 (missing) picks the trailing -1
+    order = np.flatnonzero(row_group >= 0)
+    order = order[np.argsort(row_group[order], kind="stable")]
+    lengths = sizes[keep]
+    starts = np.r_[0, np.cumsum(lengths)[:-1]].astype(np.int64)
+
+    groups = [uniques[i] for i in keep]
+    stats = _available_stats(df.columns)
+    values = _stat_matrix(df, stats + ["apy_cap_pct"], order)
+    cells = None
+    if season_window is None:
+        z = _group_zscores(values, starts, lengths) if len(order) else values
+    else:
+        seasons = df["season"].to_numpy(dtype=np.float64, na_value=np.nan)[order]
+        cells = _season_cells(values, row_group[order], seasons)
+        z = _window_zscores(values, cells, season_window)
+    return {
+        "order": order, "groups": groups, "starts": starts, "lengths": lengths,
+        "row_group": row_group[order], "stats": stats,
+        "z": z[:, :-1], "salary_z": z[:, -1], "weights": weight_matrix(stats, groups),
+        "values": values, "cells": cells,
+    }
+
+
+def _composite(z: np.ndarray, weights: np.ndarray, row_group: np.ndarray) -> np.ndarray:
+    """Weighted composite per row: each row's z block times its group's weight row.
+
+    Stats a position doesn't weight are zeroed first so their NaNs don't
+    leak in; the sum is normalized by the weight actually used (a position
+    with no usable stats scores 0).
+    """
+    row_weights = weights[row_group]
+    used = np.where(row_weights != 0, z, 0.0)
+    composite = np.einsum("ij,ij->i", used, row_weights)
+    total = weights.sum(axis=1)[row_group]
+    return np.divide(composite, total, out=composite, where=total > 0)
+
+
+def _value_columns(scores: dict, z: np.ndarray, salary_z: np.ndarray, rank_by: np.ndarray) -> dict:
+    """Score columns from a z-score block: composite, value, percentile within `rank_by`, flags."""
+    performance = _composite(z, scores["weights"], scores["row_group"])
+
+    # Value score = performance - salary
+    # Positive = outperforming salary (bargain)
+    # Negative = underperforming salary (overpaid)
+    value = performance - salary_z
+
+    # Percentile rank within position group (and season, when season-relative)
+    percentile = pd.Series(value).groupby(rank_by).rank(pct=True).to_numpy() * 100
+
+    # Flag outliers (>2 std from 0)
+    return {
+        "performance_zscore": performance,
+        "salary_zscore": salary_z,
+        "value_score": value,
+        "value_percentile": percentile,
+        "is_bargain": value > 2.0,
+        "is_overpaid": value < -2.0,
+    }
+
+
+def compute_value_scores(df: pd.DataFrame, season_window: int = None) -> pd.DataFrame:
+    """Compute value scores for all players. Operates within position groups.
+
+    Rows come out grouped by pos_group in order of first appearance; groups
+    without weights or with fewer than MIN_GROUP_SIZE players are dropped.
+
+    By default stats and salary are z-scored across all seasons pooled.
+    With season_window=1 they are z-scored within (pos_group, season), and
+    with season_window=k against the position's rows from that season and
+    the k - 1 before it, so league-wide trends (passing inflation, cap
+    growth) don't leak into the scores. Percentiles are then within
+    (pos_group, season). The scored rows are the same in every mode.
+    """
+    scores = _grouped_scores(df, season_window)
+    if not scores["groups"]:
         return df.assign(
             performance_zscore=np.nan,
             salary_zscore=np.nan,
@@ -162,9 +382,373 @@ def compute_value_scores(df: pd.DataFrame) -> pd.DataFrame:
             is_overpaid=False,
         )
 
+    rank_by = scores["row_group"] if season_window is None else scores["cells"]["row_cell"]
+    return df.iloc[scores["order"]].reset_index(drop=True).assign(
+        **_value_columns(scores, scores["z"], scores["salary_z"], rank_by)
+    )
+
+
+# Columns value_scores_by_window carries over to identify each row
+WINDOW_KEYS = ["player_id", "season", "pos_group"]
+
+
+def value_scores_by_window(df: pd.DataFrame, windows=(None, 1, 3, 5)) -> pd.DataFrame:
+    """compute_value_scores for several season windows at once, stacked long.
+
+    The stat matrix and the (pos_group, season) cell reductions are built
+    once; each window then only combines cell statistics and rescores.
+    Window None is the pooled default. Returns one row per scored row and
+    window: `window` (Int64, missing for pooled), the WINDOW_KEYS columns
+    present in df, and the score columns; rows follow compute_value_scores
+    order within each window.
+    """
+    scores = _grouped_scores(df, season_window=1)
+    keys = df.iloc[scores["order"]][[c for c in WINDOW_KEYS if c in df.columns]]
+    keys = keys.reset_index(drop=True)
+    frames = []
+    for window in windows:
+        if window is None:
+            z = _group_zscores(scores["values"], scores["starts"], scores["lengths"])
+            rank_by = scores["row_group"]
+        else:
+            z = _window_zscores(scores["values"], scores["cells"], window)
+            rank_by = scores["cells"]["row_cell"]
+        frames.append(keys.assign(**_value_columns(scores, z[:, :-1], z[:, -1], rank_by)))
+        frames[-1].insert(0, "window", pd.array([window] * len(keys), dtype="Int64"))
+    return pd.concat(frames, ignore_index=True)
+
+
+def weight_variants(pos_group: str, n: int, spread: float = 0.2, seed: int = 0) -> pd.DataFrame:
+    """n candidate weight vectors for a position, one row each, columns = its stats.
+
+    Row 0 is POSITION_WEIGHTS itself; every other row scales each weight
+    by a uniform factor in [1 - spread, 1 + spread] and renormalizes to
+    the published total.
+    """
+    base = pd.Series(POSITION_WEIGHTS[pos_group], dtype=float)
+    rng = np.random.default_rng(seed)
+    factors = rng.uniform(1 - spread, 1 + spread, size=(n, len(base)))
+    factors[0] = 1.0
+    weights = factors * base.to_numpy()
+    weights *= base.sum() / weights.sum(axis=1, keepdims=True)
+    return pd.DataFrame(weights, columns=base.index)
+
+
+def _row_ranks(values: np.ndarray) -> np.ndarray:
+    """Average ranks along each row, as scipy.stats.rankdata(values, axis=1).
+
+    Rows without ties take their ranks straight from an unstable argsort,
+    which is several times faster than rankdata's stable sort; rows with
+    ties fall back to rankdata.
+    """
+    order = np.argsort(values, axis=1)
+    ranks = np.empty(values.shape, dtype=np.float64)
+    np.put_along_axis(ranks, order, np.arange(1, values.shape[1] + 1, dtype=np.float64), axis=1)
+    ordered = np.take_along_axis(values, order, axis=1)
+    tied = (ordered[:, 1:] == ordered[:, :-1]).any(axis=1)
+    if tied.any():
+        ranks[tied] = scipy_stats.rankdata(values[tied], axis=1)
+    return ranks
+
+
+def _rank_correlation(ranks: np.ndarray, base_rank: np.ndarray) -> np.ndarray:
+    """Pearson correlation of each row of ranks with the baseline ranks (Spearman)."""
+    ranks = ranks - ranks.mean(axis=1, keepdims=True)
+    base = base_rank - base_rank.mean()
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return (ranks @ base) / (np.sqrt((ranks * ranks).sum(axis=1)) * np.sqrt(base @ base))
+
+
+def weight_sweep(
+    df: pd.DataFrame,
+    variants: dict,
+    top_n: int = 15,
+    chunk_size: int = 1000,
+) -> pd.DataFrame:
+    """Evaluate many candidate weightings per position against POSITION_WEIGHTS.
+
+    `variants` maps pos_group -> frame of weight vectors (one row per
+    variant, columns = stats, e.g. from weight_variants). A variant can
+    only reweight stats the position already uses; a stat it leaves out
+    gets weight 0, and stats missing from the data are skipped. Stat and
+    salary z-scores are computed once, and each chunk of `chunk_size`
+    variants is scored with one matrix product. Players unscored at baseline (a missing stat) stay unscored.
+
+    Returns one row per variant with the Spearman correlation of its value
+    ranks with the baseline, the share of the baseline top `top_n` it keeps,
+    and how many players it flags as bargain/overpaid and how many of those
+    flags differ from the baseline (churn).
+    """
+    scores = _grouped_scores(df)
+    baseline = (_composite(scores["z"], scores["weights"], scores["row_group"])
+                - scores["salary_z"])
+    results = []
+    for pos_group, candidates in variants.items():
+        if pos_group not in scores["groups"]:
+            raise ValueError(f"No scored {pos_group!r} players to sweep")
+        g = scores["groups"].index(pos_group)
+        unknown = [c for c in candidates.columns if c not in POSITION_WEIGHTS[pos_group]]
+        if unknown:
+            raise ValueError(f"{pos_group} variants weight stats it does not use: {unknown}")
+        # Stats missing from the data are skipped, as in compute_value_scores
+        used = [stat for stat, w in zip(scores["stats"], scores["weights"][g]) if w != 0]
+        candidates = candidates[[c for c in candidates.columns if c in used]]
+
+        rows = slice(scores["starts"][g], scores["starts"][g] + scores["lengths"][g])
+        base = baseline[rows]
+        scored = ~np.isnan(base)
+        base = base[scored]
+        cols = [scores["stats"].index(c) for c in candidates.columns]
+        z = scores["z"][rows][scored][:, cols]
+        salary = scores["salary_z"][rows][scored]
+
+        n = min(top_n, len(base))
+        base_rank = scipy_stats.rankdata(base)
+        base_top = np.argsort(-base, kind="stable")[:n]
+        base_bargain, base_overpaid = base > 2.0, base < -2.0
+
+        weights = candidates.to_numpy(dtype=np.float64)
+        for start in range(0, len(weights), chunk_size):
+            # variants x players, so per-variant sorts run along contiguous rows
+            chunk = weights[start:start + chunk_size]
+            total = chunk.sum(axis=1, keepdims=True)
+            values = chunk @ z.T
+            np.divide(values, total, out=values, where=total > 0)
+            values -= salary
+
+            top = np.argpartition(-values, n - 1, axis=1)[:, :n] if n else \
+                np.empty((len(chunk), 0), dtype=np.int64)
+            bargain, overpaid = values > 2.0, values < -2.0
+            results.append(pd.DataFrame({
+                "pos_group": pos_group,
+                "variant": candidates.index[start:start + len(chunk)],
+                "spearman": _rank_correlation(_row_ranks(values), base_rank),
+                "top_n_overlap": np.isin(top, base_top).sum(axis=1) / max(n, 1),
+                "bargains": bargain.sum(axis=1),
+                "bargain_churn": (bargain != base_bargain).sum(axis=1),
+                "overpaid": overpaid.sum(axis=1),
+                "overpaid_churn": (overpaid != base_overpaid).sum(axis=1),
+            }))
     return pd.concat(results, ignore_index=True)
 
 
+# Columns bootstrap_value_scores summarizes by (within each pos_group), when present
+BOOTSTRAP_AGGREGATES = ["draft_round", "contract_type", "recent_team"]
+
+
+def _bootstrap_groups(df: pd.DataFrame, scores: dict, value: np.ndarray, by: list) -> list:
+    """Per scored group, everything a replicate needs, as plain arrays.
+
+    `features` holds the group's weighted stats plus apy_cap_pct, centered
+    on the group mean (so the one-pass variance in _replicate_values
+    doesn't cancel) with NaN as 0; `valid` marks the non-missing values.
+    `coef` is each feature's share of the value score: weight / total
+    weight for stats and -1 for salary. `scored` are the group rows with a
+    value score, and `codes` each scored row's code per aggregate column.
+    """
+    groups = []
+    for g, pos_group in enumerate(scores["groups"]):
+        start, length = scores["starts"][g], scores["lengths"][g]
+        used = np.flatnonzero(scores["weights"][g])
+        raw = scores["values"][start:start + length][:, np.r_[used, -1]]
+        valid = ~np.isnan(raw)
+        with np.errstate(invalid="ignore"):
+            center = np.nan_to_num(np.nanmean(np.where(valid, raw, np.nan), axis=0))
+        total = scores["weights"][g].sum()
+        coef = np.r_[scores["weights"][g][used] / total if total > 0 else np.zeros(len(used)), -1.0]
+
+        scored = np.flatnonzero(~np.isnan(value[start:start + length]))
+        rows = scores["order"][start:start + length][scored]
+        codes, labels = {}, {}
+        for col in by:
+            codes[col], labels[col] = pd.factorize(df[col].iloc[rows], sort=True)
+        groups.append({
+            "pos_group": pos_group, "features": np.where(valid, raw - center, 0.0),
+            "valid": valid.astype(np.float64), "coef": coef, "scored": scored,
+            "codes": codes, "labels": labels,
+        })
+    return groups
+
+
+def _replicate_values(group: dict, counts: np.ndarray) -> np.ndarray:
+    """Value scores of the group's scored rows under each resample (replicates x rows).
+
+    `counts` (replicates x group rows) is how often each row was drawn.
+    Means and sample stds of every feature over the resample are count-
+    weighted matrix products; the original rows are then z-scored against
+    them as _zscore_within_group would (a feature drawn fewer than 3 times
+    or without spread scores 0). A stat missing on a scored row (possible
+    only where the stat had no spread) counts as the resample mean.
+    """
+    features, valid = group["features"], group["valid"]
+    n = counts @ valid
+    s1 = counts @ features
+    s2 = counts @ (features * features)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = s1 / n
+        var = (s2 - s1 * mean) / (n - 1)
+        # A constant resample leaves only rounding in var
+        degenerate = (n < 3) | ~(var > 1e-12 * s2 / n)
+        scale = np.where(degenerate, 0.0, group["coef"] / np.sqrt(var))
+    mean = np.where(degenerate, 0.0, mean)
+    rows = group["scored"]
+    return scale @ features[rows].T - (scale * mean) @ valid[rows].T
+
+
+def _bootstrap_chunk(groups: list, seeds: list) -> list:
+    """Replicates for one chunk of seeds (one resample of every group per seed).
+
+    Returns, per group, the replicate value scores and percentiles of the
+    scored rows (float32), bargain/overpaid flag counts, and each
+    aggregate's replicate mean (NaN when the resample drew none of its
+    players).
+    """
+    rngs = [np.random.default_rng(s) for s in seeds]
+    out = []
+    for group in groups:
+        size = len(group["features"])
+        counts = np.empty((len(rngs), size))
+        for i, rng in enumerate(rngs):
+            counts[i] = np.bincount(rng.integers(0, size, size), minlength=size)
+        values = _replicate_values(group, counts)
+        weights = counts[:, group["scored"]]
+        aggregates = {}
+        for col, codes in group["codes"].items():
+            members = np.zeros((len(codes), len(group["labels"][col])))
+            members[np.flatnonzero(codes >= 0), codes[codes >= 0]] = 1.0
+            drawn = weights @ members
+            with np.errstate(divide="ignore", invalid="ignore"):
+                aggregates[col] = ((weights * values) @ members) / drawn
+        out.append({
+            "value": values.astype(np.float32),
+            "percentile": (_row_ranks(values) * (100 / values.shape[1])).astype(np.float32),
+            "bargains": (values > 2.0).sum(axis=0),
+            "overpaid": (values < -2.0).sum(axis=0),
+            "aggregates": aggregates,
+        })
+    return out
+
+
+# Group arrays for pool workers, set once per process by _init_bootstrap_worker
+_worker_groups = None
+
+
+def _init_bootstrap_worker(groups: list) -> None:
+    global _worker_groups
+    _worker_groups = groups
+
+
+def _bootstrap_worker_chunk(seeds: list) -> list:
+    return _bootstrap_chunk(_worker_groups, seeds)
+
+
+def bootstrap_value_scores(
+    df: pd.DataFrame,
+    n_boot: int = 1000,
+    level: float = 0.95,
+    by: list = None,
+    seed: int = 0,
+    chunk_size: int = 100,
+    max_workers: int = 1,
+) -> tuple:
+    """Bootstrap confidence intervals for compute_value_scores.
+
+    Each replicate resamples player-seasons with replacement within every
+    position group, recomputes the group means and stds of each weighted
+    stat and of salary from the resample, and rescores the original
+    players against them. Replicates run in chunks of `chunk_size`, across
+    `max_workers` processes when > 1. Every replicate draws from its own
+    child of SeedSequence(seed), so results depend only on the data,
+    `n_boot` and `seed`: not on worker count, and on chunk_size only
+    through float rounding in the matrix products.
+
+    Returns (players, aggregates):
+    - players: compute_value_scores(df) plus value_score_lo/_hi,
+      value_percentile_lo/_hi and the share of replicates flagging each
+      player a bargain or overpaid (bargain_prob, overpaid_prob).
+    - aggregates: per pos_group and value of each `by` column (default:
+      those of BOOTSTRAP_AGGREGATES in df), the number of players, their
+      mean value_score and its interval; the interval resamples which
+      players are in the group as well as how they are scored.
+
+    Working memory per chunk is bounded by chunk_size x group size; the
+    replicate scores and percentiles kept for the intervals take 8 bytes
+    per scored player per replicate.
+    """
+    if by is None:
+        by = [c for c in BOOTSTRAP_AGGREGATES if c in df.columns]
+    missing = [c for c in by if c not in df.columns]
+    if missing:
+        raise ValueError(f"Aggregate columns not in df: {missing}")
+
+    scores = _grouped_scores(df)
+    if not scores["groups"]:
+        raise ValueError("No scored position groups to bootstrap")
+    players = compute_value_scores(df)
+    value = players["value_score"].to_numpy()
+    groups = _bootstrap_groups(df, scores, value, by)
+
+    seeds = np.random.SeedSequence(seed).spawn(n_boot)
+    chunks = [(start, seeds[start:start + chunk_size]) for start in range(0, n_boot, chunk_size)]
+    replicates = [{
+        "value": np.empty((n_boot, len(g["scored"])), dtype=np.float32),
+        "percentile": np.empty((n_boot, len(g["scored"])), dtype=np.float32),
+        "bargains": 0, "overpaid": 0,
+        "aggregates": {col: np.empty((n_boot, len(g["labels"][col]))) for col in by},
+    } for g in groups]
+
+    def collect(start, result):
+        for reps, part in zip(replicates, result):
+            stop = start + len(part["value"])
+            reps["value"][start:stop] = part["value"]
+            reps["percentile"][start:stop] = part["percentile"]
+            reps["bargains"] = reps["bargains"] + part["bargains"]
+            reps["overpaid"] = reps["overpaid"] + part["overpaid"]
+            for col, means in part["aggregates"].items():
+                reps["aggregates"][col][start:stop] = means
+
+    if max_workers > 1:
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_bootstrap_worker,
+                                 initargs=(groups,)) as pool:
+            futures = {pool.submit(_bootstrap_worker_chunk, chunk): start for start, chunk in chunks}
+            for future in as_completed(futures):
+                collect(futures[future], future.result())
+    else:
+        for start, chunk in chunks:
+            collect(start, _bootstrap_chunk(groups, chunk))
+
+    q = [(1 - level) / 2, (1 + level) / 2]
+    intervals = {c: np.full(len(players), np.nan) for c in [
+        "value_score_lo", "value_score_hi", "value_percentile_lo", "value_percentile_hi",
+        "bargain_prob", "overpaid_prob"]}
+    summaries = []
+    for g, (group, reps) in enumerate(zip(groups, replicates)):
+        rows = scores["starts"][g] + group["scored"]
+        lo, hi = np.quantile(reps["value"], q, axis=0)
+        intervals["value_score_lo"][rows], intervals["value_score_hi"][rows] = lo, hi
+        lo, hi = np.quantile(reps["percentile"], q, axis=0)
+        intervals["value_percentile_lo"][rows], intervals["value_percentile_hi"][rows] = lo, hi
+        intervals["bargain_prob"][rows] = reps["bargains"] / n_boot
+        intervals["overpaid_prob"][rows] = reps["overpaid"] / n_boot
+
+        for col in by:
+            codes, labels = group["codes"][col], group["labels"][col]
+            member = codes >= 0
+            lo, hi = np.nanquantile(reps["aggregates"][col], q, axis=0)
+            summaries.append(pd.DataFrame({
+                "aggregate": col, "pos_group": group["pos_group"], "group": labels.astype(object),
+                "players": np.bincount(codes[member], minlength=len(labels)),
+                "value_score": (np.bincount(codes[member], value[rows][member], len(labels))
+                                / np.bincount(codes[member], minlength=len(labels))),
+                "value_score_lo": lo, "value_score_hi": hi,
+            }))
+
+    aggregates = (pd.concat(summaries, ignore_index=True) if summaries else pd.DataFrame(
+        columns=["aggregate", "pos_group", "group", "players", "value_score",
+                 "value_score_lo", "value_score_hi"]))
+    return players.assign(**{c: v.astype(np.float64) for c, v in intervals.items()}), aggregates
+
+
 def top_bargains(df: pd.DataFrame, pos_group: str = None, n: int = 15) -> pd.DataFrame:
     """Get top N bargain players (highest value score)."""
     subset = df.copy()